@@ -0,0 +1,23 @@
+"""
+Shared input builders for the Anny Body Fitter benchmarks
+"""
+
+from typing import Dict, Tuple
+
+import torch
+
+
+def neutral_shape_inputs(
+    model, batch_size: int = 1, device: torch.device = None
+) -> Tuple[torch.Tensor, Dict[str, torch.Tensor]]:
+    """Build neutral phenotype/local-change inputs once on device
+
+    Phenotypes are a single [batch_size, n_labels] tensor, which the model
+    accepts directly; local changes are views into one zeros buffer.
+    """
+    phenotypes = torch.full((batch_size, len(model.phenotype_labels)), 0.5, device=device)
+    local_changes = torch.zeros((batch_size, len(model.local_change_labels)), device=device)
+    local_changes_kwargs = {
+        k: local_changes[:, i] for i, k in enumerate(model.local_change_labels)
+    }
+    return phenotypes, local_changes_kwargs
@@ -4,53 +4,121 @@ Bottleneck Analyzer for Anny Body Fitter
 Identifies and analyzes performance bottlenecks in the processing pipeline
 """
 
+import argparse
 import torch
 import time
-import cProfile
-import pstats
-import io
 from pathlib import Path
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 from contextlib import contextmanager
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from benchmark_inputs import neutral_shape_inputs
+
+
+def _normal_equation_step(A: torch.Tensor, b: torch.Tensor, reg: torch.Tensor) -> torch.Tensor:
+    """Regularized least-squares update of one regressor iteration"""
+    # Single pass over A producing [A^T A | A^T b]
+    M = torch.einsum('bji,bjk->bik', A, torch.cat([A, b[:, :, None]], dim=-1))
+    L = torch.linalg.cholesky_ex(M[..., :-1] + reg).L
+    return torch.cholesky_solve(M[..., -1:], L)[:, :, 0]
+
+
+# Compiled lazily on first call
+_normal_equation_step_compiled = torch.compile(_normal_equation_step, mode="reduce-overhead")
+
 
 class BottleneckAnalyzer:
     """Analyze and identify performance bottlenecks"""
 
     def __init__(self):
-        self.timings: Dict[str, List[float]] = {}
+        # Entries are ms floats, or (start, end) CUDA event pairs until resolved
+        self.timings: Dict[str, List[Union[float, Tuple[torch.cuda.Event, torch.cuda.Event]]]] = {}
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     @contextmanager
     def timer(self, operation_name: str):
-        """Context manager for timing operations"""
-        start = time.perf_counter()
+        """Context manager for timing operations
+
+        On CUDA, records a pair of events on the current stream instead of
+        synchronizing the device; elapsed times are read in _resolve_timings.
+        """
+        if torch.cuda.is_available():
+            start = torch.cuda.Event(enable_timing=True)
+            end = torch.cuda.Event(enable_timing=True)
+            start.record()
+            try:
+                yield
+            finally:
+                end.record()
+                self.timings.setdefault(operation_name, []).append((start, end))
+        else:
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000  # ms
+                self.timings.setdefault(operation_name, []).append(elapsed)
+
+    def _resolve_timings(self):
+        """Convert pending CUDA event pairs into elapsed milliseconds"""
+        for times in self.timings.values():
+            for i, t in enumerate(times):
+                if isinstance(t, tuple):
+                    start, end = t
+                    end.synchronize()
+                    times[i] = start.elapsed_time(end)
+
+    def profile_function(self, func, *args, n_steps: int = 1, **kwargs):
+        """Profile a function with torch.profiler
+
+        Unlike cProfile, this reports per-operator (and per-kernel on CUDA)
+        times rather than Python frames, without adding interpreter overhead
+        to every torch call.
+        """
+        activities = [torch.profiler.ProfilerActivity.CPU]
+        sort_by = "cpu_time_total"
+        if torch.cuda.is_available():
+            activities.append(torch.profiler.ProfilerActivity.CUDA)
+            sort_by = "cuda_time_total"
+
+        with torch.profiler.profile(activities=activities, record_shapes=True) as prof:
+            for _ in range(n_steps):
+                result = func(*args, **kwargs)
+                prof.step()
+
+        return result, prof.key_averages().table(sort_by=sort_by, row_limit=20)  # Top 20 ops
+
+    def graph_replay_time(self, func, replays: int = 10):
+        """Capture func in a CUDA graph and return the mean replay time in ms
+
+        Returns None if the function cannot be captured (e.g. it synchronizes
+        with the host), in which case callers should fall back to eager timing.
+        """
+        # Warm up on a side stream, as required before graph capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            func()
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
         try:
-            yield
-        finally:
-            if torch.cuda.is_available():
-                torch.cuda.synchronize()
-            elapsed = (time.perf_counter() - start) * 1000  # ms
-            if operation_name not in self.timings:
-                self.timings[operation_name] = []
-            self.timings[operation_name].append(elapsed)
-
-    def profile_function(self, func, *args, **kwargs):
-        """Profile a function with cProfile"""
-        profiler = cProfile.Profile()
-        profiler.enable()
-        result = func(*args, **kwargs)
-        profiler.disable()
-
-        # Get stats
-        s = io.StringIO()
-        ps = pstats.Stats(profiler, stream=s).sort_stats('cumulative')
-        ps.print_stats(20)  # Top 20 functions
-
-        return result, s.getvalue()
+            with torch.cuda.graph(graph):
+                func()
+        except RuntimeError as e:
+            print(f"CUDA graph capture failed, skipping replay timing: {e}")
+            return None
+
+        start = torch.cuda.Event(enable_timing=True)
+        end = torch.cuda.Event(enable_timing=True)
+        start.record()
+        for _ in range(replays):
+            graph.replay()
+        end.record()
+        end.synchronize()
+        return start.elapsed_time(end) / replays
 
     def analyze_parameter_regressor(self):
         """Detailed analysis of ParametersRegressor bottlenecks"""
@@ -74,11 +142,12 @@ class BottleneckAnalyzer:
 
         # Create target
         print("Creating target mesh...")
+        phenotypes, local_changes_neutral = neutral_shape_inputs(model, device=self.device)
         with torch.no_grad():
             output_target = model(
                 pose_parameters=None,
-                phenotype_kwargs={k: 0.5 for k in model.phenotype_labels},
-                local_changes_kwargs={k: 0.0 for k in model.local_change_labels}
+                phenotype_kwargs=phenotypes,
+                local_changes_kwargs=local_changes_neutral
             )
         vertices_target = output_target['vertices']
 
@@ -96,6 +165,29 @@ class BottleneckAnalyzer:
 
         # Time each major component
         batch_size = vertices_target.shape[0]
+        reg = torch.diag(regressor.reg_weights).to(self.device)[None]
+
+        # Warmup: one untimed pass through every component, so the timed blocks
+        # below exclude cuBLAS/cuSOLVER handle creation, lazy kernel loading
+        # and workspace allocation
+        print("Warming up...")
+        pose_params, phenotype_kwargs, local_changes_kwargs = \
+            regressor._init_pose_macro_local(batch_size, {})
+        output = model(
+            pose_parameters=pose_params,
+            phenotype_kwargs=phenotype_kwargs,
+            local_changes_kwargs=local_changes_kwargs,
+            pose_parameterization='root_relative_world'
+        )
+        J = regressor._compute_macro_jacobian(
+            pose_params, local_changes_kwargs, regressor.idx, phenotype_kwargs
+        )
+        _, v_hat = regressor._jointwise_registration_to_pose(
+            output['vertices'][:, regressor.unique_ids], vertices_target, output['bone_poses'],
+            phenotype_kwargs, local_changes_kwargs
+        )
+        b = (vertices_target[:, regressor.idx] - v_hat[:, regressor.idx]).reshape(batch_size, -1)
+        _normal_equation_step(J, b, reg)
 
         # 1. Initialization
         with self.timer("Initialization"):
@@ -133,15 +225,17 @@ class BottleneckAnalyzer:
 
         # 5. Linear solve
         print("\nTiming linear solve...")
-        A = J[..., [model.phenotype_labels.index(k) for k in model.phenotype_labels]]
+        # Jacobian columns already follow model.phenotype_labels order, so no gather is needed
+        A = J
         b = (vertices_target[:, regressor.idx] - v_hat[:, regressor.idx]).reshape(batch_size, -1)
-        reg = torch.diag(regressor.reg_weights).to(self.device)[None]
 
         with self.timer("Linear Solve"):
-            delta = torch.linalg.solve(
-                A.transpose(2, 1) @ A + reg,
-                (A.transpose(2, 1) @ b[:, :, None])[:, :, 0]
-            )
+            # Cholesky on the SPD normal equations (cholesky_ex skips the info sync)
+            # baddbmm fuses the "+ reg" into the GEMM; A.mT is a view, not a copy
+            AtA = torch.baddbmm(reg.expand(batch_size, -1, -1), A.mT, A)
+            Atb = torch.bmm(A.mT, b.unsqueeze(-1))
+            L = torch.linalg.cholesky_ex(AtA).L
+            delta = torch.cholesky_solve(Atb, L)[:, :, 0]
 
         # 6. Full iteration
         print("\nTiming full iteration...")
@@ -153,12 +247,24 @@ class BottleneckAnalyzer:
             J = regressor._compute_macro_jacobian(
                 pose_new, local_changes_kwargs, regressor.idx, phenotype_kwargs
             )
-            A = J[..., [model.phenotype_labels.index(k) for k in model.phenotype_labels]]
+            A = J
             b = (vertices_target[:, regressor.idx] - v_hat[:, regressor.idx]).reshape(batch_size, -1)
-            delta = torch.linalg.solve(
-                A.transpose(2, 1) @ A + reg,
-                (A.transpose(2, 1) @ b[:, :, None])[:, :, 0]
-            )
+            delta = _normal_equation_step(A, b, reg)
+
+        # 7. Compiled vs eager solve step
+        print("\nComparing torch.compile'd solve step against eager...")
+        n_runs = 5
+        for name, step in [("Solve Step (eager)", _normal_equation_step),
+                           ("Solve Step (compiled)", _normal_equation_step_compiled)]:
+            step(A, b, reg)  # warmup (triggers compilation for the compiled variant)
+            for _ in range(n_runs):
+                with self.timer(name):
+                    delta = step(A, b, reg)
+        self._resolve_timings()
+        eager_ms = sum(self.timings["Solve Step (eager)"]) / n_runs
+        compiled_ms = sum(self.timings["Solve Step (compiled)"]) / n_runs
+        print(f"Eager: {eager_ms:.3f} ms | Compiled: {compiled_ms:.3f} ms | "
+              f"Speedup: {eager_ms / compiled_ms:.2f}x")
 
         # Print timing breakdown
         self.print_timing_breakdown()
@@ -187,16 +293,15 @@ class BottleneckAnalyzer:
         model = anny.create_fullbody_model()
         model = model.to(self.device)
 
-        # Create inputs
-        bones_rotvec = torch.randn((len(model.bone_labels), 3)) * 0.3
+        # Create inputs directly on device (no host-side build + H2D copy)
+        bones_rotvec = torch.randn((len(model.bone_labels), 3), device=self.device) * 0.3
         bones_rotmat = roma.rotvec_to_rotmat(bones_rotvec)
         pose_parameters = roma.Rigid(
             bones_rotmat,
-            torch.zeros((len(bones_rotmat), 3))
-        )[None].to_homogeneous().to(self.device)
+            torch.zeros((len(bones_rotmat), 3), device=self.device)
+        )[None].to_homogeneous()
 
-        phenotype_kwargs = {k: 0.5 for k in model.phenotype_labels}
-        local_changes_kwargs = {k: 0.0 for k in model.local_change_labels}
+        phenotype_kwargs, local_changes_kwargs = neutral_shape_inputs(model, device=self.device)
 
         def forward_pass():
             with torch.no_grad():
@@ -207,7 +312,7 @@ class BottleneckAnalyzer:
                 )
 
         # Profile
-        _, profile_output = self.profile_function(forward_pass)
+        _, profile_output = self.profile_function(forward_pass, n_steps=5)
         print(profile_output)
 
     def print_timing_breakdown(self):
@@ -216,6 +321,8 @@ class BottleneckAnalyzer:
         print("TIMING BREAKDOWN")
         print("="*80)
 
+        self._resolve_timings()
+
         total_time = sum(sum(times) for times in self.timings.values())
 
         # Sort by total time
@@ -237,8 +344,12 @@ class BottleneckAnalyzer:
         print("-"*80)
         print(f"{'TOTAL':<40} {total_time:>10.2f}")
 
-    def analyze_memory_usage(self):
-        """Analyze memory usage patterns"""
+    def analyze_memory_usage(self, output_dir: Union[str, Path] = "results"):
+        """Analyze memory usage patterns
+
+        On CUDA, the allocator history of the batch-size sweep is written to
+        output_dir/memory_snapshot.pickle.
+        """
         import anny
         import roma
 
@@ -272,11 +383,12 @@ class BottleneckAnalyzer:
             torch.zeros((len(bones_rotmat), 3))
         )[None].to_homogeneous().to(self.device)
 
+        phenotype_kwargs, local_changes_kwargs = neutral_shape_inputs(model, device=self.device)
         with torch.no_grad():
             output = model(
                 pose_parameters=pose_parameters,
-                phenotype_kwargs={k: 0.5 for k in model.phenotype_labels},
-                local_changes_kwargs={k: 0.0 for k in model.local_change_labels}
+                phenotype_kwargs=phenotype_kwargs,
+                local_changes_kwargs=local_changes_kwargs
             )
 
         forward_mem = torch.cuda.memory_allocated() / 1024 / 1024
@@ -286,40 +398,69 @@ class BottleneckAnalyzer:
         peak_mem = torch.cuda.max_memory_allocated() / 1024 / 1024
         print(f"\nPeak GPU memory: {peak_mem:.2f} MB")
 
-        # Batch processing
+        # Batch processing (increasing order so the caching allocator grows its
+        # pool once and later sizes reuse cached blocks instead of cudaMalloc)
         batch_sizes = [1, 2, 4, 8]
         print("\n" + "-"*80)
         print("Memory usage by batch size:")
         print("-"*80)
 
-        for bs in batch_sizes:
-            torch.cuda.empty_cache()
+        # Record allocator history for segment-level attribution of the sweep
+        torch.cuda.memory._record_memory_history()
+
+        for bs in sorted(batch_sizes):
             torch.cuda.reset_peak_memory_stats()
 
-            pose_params_batch = pose_parameters.repeat(bs, 1, 1, 1)
-            phenotype_batch = {k: torch.full((bs,), 0.5) for k in model.phenotype_labels}
-            local_batch = {k: torch.zeros(bs) for k in model.local_change_labels}
+            # Build inputs directly on device so the sweep measures the forward
+            # pass rather than host-side construction and H2D copies
+            # Broadcast view, no copy: the forward pass only reads pose parameters
+            # (root_relative_world clones before writing the root transform)
+            pose_params_batch = pose_parameters.expand(bs, -1, -1, -1)
+            phenotype_batch, local_batch = neutral_shape_inputs(model, bs, device=self.device)
 
-            with torch.no_grad():
-                output = model(
-                    pose_parameters=pose_params_batch,
-                    phenotype_kwargs=phenotype_batch,
-                    local_changes_kwargs=local_batch
-                )
+            def forward_batch():
+                with torch.no_grad():
+                    return model(
+                        pose_parameters=pose_params_batch,
+                        phenotype_kwargs=phenotype_batch,
+                        local_changes_kwargs=local_batch
+                    )
+
+            output = forward_batch()
 
             batch_mem = torch.cuda.max_memory_allocated() / 1024 / 1024
             per_sample = batch_mem / bs
             print(f"Batch size {bs}: {batch_mem:.2f} MB total, {per_sample:.2f} MB per sample")
 
+            replay_ms = self.graph_replay_time(forward_batch)
+            if replay_ms is not None:
+                print(f"Batch size {bs}: {replay_ms:.2f} ms per forward (CUDA graph replay)")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_path = output_dir / "memory_snapshot.pickle"
+        torch.cuda.memory._dump_snapshot(str(snapshot_path))
+        torch.cuda.memory._record_memory_history(enabled=None)
+        print(f"\nAllocator snapshot saved to: {snapshot_path}")
+        print("Open it with https://pytorch.org/memory_viz")
+
 
 def main():
     """Run all bottleneck analyses"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output-dir",
+        default="results",
+        help="Directory for analysis artifacts such as the allocator snapshot"
+    )
+    args = parser.parse_args()
+
     analyzer = BottleneckAnalyzer()
 
     # Run analyses
     analyzer.analyze_forward_pass()
     analyzer.analyze_parameter_regressor()
-    analyzer.analyze_memory_usage()
+    analyzer.analyze_memory_usage(args.output_dir)
 
     print("\n" + "="*80)
     print("ANALYSIS COMPLETE")
@@ -8,15 +8,18 @@ import time
 import torch
 import psutil
 import json
+import math
+import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass, asdict
-import numpy as np
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from benchmark_inputs import neutral_shape_inputs
+
 
 @dataclass
 class BenchmarkResult:
@@ -31,6 +34,31 @@ class BenchmarkResult:
     min_duration_ms: float
     max_duration_ms: float
     std_duration_ms: float
+    peak_gpu_memory_mb: float = 0.0
+
+
+class _RunningStats:
+    """Single-pass (Welford) accumulator for mean, min, max and std"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (matches np.std)"""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
 
 
 class PerformanceProfiler:
@@ -50,8 +78,8 @@ class PerformanceProfiler:
         return cpu_mem, gpu_mem
 
     def _get_cpu_percent(self) -> float:
-        """Get CPU usage percentage"""
-        return self.process.cpu_percent(interval=0.1)
+        """Get CPU usage percentage since the previous call (non-blocking)"""
+        return self.process.cpu_percent(interval=None)
 
     def benchmark_operation(
         self,
@@ -76,25 +104,30 @@ class PerformanceProfiler:
         print(f"Benchmarking: {operation_name}")
         print(f"{'='*60}")
 
+        # Clear GPU cache once up front; doing it per iteration forces a device
+        # sync and makes every timed run pay for fresh cudaMalloc calls
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
         # Warmup
         for _ in range(warmup_iterations):
             operation_func()
 
         if torch.cuda.is_available():
             torch.cuda.synchronize()
+            # Peak is read once after the loop, covering all timed iterations
+            torch.cuda.reset_peak_memory_stats()
+
+        # Prime the CPU counter so the first in-loop sample covers one iteration
+        self._get_cpu_percent()
 
         # Benchmark
-        durations = []
-        cpu_percents = []
-        mem_usages = []
-        gpu_mem_usages = []
+        durations = _RunningStats()
+        cpu_percents = _RunningStats()
+        mem_usages = _RunningStats()
+        gpu_mem_usages = _RunningStats()
 
         for i in range(iterations):
-            # Clear GPU cache
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-                torch.cuda.reset_peak_memory_stats()
-
             start_time = time.perf_counter()
             operation_func()
 
@@ -107,33 +140,39 @@ class PerformanceProfiler:
             cpu_mem, gpu_mem = self._get_memory_usage()
             cpu_pct = self._get_cpu_percent()
 
-            durations.append(duration)
-            mem_usages.append(cpu_mem)
-            gpu_mem_usages.append(gpu_mem)
-            cpu_percents.append(cpu_pct)
+            durations.update(duration)
+            mem_usages.update(cpu_mem)
+            gpu_mem_usages.update(gpu_mem)
+            cpu_percents.update(cpu_pct)
 
             print(f"Iteration {i+1}/{iterations}: {duration:.2f}ms | "
                   f"CPU: {cpu_pct:.1f}% | RAM: {cpu_mem:.1f}MB | "
                   f"GPU: {gpu_mem:.1f}MB")
 
+        peak_gpu_mem = 0.0
+        if torch.cuda.is_available():
+            peak_gpu_mem = torch.cuda.max_memory_allocated() / 1024 / 1024  # MB
+
         result = BenchmarkResult(
             operation=operation_name,
-            duration_ms=np.mean(durations),
-            memory_mb=np.mean(mem_usages),
-            gpu_memory_mb=np.mean(gpu_mem_usages),
-            cpu_percent=np.mean(cpu_percents),
+            duration_ms=durations.mean,
+            memory_mb=mem_usages.mean,
+            gpu_memory_mb=gpu_mem_usages.mean,
+            cpu_percent=cpu_percents.mean,
             iterations=iterations,
-            avg_duration_ms=np.mean(durations),
-            min_duration_ms=np.min(durations),
-            max_duration_ms=np.max(durations),
-            std_duration_ms=np.std(durations)
+            avg_duration_ms=durations.mean,
+            min_duration_ms=durations.min,
+            max_duration_ms=durations.max,
+            std_duration_ms=durations.std,
+            peak_gpu_memory_mb=peak_gpu_mem
         )
 
         print(f"\n{operation_name} Results:")
         print(f"  Avg: {result.avg_duration_ms:.2f}ms ± {result.std_duration_ms:.2f}ms")
         print(f"  Min: {result.min_duration_ms:.2f}ms")
         print(f"  Max: {result.max_duration_ms:.2f}ms")
-        print(f"  Memory: {result.memory_mb:.1f}MB CPU, {result.gpu_memory_mb:.1f}MB GPU")
+        print(f"  Memory: {result.memory_mb:.1f}MB CPU, {result.gpu_memory_mb:.1f}MB GPU "
+              f"(peak {result.peak_gpu_memory_mb:.1f}MB)")
 
         self.results.append(result)
         return result
@@ -202,31 +241,45 @@ def run_model_benchmarks():
     print("="*80)
 
     # 1. Model Loading
-    def load_fullbody_model():
-        return anny.create_fullbody_model(
-            rig="default",
-            eyes=True,
-            tongue=False,
-            local_changes=True
-        )
+    # Each iteration runs in a fresh interpreter so later iterations are not
+    # served from warm in-process caches (includes interpreter/import startup)
+    src_dir = str(Path(__file__).parent.parent / "src")
+    cold_load_script = (
+        f"import sys; sys.path.insert(0, {src_dir!r}); import anny; "
+        "anny.create_fullbody_model(rig='default', eyes=True, tongue=False, local_changes=True)"
+    )
+
+    def load_fullbody_model_cold():
+        subprocess.run([sys.executable, "-c", cold_load_script], check=True)
 
     profiler.benchmark_operation(
-        "Model Loading (Fullbody)",
-        load_fullbody_model,
-        iterations=5
+        "Model Loading (Fullbody, cold process)",
+        load_fullbody_model_cold,
+        iterations=5,
+        warmup_iterations=0
     )
 
-    # Load model for subsequent tests
-    model = load_fullbody_model()
+    # Load model once for subsequent tests
+    start_time = time.perf_counter()
+    model = anny.create_fullbody_model(
+        rig="default",
+        eyes=True,
+        tongue=False,
+        local_changes=True
+    )
     model = model.to(profiler.device)
+    print(f"\nIn-process model load: {(time.perf_counter() - start_time) * 1000:.2f}ms")
+
+    # Shape inputs are built once, outside the timed regions
+    phenotypes, local_changes_kwargs = neutral_shape_inputs(model, device=profiler.device)
 
     # 2. Forward Pass (Neutral Pose)
     def forward_pass_neutral():
         with torch.no_grad():
             output = model(
                 pose_parameters=None,
-                phenotype_kwargs={k: 0.5 for k in model.phenotype_labels},
-                local_changes_kwargs={k: 0.0 for k in model.local_change_labels}
+                phenotype_kwargs=phenotypes,
+                local_changes_kwargs=local_changes_kwargs
             )
         return output
 
@@ -250,8 +303,8 @@ def run_model_benchmarks():
         with torch.no_grad():
             output = model(
                 pose_parameters=pose_parameters,
-                phenotype_kwargs={k: 0.5 for k in model.phenotype_labels},
-                local_changes_kwargs={k: 0.0 for k in model.local_change_labels}
+                phenotype_kwargs=phenotypes,
+                local_changes_kwargs=local_changes_kwargs
             )
         return output
 
@@ -262,6 +315,10 @@ def run_model_benchmarks():
     )
 
     # 4. Batch Processing (Batch Size 4)
+    phenotypes_batch4, local_changes_batch4 = neutral_shape_inputs(
+        model, batch_size=4, device=profiler.device
+    )
+
     def forward_pass_batch4():
         batch_size = 4
         bones_rotvec = torch.randn((batch_size, len(model.bone_labels), 3)) * 0.3
@@ -274,8 +331,8 @@ def run_model_benchmarks():
         with torch.no_grad():
             output = model(
                 pose_parameters=pose_parameters,
-                phenotype_kwargs={k: torch.full((batch_size,), 0.5) for k in model.phenotype_labels},
-                local_changes_kwargs={k: torch.zeros(batch_size) for k in model.local_change_labels}
+                phenotype_kwargs=phenotypes_batch4,
+                local_changes_kwargs=local_changes_batch4
             )
         return output
 
@@ -285,49 +342,46 @@ def run_model_benchmarks():
         iterations=10
     )
 
-    # 5. Parameter Regression (Single Subject)
+    # 5. Parameter Regression (batch sweep)
     from anny.parameters_regressor import ParametersRegressor
 
     # Create target mesh
     output_target = forward_pass_neutral()
     vertices_target = output_target['vertices'].to(profiler.device)
 
-    def parameter_regression():
-        regressor = ParametersRegressor(
-            model,
-            max_n_iters=3,  # Reduced for benchmarking
-            n_points=2000,  # Reduced for benchmarking
-            verbose=False
-        )
-        pose_params, phenotype_kwargs, v_hat = regressor(
-            vertices_target,
-            optimize_phenotypes=True
-        )
-        return pose_params, phenotype_kwargs, v_hat
+    def make_parameter_regression(max_n_iters: int, n_points: int, batch: int = 1):
+        # ParametersRegressor is batched; stacking the target amortizes launch
+        # and Python overhead across subjects
+        vertices_batched = vertices_target.expand(batch, -1, -1).contiguous()
+
+        def parameter_regression():
+            regressor = ParametersRegressor(
+                model,
+                max_n_iters=max_n_iters,
+                n_points=n_points,
+                verbose=False
+            )
+            pose_params, phenotype_kwargs, v_hat = regressor(
+                vertices_batched,
+                optimize_phenotypes=True
+            )
+            return pose_params, phenotype_kwargs, v_hat
 
-    profiler.benchmark_operation(
-        "Parameter Regression (3 iterations)",
-        parameter_regression,
-        iterations=5
-    )
+        return parameter_regression
 
-    # 6. Full Parameter Regression (Production Settings)
-    def parameter_regression_full():
-        regressor = ParametersRegressor(
-            model,
-            max_n_iters=5,  # Production default
-            n_points=5000,  # Production default
-            verbose=False
-        )
-        pose_params, phenotype_kwargs, v_hat = regressor(
-            vertices_target,
-            optimize_phenotypes=True
+    for batch in (1, 4, 16):
+        result = profiler.benchmark_operation(
+            f"Parameter Regression (3 iterations, batch {batch})",
+            # Reduced for benchmarking
+            make_parameter_regression(max_n_iters=3, n_points=2000, batch=batch),
+            iterations=5
         )
-        return pose_params, phenotype_kwargs, v_hat
+        print(f"  Per-sample: {result.avg_duration_ms / batch:.2f}ms")
 
+    # 6. Full Parameter Regression (Production Settings)
     profiler.benchmark_operation(
         "Parameter Regression (5 iterations, 5k points)",
-        parameter_regression_full,
+        make_parameter_regression(max_n_iters=5, n_points=5000),  # Production defaults
         iterations=3
     )
 
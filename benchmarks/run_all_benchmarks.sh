@@ -42,7 +42,7 @@ echo ""
 echo "=================================="
 echo "2. Running Bottleneck Analyzer"
 echo "=================================="
-python3 bottleneck_analyzer.py 2>&1 | tee "$OUTPUT_DIR/bottleneck.log"
+python3 bottleneck_analyzer.py --output-dir "$OUTPUT_DIR" 2>&1 | tee "$OUTPUT_DIR/bottleneck.log"
 echo ""
 
 # Generate summary report
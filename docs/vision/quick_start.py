@@ -34,7 +34,7 @@ def single_image_example():
     print("\n1. Preprocessing image...")
     preprocessor = ImagePreprocessor(
         target_size=(640, 480),
-        normalize=True,
+        normalize=False,  # MediaPipe ingests uint8; skip the float round-trip
         min_resolution=(320, 240)
     )
 
@@ -102,7 +102,7 @@ def multi_view_example():
 
     # Initialize components
     print("\n1. Initializing components...")
-    preprocessor = ImagePreprocessor()
+    preprocessor = ImagePreprocessor(output_dtype='uint8')
     detector = LandmarkDetector()
     extractor = MeasurementExtractor()
     fusion = MultiViewFusion(
@@ -112,27 +112,27 @@ def multi_view_example():
     )
     print("   ✓ Components initialized")
 
-    # Process each image
+    # Process all views as one batch
     print("\n2. Processing multiple views...")
-    measurements_list = []
-
-    for i, img in enumerate(images):
-        # Preprocess
-        processed, _ = preprocessor.preprocess(img)
-
-        # Detect landmarks
-        result = detector.detect(processed)
-
+    preprocessed, _ = preprocessor.preprocess_batch(images)
+    indices = [i for i, img in enumerate(preprocessed) if img is not None]
+    results = dict(zip(indices, detector.detect_batch([preprocessed[i] for i in indices])))
+
+    detected = []
+    for i in range(len(images)):
+        if i not in results:
+            print(f"   ✗ View {i+1}: Preprocessing failed")
+            continue
+        result = results[i]
         if result is None:
             print(f"   ✗ View {i+1}: No landmarks detected")
             continue
-
-        # Extract measurements
-        measurement = extractor.extract_all(result)
-        measurements_list.append(measurement)
-
+        detected.append(result)
         print(f"   ✓ View {i+1}: {result.overall_confidence:.2%} confidence")
 
+    # Extract measurements
+    measurements_list = extractor.extract_all_batch(detected)
+
     if len(measurements_list) < 2:
         print("\n   ✗ Insufficient valid views for fusion")
         return
@@ -176,13 +176,18 @@ def batch_processing_example():
         for _ in range(num_images)
     ]
 
+    # Larger batches favour throughput, smaller ones per-image latency
+    batch_size = 32
+
     print(f"\n1. Processing batch of {num_images} images...")
 
     # Initialize detector
     detector = LandmarkDetector()
 
-    # Batch detection
-    results = detector.detect_batch(images, skip_failed=True)
+    # Batch detection, in chunks of batch_size images
+    results = []
+    for start in range(0, num_images, batch_size):
+        results.extend(detector.detect_batch(images[start:start + batch_size], skip_failed=True))
 
     # Count successful detections
     successful = sum(1 for r in results if r is not None)
@@ -196,11 +201,12 @@ def batch_processing_example():
     print("\n2. Extracting measurements...")
     extractor = MeasurementExtractor()
 
-    for i, result in enumerate(results):
-        if result is not None:
-            measurements = extractor.extract_all(result)
-            print(f"   Image {i+1}: Height = {measurements.height:.2f}m, "
-                  f"Confidence = {measurements.overall_confidence:.2%}")
+    indices = [i for i, result in enumerate(results) if result is not None]
+    measurements_list = extractor.extract_all_batch([results[i] for i in indices])
+
+    for i, measurements in zip(indices, measurements_list):
+        print(f"   Image {i+1}: Height = {measurements.height:.2f}m, "
+              f"Confidence = {measurements.overall_confidence:.2%}")
 
 
 def quality_control_example():
@@ -333,6 +333,7 @@ class ParametersRegressor:
 
         excluded_phenotypes = excluded_phenotypes or []
         optim_keys = [k for k in self.model.phenotype_labels if k not in excluded_phenotypes]
+        optim_idx = [self.model.phenotype_labels.index(k) for k in optim_keys]
 
         vertices_target = vertices_target.to(self.device)        
         batch_size = vertices_target.shape[0]
@@ -349,14 +350,17 @@ class ParametersRegressor:
             
             if optimize_phenotypes:
                 A = self._compute_macro_jacobian(pose_parameters, local_changes_kwargs, self.idx, phenotype_kwargs)
-                A = A[..., [self.model.phenotype_labels.index(k) for k in optim_keys]]
+                A = A[..., optim_idx]
                 b = (vertices_target[:, self.idx] - v_hat[:, self.idx]).reshape(batch_size, -1)
-                reg = torch.diag(
-                    self.reg_weights[[self.model.phenotype_labels.index(k) for k in optim_keys]]
-                ).to(self.device)[None]
-                delta = torch.linalg.solve(A.transpose(2, 1) @ A + reg, (A.transpose(2, 1) @ b[:, :, None])[:, :, 0])
+                reg = torch.diag(self.reg_weights[optim_idx]).to(self.device)[None]
+                # solve_ex avoids the device->host sync of checking the info flag;
+                # a singular or ill-conditioned system surfaces as NaN/inf instead
+                delta, _ = torch.linalg.solve_ex(
+                    A.transpose(2, 1) @ A + reg, (A.transpose(2, 1) @ b[:, :, None])[:, :, 0]
+                )
                 # delta = torch.linalg.lstsq(A, b).solution
-                delta = torch.nan_to_num(delta, nan=0.0)  # or other fill value
+                # Zero non-finite steps so a failed solve leaves the phenotypes unchanged
+                delta = torch.nan_to_num(delta, nan=0.0, posinf=0.0, neginf=0.0)
                 for i, k in enumerate(optim_keys):
                     diff = torch.clamp(delta[:, i], -max_delta, max_delta)
                     phenotype_kwargs[k] = torch.clamp(phenotype_kwargs[k] + diff, 0.01, 0.99)
@@ -2,11 +2,47 @@
 # Copyright (C) 2025 NAVER Corp.
 # Apache License, Version 2.0
 
+import os
 import numpy as np
 import torch
-from typing import Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple, Optional, Union
 from PIL import Image
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    cv2 = None
+
+# Precomputed uint8 -> [0, 1] scale
+_INV_255 = np.float32(1.0 / 255.0)
+
+
+def _compute_resize_params(
+    height: int,
+    width: int,
+    target_height: int,
+    target_width: int
+) -> Tuple[int, int, int, int, float]:
+    """
+    Compute the aspect-preserving resize and centering offsets.
+
+    Returns:
+        Tuple of (new_height, new_width, y_offset, x_offset, scale)
+    """
+    scale = min(target_width / width, target_height / height)
+    new_height = int(height * scale)
+    new_width = int(width * scale)
+    return (
+        new_height,
+        new_width,
+        (target_height - new_height) // 2,
+        (target_width - new_width) // 2,
+        scale
+    )
+
 
 class ImagePreprocessor:
     """
@@ -24,7 +60,8 @@ class ImagePreprocessor:
         target_size: Tuple[int, int] = (640, 480),
         normalize: bool = True,
         min_resolution: Tuple[int, int] = (320, 240),
-        device: str = 'cpu'
+        device: str = 'cpu',
+        output_dtype: Optional[str] = None
     ):
         """
         Initialize image preprocessor.
@@ -34,11 +71,22 @@ class ImagePreprocessor:
             normalize: Whether to normalize pixel values to [0, 1]
             min_resolution: Minimum acceptable resolution
             device: Device for tensor operations ('cpu' or 'cuda')
+            output_dtype: Output dtype of preprocess(). 'uint8' keeps pixels as
+                uint8 end-to-end and skips normalization (what MediaPipe ingests);
+                'float32' always normalizes. None follows ``normalize``.
         """
+        if output_dtype not in (None, 'uint8', 'float32'):
+            raise ValueError(f"Unsupported output_dtype: {output_dtype}")
+
         self.target_size = target_size
-        self.normalize = normalize
+        self.normalize = normalize if output_dtype is None else output_dtype == 'float32'
+        self.output_dtype = output_dtype
         self.min_resolution = min_resolution
         self.device = device
+        # Reusable padded output buffers keyed by (target_size, dtype, channels)
+        self._pad_cache: Dict[Tuple, np.ndarray] = {}
+        # Side stream for host-to-device copies in to_tensor (created lazily)
+        self._copy_stream: Optional[torch.cuda.Stream] = None
 
     def validate_image(self, image: np.ndarray) -> Tuple[bool, str]:
         """
@@ -66,10 +114,38 @@ class ImagePreprocessor:
 
         return True, ""
 
+    def _resize(self, image: np.ndarray, new_width: int, new_height: int) -> np.ndarray:
+        """
+        Resample image to (new_width, new_height) without padding.
+
+        Args:
+            image: Input image
+            new_width: Output width
+            new_height: Output height
+
+        Returns:
+            Resized image (the input itself if no resampling is needed)
+        """
+        height, width = image.shape[:2]
+        if (new_width, new_height) == (width, height):
+            return image
+
+        if CV2_AVAILABLE:
+            # OpenCV's SIMD resamplers; area averaging avoids aliasing on downscale
+            interpolation = cv2.INTER_AREA if new_width < width else cv2.INTER_LINEAR
+            return cv2.resize(
+                np.ascontiguousarray(image), (new_width, new_height), interpolation=interpolation
+            )
+
+        pil_image = Image.fromarray(image)
+        pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return np.array(pil_image)
+
     def resize_preserve_aspect(
         self,
         image: np.ndarray,
-        target_size: Optional[Tuple[int, int]] = None
+        target_size: Optional[Tuple[int, int]] = None,
+        copy: bool = True
     ) -> np.ndarray:
         """
         Resize image while preserving aspect ratio.
@@ -77,6 +153,10 @@ class ImagePreprocessor:
         Args:
             image: Input image
             target_size: Target size (width, height), uses self.target_size if None
+            copy: If False, write into a cached buffer that is reused by the
+                next call with the same target size, dtype and channel count.
+                Callers must copy the result if they retain it. Not safe to
+                share across threads.
 
         Returns:
             Resized image with padding if needed
@@ -87,50 +167,59 @@ class ImagePreprocessor:
         height, width = image.shape[:2]
         target_width, target_height = target_size
 
-        # Calculate scaling factor
-        scale = min(target_width / width, target_height / height)
-        new_width = int(width * scale)
-        new_height = int(height * scale)
+        # Calculate scaling factor and centering offsets
+        new_height, new_width, y_offset, x_offset, _ = _compute_resize_params(
+            height, width, target_height, target_width
+        )
 
-        # Resize using PIL for better quality
-        pil_image = Image.fromarray(image)
-        pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        resized = np.array(pil_image)
+        resized = self._resize(image, new_width, new_height)
 
         # Create padded image
-        if len(image.shape) == 3:
-            padded = np.zeros((target_height, target_width, image.shape[2]), dtype=image.dtype)
+        channels = image.shape[2:]
+        if copy:
+            padded = np.zeros((target_height, target_width) + channels, dtype=image.dtype)
         else:
-            padded = np.zeros((target_height, target_width), dtype=image.dtype)
-
-        # Center the resized image
-        y_offset = (target_height - new_height) // 2
-        x_offset = (target_width - new_width) // 2
-
-        if len(image.shape) == 3:
-            padded[y_offset:y_offset+new_height, x_offset:x_offset+new_width, :] = resized
-        else:
-            padded[y_offset:y_offset+new_height, x_offset:x_offset+new_width] = resized
+            key = (tuple(target_size), image.dtype, channels)
+            padded = self._pad_cache.get(key)
+            if padded is None:
+                padded = np.empty((target_height, target_width) + channels, dtype=image.dtype)
+                self._pad_cache[key] = padded
+            # Only the border strips need clearing; the center is overwritten below
+            y_end = y_offset + new_height
+            x_end = x_offset + new_width
+            padded[:y_offset] = 0
+            padded[y_end:] = 0
+            padded[y_offset:y_end, :x_offset] = 0
+            padded[y_offset:y_end, x_end:] = 0
+
+        padded[y_offset:y_offset+new_height, x_offset:x_offset+new_width] = resized
 
         return padded
 
-    def normalize_image(self, image: np.ndarray) -> np.ndarray:
+    def normalize_image(self, image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Normalize image pixel values to [0, 1] range.
 
         Args:
             image: Input image
+            out: Optional float32 array of the same shape to write into
 
         Returns:
-            Normalized image
+            Normalized image (``out`` if given)
         """
+        if image.dtype not in [np.uint8, np.float32, np.float64]:
+            raise ValueError(f"Unsupported image dtype: {image.dtype}")
+
+        if out is None:
+            out = np.empty(image.shape, dtype=np.float32)
+
         if image.dtype == np.uint8:
-            return image.astype(np.float32) / 255.0
-        elif image.dtype in [np.float32, np.float64]:
-            # Already float, ensure in [0, 1]
-            return np.clip(image, 0.0, 1.0).astype(np.float32)
+            # Cast and scale in a single pass
+            np.multiply(image, _INV_255, out=out, casting='unsafe')
         else:
-            raise ValueError(f"Unsupported image dtype: {image.dtype}")
+            # Already float, ensure in [0, 1]
+            np.clip(image, 0.0, 1.0, out=out, casting='unsafe')
+        return out
 
     def convert_to_rgb(self, image: np.ndarray) -> np.ndarray:
         """
@@ -140,11 +229,12 @@ class ImagePreprocessor:
             image: Input image (grayscale, RGB, or RGBA)
 
         Returns:
-            RGB image
+            RGB image. For grayscale input this is a read-only broadcast view
+            (no pixel copy); use np.ascontiguousarray() before writing to it.
         """
         if len(image.shape) == 2:
             # Grayscale to RGB
-            return np.stack([image] * 3, axis=-1)
+            return np.broadcast_to(image[:, :, None], image.shape + (3,))
         elif image.shape[2] == 4:
             # RGBA to RGB (discard alpha)
             return image[:, :, :3]
@@ -153,31 +243,26 @@ class ImagePreprocessor:
         else:
             raise ValueError(f"Cannot convert image with {image.shape[2]} channels to RGB")
 
-    def preprocess(
+    def _prepare(
         self,
-        image: Union[np.ndarray, torch.Tensor, Image.Image],
-        validate: bool = True
+        image: Union[np.ndarray, torch.Tensor, Image.Image, bytes],
+        validate: bool,
+        expected_shape: Optional[Tuple[int, ...]] = None
     ) -> Tuple[np.ndarray, dict]:
-        """
-        Preprocess image for landmark detection.
-
-        Args:
-            image: Input image (numpy array, torch tensor, or PIL Image)
-            validate: Whether to validate image quality
-
-        Returns:
-            Tuple of (preprocessed_image, metadata_dict)
-
-        Raises:
-            ValueError: If image validation fails
-        """
+        """Convert input to a validated RGB numpy image and start its metadata."""
         # Convert to numpy if needed
-        if isinstance(image, torch.Tensor):
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            # Raw pixel buffer (e.g. an HTTP request body): wrap without copying
+            if expected_shape is None:
+                raise ValueError("expected_shape is required for raw byte input")
+            image = np.frombuffer(image, dtype=np.uint8).reshape(expected_shape)
+        elif isinstance(image, torch.Tensor):
             image = image.cpu().numpy()
             if image.dtype == torch.float32 or image.dtype == torch.float64:
                 image = (image * 255).astype(np.uint8)
         elif isinstance(image, Image.Image):
-            image = np.array(image)
+            # Shares PIL's pixel buffer where possible instead of copying
+            image = np.asarray(image)
 
         # Store original metadata
         metadata = {
@@ -195,57 +280,202 @@ class ImagePreprocessor:
                 raise ValueError(f"Image validation failed: {error_msg}")
 
         # Convert to RGB
-        image = self.convert_to_rgb(image)
+        return self.convert_to_rgb(image), metadata
+
+    def preprocess(
+        self,
+        image: Union[np.ndarray, torch.Tensor, Image.Image, bytes],
+        validate: bool = True,
+        expected_shape: Optional[Tuple[int, ...]] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        Preprocess image for landmark detection.
+
+        Args:
+            image: Input image (numpy array, torch tensor, PIL Image, or raw
+                uint8 pixel bytes)
+            validate: Whether to validate image quality
+            expected_shape: Shape (height, width[, channels]) of raw byte
+                input; required when ``image`` is bytes, ignored otherwise
+
+        Returns:
+            Tuple of (preprocessed_image, metadata_dict)
+
+        Raises:
+            ValueError: If image validation fails
+        """
+        image, metadata = self._prepare(image, validate, expected_shape)
 
         # Resize with aspect ratio preservation
         original_height, original_width = image.shape[:2]
-        image = self.resize_preserve_aspect(image)
+        target_width, target_height = self.target_size
+        if (original_height, original_width) == (target_height, target_width):
+            # Fast path for frames already at target resolution: no resize
+            # and no padding, only the conversion pass below
+            new_height, new_width, y_offset, x_offset, scale = (
+                target_height, target_width, 0, 0, 1.0
+            )
+            resized = image
+        else:
+            new_height, new_width, y_offset, x_offset, scale = _compute_resize_params(
+                original_height, original_width, target_height, target_width
+            )
+            resized = self._resize(image, new_width, new_height)
+
+        # Pad and normalize in a single pass: the resized pixels are written
+        # (and converted to float32 if normalizing) straight into their slot
+        # in the output buffer, with no intermediate padded copy
+        if self.normalize:
+            output_dtype = np.float32
+        elif self.output_dtype == 'uint8':
+            output_dtype = np.uint8
+        else:
+            output_dtype = image.dtype
+        if (new_height, new_width) == (target_height, target_width):
+            # Image fills the output, so there is no padding to zero
+            output = np.empty((target_height, target_width, 3), dtype=output_dtype)
+        else:
+            output = np.zeros((target_height, target_width, 3), dtype=output_dtype)
+        region = output[y_offset:y_offset+new_height, x_offset:x_offset+new_width]
+        if self.normalize:
+            self.normalize_image(resized, out=region)
+        elif output_dtype == np.uint8 and resized.dtype != np.uint8:
+            # Float [0, 1] input: scale and cast straight into the output
+            np.multiply(resized, 255, out=region, casting='unsafe')
+        else:
+            region[...] = resized
 
         # Calculate metadata
-        new_height, new_width = image.shape[:2]
-        metadata['preprocessed_shape'] = image.shape
-        metadata['scale_factor'] = min(
-            new_width / original_width,
-            new_height / original_height
-        )
+        metadata['preprocessed_shape'] = output.shape
+        metadata['scale_factor'] = scale
         metadata['padding'] = {
-            'top': (new_height - int(original_height * metadata['scale_factor'])) // 2,
-            'left': (new_width - int(original_width * metadata['scale_factor'])) // 2
+            'top': y_offset,
+            'left': x_offset
         }
 
-        # Normalize if requested
+        return output, metadata
+
+    def preprocess_tensor(
+        self,
+        image: Union[np.ndarray, torch.Tensor, Image.Image, bytes],
+        validate: bool = True,
+        expected_shape: Optional[Tuple[int, ...]] = None
+    ) -> Tuple[torch.Tensor, dict]:
+        """
+        Preprocess image straight to a (C, H, W) tensor on self.device.
+
+        On CUDA devices the resize, padding and normalization run on the GPU,
+        so only the raw pixels cross the bus and preprocessing can overlap
+        with GPU inference. On CPU this is preprocess() followed by to_tensor().
+
+        Args:
+            image: Input image (numpy array, torch tensor, PIL Image, or raw
+                uint8 pixel bytes)
+            validate: Whether to validate image quality
+            expected_shape: Shape of raw byte input (see preprocess)
+
+        Returns:
+            Tuple of (preprocessed_tensor, metadata_dict)
+
+        Raises:
+            ValueError: If image validation fails
+        """
+        if not str(self.device).startswith('cuda'):
+            processed, metadata = self.preprocess(
+                image, validate=validate, expected_shape=expected_shape
+            )
+            return self.to_tensor(processed), metadata
+
+        image, metadata = self._prepare(image, validate, expected_shape)
+        return self._preprocess_on_device(image, metadata)
+
+    def _preprocess_on_device(
+        self,
+        image: np.ndarray,
+        metadata: dict
+    ) -> Tuple[torch.Tensor, dict]:
+        """Resize, pad and normalize an RGB image with torch ops on self.device."""
+        original_height, original_width = image.shape[:2]
+        target_width, target_height = self.target_size
+        new_height, new_width, y_offset, x_offset, scale = _compute_resize_params(
+            original_height, original_width, target_height, target_width
+        )
+
+        tensor = torch.from_numpy(np.ascontiguousarray(image)).to(self.device, non_blocking=True)
+        tensor = tensor.permute(2, 0, 1).unsqueeze(0).float()
+
+        if (new_height, new_width) != (original_height, original_width):
+            # Antialiasing on downscale plays the role of cv2.INTER_AREA
+            tensor = torch.nn.functional.interpolate(
+                tensor,
+                size=(new_height, new_width),
+                mode='bilinear',
+                align_corners=False,
+                antialias=new_width < original_width
+            )
+
         if self.normalize:
-            image = self.normalize_image(image)
+            if image.dtype == np.uint8:
+                tensor.mul_(float(_INV_255))
+            tensor.clamp_(0.0, 1.0)
+        elif self.output_dtype == 'uint8' or image.dtype == np.uint8:
+            if image.dtype != np.uint8:
+                tensor.mul_(255.0)
+            tensor = tensor.round_().clamp_(0, 255).to(torch.uint8)
+
+        tensor = torch.nn.functional.pad(
+            tensor,
+            (x_offset, target_width - new_width - x_offset,
+             y_offset, target_height - new_height - y_offset)
+        ).squeeze(0)
+
+        metadata['preprocessed_shape'] = (target_height, target_width, 3)
+        metadata['scale_factor'] = scale
+        metadata['padding'] = {
+            'top': y_offset,
+            'left': x_offset
+        }
 
-        return image, metadata
+        return tensor, metadata
 
     def preprocess_batch(
         self,
         images: list,
-        validate: bool = True
+        validate: bool = True,
+        num_workers: Optional[int] = None
     ) -> Tuple[list, list]:
         """
         Preprocess batch of images.
 
+        Images are processed concurrently on a thread pool; the resize and
+        array kernels release the GIL.
+
         Args:
             images: List of input images
             validate: Whether to validate image quality
+            num_workers: Number of worker threads (defaults to half the CPU count)
 
         Returns:
             Tuple of (preprocessed_images, metadata_list)
         """
-        preprocessed = []
-        metadata_list = []
+        if num_workers is None:
+            num_workers = max(1, (os.cpu_count() or 1) // 2)
 
-        for img in images:
+        def preprocess_one(img):
             try:
-                prep_img, metadata = self.preprocess(img, validate=validate)
-                preprocessed.append(prep_img)
-                metadata_list.append(metadata)
+                return self.preprocess(img, validate=validate)
             except ValueError as e:
                 # Store error in metadata
-                metadata_list.append({'error': str(e)})
-                preprocessed.append(None)
+                return None, {'error': str(e)}
+
+        if num_workers <= 1 or len(images) <= 1:
+            outputs = [preprocess_one(img) for img in images]
+        else:
+            with ThreadPoolExecutor(max_workers=min(num_workers, len(images))) as executor:
+                outputs = list(executor.map(preprocess_one, images))
+
+        preprocessed = [prep_img for prep_img, _ in outputs]
+        metadata_list = [metadata for _, metadata in outputs]
 
         return preprocessed, metadata_list
 
@@ -253,16 +483,38 @@ class ImagePreprocessor:
         """
         Convert preprocessed numpy image to PyTorch tensor.
 
+        On CUDA devices the upload is asynchronous: it is issued from pinned
+        memory on a side stream, and the caller's current stream waits on it.
+
         Args:
             image: Preprocessed numpy image
 
         Returns:
             PyTorch tensor in (C, H, W) format
         """
-        # Convert HWC to CHW
+        if not str(self.device).startswith('cuda'):
+            # Convert HWC to CHW (a view, no copy)
+            if len(image.shape) == 3:
+                tensor = torch.from_numpy(image).permute(2, 0, 1)
+            else:
+                tensor = torch.from_numpy(image).unsqueeze(0)
+            return tensor.to(self.device)
+
+        # Lay out CHW contiguously so the upload is a single DMA, then copy
+        # from pinned memory on a side stream so the host is not blocked
         if len(image.shape) == 3:
-            tensor = torch.from_numpy(image).permute(2, 0, 1)
+            chw = np.ascontiguousarray(image.transpose(2, 0, 1))
         else:
-            tensor = torch.from_numpy(image).unsqueeze(0)
-
-        return tensor.to(self.device)
+            chw = np.ascontiguousarray(image[None])
+        pinned = torch.from_numpy(chw).pin_memory()
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(device=self.device)
+        with torch.cuda.stream(self._copy_stream):
+            tensor = pinned.to(self.device, non_blocking=True)
+
+        # Work queued on the caller's stream waits for the copy to land
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_stream(self._copy_stream)
+        tensor.record_stream(current_stream)
+        return tensor
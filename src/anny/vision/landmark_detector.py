@@ -2,8 +2,11 @@
 # Copyright (C) 2025 NAVER Corp.
 # Apache License, Version 2.0
 
+import os
+import queue
 import numpy as np
 import torch
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Optional, List, Dict, Tuple, Union
 from dataclasses import dataclass
 
@@ -15,6 +18,15 @@ except ImportError:
     mp = None
 
 
+# Per-landmark record: coordinates, confidence and visibility stored together
+# (20 bytes per landmark) so downstream code touching all three stays in cache
+LANDMARK_DTYPE = np.dtype([
+    ('xyz', np.float32, (3,)),
+    ('confidence', np.float32),
+    ('visibility', np.float32),
+])
+
+
 @dataclass
 class LandmarkResult:
     """Container for landmark detection results."""
@@ -24,6 +36,134 @@ class LandmarkResult:
     overall_confidence: float  # Overall detection confidence
     image_shape: Tuple[int, int]  # Original image shape (height, width)
     world_landmarks: Optional[np.ndarray] = None  # 3D world coordinates if available
+    # Shape: (num_landmarks,) LANDMARK_DTYPE buffer backing the arrays above
+    packed: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_packed(
+        cls,
+        packed: np.ndarray,
+        overall_confidence: float,
+        image_shape: Tuple[int, int],
+        world_landmarks: Optional[np.ndarray] = None
+    ) -> 'LandmarkResult':
+        """Create a result whose landmark/confidence/visibility arrays are views into ``packed``."""
+        return cls(
+            landmarks=packed['xyz'],
+            confidence=packed['confidence'],
+            visibility=packed['visibility'],
+            overall_confidence=overall_confidence,
+            image_shape=image_shape,
+            world_landmarks=world_landmarks,
+            packed=packed
+        )
+
+
+def _extract_landmark_arrays(
+    pose,
+    image: np.ndarray,
+    return_world_landmarks: bool,
+    uint8_buffer: Optional[np.ndarray] = None
+) -> Optional[Tuple[np.ndarray, Optional[np.ndarray], Tuple[int, int]]]:
+    """
+    Run a Pose graph on one image and copy its landmarks into numpy arrays.
+
+    Args:
+        pose: MediaPipe Pose graph
+        image: Input image (RGB, uint8 or float in [0, 1])
+        return_world_landmarks: If True, also extracts 3D world coordinates
+        uint8_buffer: Optional uint8 array of the image's shape to convert
+            float input into, instead of allocating one
+
+    Returns:
+        Tuple of (packed LANDMARK_DTYPE array, world landmarks or None,
+        image shape), or None if no pose was detected
+    """
+    # Ensure image is in correct format (MediaPipe needs C-contiguous uint8)
+    if image.dtype == np.uint8:
+        # Fast path: uint8 input is passed through (copied only if non-contiguous)
+        image_uint8 = np.ascontiguousarray(image)
+    elif image.dtype == np.float32 or image.dtype == np.float64:
+        # Scale and cast in one pass, without a float temporary
+        image_uint8 = uint8_buffer
+        if image_uint8 is None:
+            image_uint8 = np.empty(image.shape, dtype=np.uint8)
+        np.multiply(image, 255, out=image_uint8, casting='unsafe')
+    else:
+        image_uint8 = np.ascontiguousarray(image)
+
+    # Process image
+    results = pose.process(image_uint8)
+
+    if not results.pose_landmarks:
+        return None
+
+    # Extract landmarks into a single packed buffer
+    height, width = image.shape[:2]
+    pose_landmarks = results.pose_landmarks.landmark
+    packed = np.empty(len(pose_landmarks), dtype=LANDMARK_DTYPE)
+
+    for i, landmark in enumerate(pose_landmarks):
+        # MediaPipe doesn't provide per-landmark confidence in Pose
+        # Use visibility as proxy for confidence
+        packed[i] = ((landmark.x, landmark.y, landmark.z), landmark.visibility, landmark.visibility)
+
+    # Extract world landmarks if requested
+    world_landmarks = None
+    if return_world_landmarks and results.pose_world_landmarks:
+        pose_world_landmarks = results.pose_world_landmarks.landmark
+        world_landmarks = np.empty((len(pose_world_landmarks), 3), dtype=np.float32)
+        for i, landmark in enumerate(pose_world_landmarks):
+            world_landmarks[i, 0] = landmark.x
+            world_landmarks[i, 1] = landmark.y
+            world_landmarks[i, 2] = landmark.z
+
+    return packed, world_landmarks, (height, width)
+
+
+def _build_result(
+    packed: np.ndarray,
+    world_landmarks: Optional[np.ndarray],
+    image_shape: Tuple[int, int]
+) -> LandmarkResult:
+    """Wrap extracted landmark arrays in a LandmarkResult."""
+    confidences = packed['confidence']
+    visibilities = packed['visibility']
+
+    # Calculate overall confidence as mean of visible landmarks, as a masked
+    # dot product rather than a boolean-indexed copy
+    visible_mask = visibilities > 0.5
+    count = int(np.count_nonzero(visible_mask))
+    overall_confidence = (
+        np.dot(confidences, visible_mask) / count
+        if count
+        else 0.0
+    )
+
+    return LandmarkResult.from_packed(
+        packed,
+        overall_confidence=float(overall_confidence),
+        image_shape=image_shape,
+        world_landmarks=world_landmarks
+    )
+
+
+# Per-process Pose graph used by detect_batch_parallel workers
+_worker_pose = None
+
+
+def _worker_init(pose_kwargs: Dict[str, Union[bool, int, float]]) -> None:
+    """Build this worker process's Pose graph once, when the process starts."""
+    global _worker_pose
+    _worker_pose = mp.solutions.pose.Pose(**pose_kwargs)
+
+
+def _worker_detect(
+    image: np.ndarray,
+    return_world_landmarks: bool
+) -> Optional[Tuple[np.ndarray, Optional[np.ndarray], Tuple[int, int]]]:
+    """Detect landmarks in a worker process, returning plain arrays for pickling."""
+    return _extract_landmark_arrays(_worker_pose, image, return_world_landmarks)
 
 
 class LandmarkDetector:
@@ -55,6 +195,7 @@ class LandmarkDetector:
         'left_ankle', 'right_ankle', 'left_heel', 'right_heel',
         'left_foot_index', 'right_foot_index'
     ]
+    LANDMARK_INDEX: Dict[str, int] = {name: i for i, name in enumerate(LANDMARK_NAMES)}
 
     def __init__(
         self,
@@ -96,15 +237,32 @@ class LandmarkDetector:
 
         # Initialize MediaPipe Pose
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=static_image_mode,
-            model_complexity=model_complexity,
-            smooth_landmarks=smooth_landmarks,
-            enable_segmentation=enable_segmentation,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
+        self.pose = self._create_pose()
+
+        # Pose graphs are not thread-safe, so parallel batch detection checks
+        # one out per worker; the pool grows lazily and is reused across calls
+        self._idle_poses = queue.SimpleQueue()
+        self._idle_poses.put(self.pose)
+        self._worker_poses = []
+
+        # Reused float -> uint8 conversion buffer for detect() on video streams
+        self._uint8_buf: Optional[np.ndarray] = None
+
+    def _pose_kwargs(self) -> Dict[str, Union[bool, int, float]]:
+        """MediaPipe Pose constructor arguments for this detector's settings."""
+        return dict(
+            static_image_mode=self.static_image_mode,
+            model_complexity=self.model_complexity,
+            smooth_landmarks=self.smooth_landmarks,
+            enable_segmentation=self.enable_segmentation,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
         )
 
+    def _create_pose(self):
+        """Create a MediaPipe Pose graph with this detector's settings."""
+        return self.mp_pose.Pose(**self._pose_kwargs())
+
     def detect(
         self,
         image: np.ndarray,
@@ -120,87 +278,135 @@ class LandmarkDetector:
         Returns:
             LandmarkResult object if detection successful, None otherwise
         """
-        # Ensure image is in correct format
+        uint8_buffer = None
         if image.dtype == np.float32 or image.dtype == np.float64:
-            image_uint8 = (image * 255).astype(np.uint8)
-        else:
-            image_uint8 = image
-
-        # Process image
-        results = self.pose.process(image_uint8)
+            if self._uint8_buf is None or self._uint8_buf.shape != image.shape:
+                self._uint8_buf = np.empty(image.shape, dtype=np.uint8)
+            uint8_buffer = self._uint8_buf
+        return self._detect_with(self.pose, image, return_world_landmarks, uint8_buffer)
 
-        if not results.pose_landmarks:
+    def _detect_pooled(
+        self,
+        image: np.ndarray,
+        return_world_landmarks: bool
+    ) -> Optional[LandmarkResult]:
+        """Run detection on a Pose graph checked out from the worker pool."""
+        try:
+            pose = self._idle_poses.get_nowait()
+        except queue.Empty:
+            pose = self._create_pose()
+            self._worker_poses.append(pose)
+        try:
+            return self._detect_with(pose, image, return_world_landmarks)
+        finally:
+            self._idle_poses.put(pose)
+
+    def _detect_with(
+        self,
+        pose,
+        image: np.ndarray,
+        return_world_landmarks: bool,
+        uint8_buffer: Optional[np.ndarray] = None
+    ) -> Optional[LandmarkResult]:
+        """Detect landmarks in a single image using the given Pose graph."""
+        arrays = _extract_landmark_arrays(pose, image, return_world_landmarks, uint8_buffer)
+        if arrays is None:
             return None
-
-        # Extract landmarks
-        height, width = image.shape[:2]
-        landmarks = []
-        confidences = []
-        visibilities = []
-
-        for landmark in results.pose_landmarks.landmark:
-            landmarks.append([landmark.x, landmark.y, landmark.z])
-            # MediaPipe doesn't provide per-landmark confidence in Pose
-            # Use visibility as proxy for confidence
-            confidences.append(landmark.visibility)
-            visibilities.append(landmark.visibility)
-
-        landmarks = np.array(landmarks, dtype=np.float32)
-        confidences = np.array(confidences, dtype=np.float32)
-        visibilities = np.array(visibilities, dtype=np.float32)
-
-        # Calculate overall confidence as mean of visible landmarks
-        visible_mask = visibilities > 0.5
-        overall_confidence = (
-            confidences[visible_mask].mean()
-            if visible_mask.any()
-            else 0.0
-        )
-
-        # Extract world landmarks if requested
-        world_landmarks = None
-        if return_world_landmarks and results.pose_world_landmarks:
-            world_landmarks = []
-            for landmark in results.pose_world_landmarks.landmark:
-                world_landmarks.append([landmark.x, landmark.y, landmark.z])
-            world_landmarks = np.array(world_landmarks, dtype=np.float32)
-
-        return LandmarkResult(
-            landmarks=landmarks,
-            confidence=confidences,
-            visibility=visibilities,
-            overall_confidence=float(overall_confidence),
-            image_shape=(height, width),
-            world_landmarks=world_landmarks
-        )
+        return _build_result(*arrays)
 
     def detect_batch(
         self,
         images: List[np.ndarray],
         return_world_landmarks: bool = True,
-        skip_failed: bool = True
+        skip_failed: bool = True,
+        num_workers: Optional[int] = None
     ) -> List[Optional[LandmarkResult]]:
         """
         Detect landmarks in batch of images.
 
+        Images are processed concurrently on a thread pool (MediaPipe releases
+        the GIL during inference), each worker using its own Pose graph. In
+        video mode (static_image_mode=False) frames are processed sequentially
+        so that landmark tracking sees them in order.
+
         Args:
             images: List of input images
             return_world_landmarks: If True, includes 3D world coordinates
             skip_failed: If True, returns None for failed detections, otherwise raises error
+            num_workers: Number of worker threads (defaults to half the CPU count)
 
         Returns:
             List of LandmarkResult objects (None for failed detections if skip_failed=True)
         """
-        results = []
-        for image in images:
+        if num_workers is None:
+            num_workers = max(1, (os.cpu_count() or 1) // 2)
+
+        def detect_one(detect_fn, image):
             try:
-                result = self.detect(image, return_world_landmarks=return_world_landmarks)
-                results.append(result)
+                return detect_fn(image, return_world_landmarks)
             except Exception as e:
                 if skip_failed:
-                    results.append(None)
-                else:
+                    return None
+                raise RuntimeError(f"Landmark detection failed: {str(e)}") from e
+
+        if num_workers <= 1 or len(images) <= 1 or not self.static_image_mode:
+            return [detect_one(self.detect, image) for image in images]
+
+        with ThreadPoolExecutor(max_workers=min(num_workers, len(images))) as executor:
+            return list(executor.map(lambda image: detect_one(self._detect_pooled, image), images))
+
+    def detect_batch_parallel(
+        self,
+        images: List[np.ndarray],
+        return_world_landmarks: bool = True,
+        skip_failed: bool = True,
+        num_workers: int = 8
+    ) -> List[Optional[LandmarkResult]]:
+        """
+        Detect landmarks in batch of images using a process pool.
+
+        Each worker process builds its own Pose graph once at startup, which
+        avoids GIL contention entirely at the cost of process startup and
+        pickling images to the workers. Worth it for large batches; for small
+        ones prefer detect_batch. Falls back to sequential detection in video
+        mode or when there is nothing to parallelize.
+
+        Args:
+            images: List of input images
+            return_world_landmarks: If True, includes 3D world coordinates
+            skip_failed: If True, returns None for failed detections, otherwise raises error
+            num_workers: Number of worker processes
+
+        Returns:
+            List of LandmarkResult objects (None for failed detections if skip_failed=True)
+        """
+        if num_workers <= 1 or len(images) <= 1 or not self.static_image_mode:
+            return self.detect_batch(
+                images,
+                return_world_landmarks=return_world_landmarks,
+                skip_failed=skip_failed,
+                num_workers=1
+            )
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(images)),
+            initializer=_worker_init,
+            initargs=(self._pose_kwargs(),)
+        ) as executor:
+            futures = [
+                executor.submit(_worker_detect, image, return_world_landmarks)
+                for image in images
+            ]
+            for future in futures:
+                try:
+                    arrays = future.result()
+                except Exception as e:
+                    if skip_failed:
+                        results.append(None)
+                        continue
                     raise RuntimeError(f"Landmark detection failed: {str(e)}") from e
+                results.append(None if arrays is None else _build_result(*arrays))
 
         return results
 
@@ -222,19 +428,42 @@ class LandmarkDetector:
         Raises:
             ValueError: If landmark name is invalid
         """
-        if name not in self.LANDMARK_NAMES:
+        idx = self.LANDMARK_INDEX.get(name)
+        if idx is None:
             raise ValueError(
                 f"Invalid landmark name: {name}. "
                 f"Valid names: {', '.join(self.LANDMARK_NAMES)}"
             )
 
-        idx = self.LANDMARK_NAMES.index(name)
         return (
             result.landmarks[idx],
             result.confidence[idx],
             result.visibility[idx]
         )
 
+    def filter_low_confidence_mask(
+        self,
+        result: LandmarkResult,
+        min_confidence: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Get a mask of landmarks meeting the confidence threshold.
+
+        Cheaper than filter_low_confidence when callers only need to select
+        valid rows, as the landmark array itself is not copied.
+
+        Args:
+            result: Input LandmarkResult
+            min_confidence: Minimum confidence threshold (uses detector default if None)
+
+        Returns:
+            Boolean array of shape (num_landmarks,), True for confident landmarks
+        """
+        if min_confidence is None:
+            min_confidence = self.min_detection_confidence
+
+        return result.confidence >= min_confidence
+
     def filter_low_confidence(
         self,
         result: LandmarkResult,
@@ -250,12 +479,8 @@ class LandmarkDetector:
         Returns:
             Filtered LandmarkResult with low-confidence landmarks set to NaN
         """
-        if min_confidence is None:
-            min_confidence = self.min_detection_confidence
-
-        filtered_landmarks = result.landmarks.copy()
-        mask = result.confidence < min_confidence
-        filtered_landmarks[mask] = np.nan
+        mask = self.filter_low_confidence_mask(result, min_confidence)
+        filtered_landmarks = np.where(mask[:, None], result.landmarks, np.float32(np.nan))
 
         return LandmarkResult(
             landmarks=filtered_landmarks,
@@ -285,14 +510,13 @@ class LandmarkDetector:
             return result.landmarks
 
         height, width = result.image_shape
-        pixel_coords = result.landmarks.copy()
-        pixel_coords[:, 0] *= width
-        pixel_coords[:, 1] *= height
-        # Z coordinate is already in world scale (meters)
-
-        return pixel_coords
+        # Scale x and y in a single broadcast multiply (which also allocates
+        # the output); Z coordinate is already in world scale (meters)
+        return result.landmarks * np.array([width, height, 1.0], dtype=np.float32)
 
     def __del__(self):
         """Cleanup MediaPipe resources."""
         if hasattr(self, 'pose'):
             self.pose.close()
+        for pose in getattr(self, '_worker_poses', []):
+            pose.close()
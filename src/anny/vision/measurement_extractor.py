@@ -2,16 +2,34 @@
 # Copyright (C) 2025 NAVER Corp.
 # Apache License, Version 2.0
 
+import math
+import operator
+import os
 import numpy as np
 import torch
-from typing import Dict, Optional, Tuple, List
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, ClassVar, Dict, Optional, Tuple, List
+from dataclasses import dataclass, field
 from .landmark_detector import LandmarkResult
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BodyMeasurements:
-    """Container for extracted body measurements."""
+    """
+    Container for extracted body measurements.
+
+    Instances are immutable, so derived views such as
+    MeasurementExtractor.to_dict can be computed once and cached on the
+    instance. Slotted: no per-instance __dict__, which matters when a video
+    produces thousands of these.
+    """
     height: Optional[float] = None  # Total height in meters
     shoulder_width: Optional[float] = None  # Shoulder span in meters
     waist_circumference: Optional[float] = None  # Waist circumference in meters
@@ -41,6 +59,418 @@ class BodyMeasurements:
     # Overall quality score
     overall_confidence: float = 0.0
 
+    # Memoized MeasurementExtractor.to_dict output
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_vector(self) -> np.ndarray:
+        """
+        Measurements as a float64 array in MEASUREMENT_FIELDS order.
+
+        Returns:
+            Array of shape (num_fields,), NaN where a measurement is None
+        """
+        return np.array(_get_measurements(self), dtype=np.float64)
+
+    def confidence_vector(self) -> np.ndarray:
+        """
+        Per-measurement confidences as a float64 array in MEASUREMENT_FIELDS order.
+
+        Returns:
+            Array of shape (num_fields,), 0 where no score is recorded
+        """
+        scores = self.confidence_scores
+        if not scores:
+            return np.zeros(len(MEASUREMENT_FIELDS))
+        return np.array([scores.get(name, 0.0) for name in MEASUREMENT_FIELDS])
+
+    @classmethod
+    def from_vector(
+        cls,
+        values,
+        confidences=None,
+        overall_confidence: float = 0.0
+    ) -> 'BodyMeasurements':
+        """
+        Inverse of to_vector / confidence_vector.
+
+        Args:
+            values: Measurements in MEASUREMENT_FIELDS order, NaN where unavailable
+            confidences: Matching confidences, or None for no confidence scores
+            overall_confidence: Overall quality score
+
+        Returns:
+            BodyMeasurements with None for every NaN value
+        """
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        if isinstance(confidences, np.ndarray):
+            confidences = confidences.tolist()
+        return cls(
+            **{
+                name: None if math.isnan(value) else value
+                for name, value in zip(MEASUREMENT_FIELDS, values)
+            },
+            confidence_scores=(
+                None if confidences is None else dict(zip(MEASUREMENT_FIELDS, confidences))
+            ),
+            overall_confidence=overall_confidence
+        )
+
+
+# Measurements produced by extract_all, in BodyMeasurementsBatch column order
+MEASUREMENT_FIELDS: Tuple[str, ...] = (
+    'height',
+    'shoulder_width',
+    'waist_circumference',
+    'hip_circumference',
+    'chest_circumference',
+    'left_arm_length',
+    'right_arm_length',
+    'left_leg_length',
+    'right_leg_length',
+    'torso_length',
+)
+_get_measurements = operator.attrgetter(*MEASUREMENT_FIELDS)
+
+
+@dataclass
+class BodyMeasurementsBatch:
+    """
+    Struct-of-arrays container for the measurements of many frames.
+
+    One row per frame and one column per entry of MEASUREMENT_FIELDS, so
+    downstream aggregation can work on whole columns without touching
+    per-frame Python objects.
+    """
+    values: np.ndarray  # Shape: (num_frames, num_fields) - meters, NaN where unavailable
+    confidences: np.ndarray  # Shape: (num_frames, num_fields) - 0 where unavailable
+    overall_confidence: np.ndarray  # Shape: (num_frames,)
+
+    FIELDS: ClassVar[Tuple[str, ...]] = MEASUREMENT_FIELDS
+    FIELD_INDEX: ClassVar[Dict[str, int]] = {name: i for i, name in enumerate(MEASUREMENT_FIELDS)}
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of one measurement across all frames (a view)."""
+        return self.values[:, self.FIELD_INDEX[name]]
+
+    def __getitem__(self, index: int) -> BodyMeasurements:
+        return self._row(
+            self.values[index].tolist(),
+            self.confidences[index].tolist(),
+            float(self.overall_confidence[index])
+        )
+
+    def to_list(self) -> List[BodyMeasurements]:
+        """Materialize one BodyMeasurements per frame."""
+        return [
+            self._row(values, confidences, overall)
+            for values, confidences, overall in zip(
+                self.values.tolist(), self.confidences.tolist(), self.overall_confidence.tolist()
+            )
+        ]
+
+    def _row(
+        self,
+        values: List[float],
+        confidences: List[float],
+        overall: float
+    ) -> BodyMeasurements:
+        return BodyMeasurements.from_vector(values, confidences, overall)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Columnar export, mirroring MeasurementExtractor.to_dict with one
+        array per measurement instead of one scalar.
+        """
+        return {
+            'measurements': {name: self.values[:, i] for i, name in enumerate(self.FIELDS)},
+            'confidence_scores': {
+                name: self.confidences[:, i] for i, name in enumerate(self.FIELDS)
+            },
+            'overall_confidence': self.overall_confidence
+        }
+
+
+# Landmark pairs whose distances feed extract_all, grouped by the segment
+# they measure. A group's distance is the sum over its pairs and it is valid
+# only if every landmark in it passes the confidence threshold.
+PAIR_TABLE: Dict[str, List[Tuple[int, int]]] = {
+    'shoulder_width': [(11, 12)],
+    'hip_width': [(23, 24)],
+    'left_arm_length': [(11, 13), (13, 15)],
+    'right_arm_length': [(12, 14), (14, 16)],
+    'left_leg_length': [(23, 25), (25, 27)],
+    'right_leg_length': [(24, 26), (26, 28)],
+    'left_torso_length': [(11, 23)],
+    'right_torso_length': [(12, 24)],
+}
+_PAIR_GROUPS = list(PAIR_TABLE)
+_GROUP = {name: i for i, name in enumerate(_PAIR_GROUPS)}
+
+# Flattened pair endpoints and the offset of each group's first pair
+_IDX_A = np.array([a for pairs in PAIR_TABLE.values() for a, _ in pairs], dtype=np.int32)
+_IDX_B = np.array([b for pairs in PAIR_TABLE.values() for _, b in pairs], dtype=np.int32)
+_GROUP_OFFSETS = np.cumsum([0] + [len(pairs) for pairs in PAIR_TABLE.values()][:-1])
+
+# Height candidates: nose to left heel, right heel, left ankle, right ankle.
+# Ankle estimates add the typical ankle-to-heel offset (≈5% of height) and
+# are trusted less.
+_HEIGHT_FOOT_IDX = np.array([29, 30, 27, 28], dtype=np.int32)
+_HEIGHT_SCALE = np.array([1.0, 1.0, 1.05, 1.05], dtype=np.float32)
+_HEIGHT_CONF_SCALE = np.array([1.0, 1.0, 0.9, 0.9], dtype=np.float32)
+
+# Circumferences are estimated from a width (PAIR_TABLE group) times an
+# anthropometric ratio; this is the group each one scales
+_CIRCUMFERENCE_FIELDS = ('waist_circumference', 'hip_circumference', 'chest_circumference')
+_CIRCUMFERENCE_GROUPS = np.array(
+    [_GROUP['hip_width'], _GROUP['hip_width'], _GROUP['shoulder_width']], dtype=np.int32
+)
+
+# Landmark indices used by the per-measurement extract_* methods
+_SHOULDER_IDX = np.array([11, 12], dtype=np.int32)
+_HIP_IDX = np.array([23, 24], dtype=np.int32)
+_ARM_L_IDX = np.array([11, 13, 15], dtype=np.int32)
+_ARM_R_IDX = np.array([12, 14, 16], dtype=np.int32)
+_LEG_L_IDX = np.array([23, 25, 27], dtype=np.int32)
+_LEG_R_IDX = np.array([24, 26, 28], dtype=np.int32)
+_TORSO_L_IDX = np.array([11, 23], dtype=np.int32)
+_TORSO_R_IDX = np.array([12, 24], dtype=np.int32)
+for _idx in (
+    _SHOULDER_IDX, _HIP_IDX, _ARM_L_IDX, _ARM_R_IDX,
+    _LEG_L_IDX, _LEG_R_IDX, _TORSO_L_IDX, _TORSO_R_IDX
+):
+    _idx.setflags(write=False)
+
+# Row g averages the confidence of the distinct landmarks in group g
+_GROUP_CONF_WEIGHTS = np.zeros((len(PAIR_TABLE), 33), dtype=np.float32)
+for _g, _pairs in enumerate(PAIR_TABLE.values()):
+    _landmarks = sorted({i for pair in _pairs for i in pair})
+    _GROUP_CONF_WEIGHTS[_g, _landmarks] = 1.0 / len(_landmarks)
+
+# The landmarks any measurement reads (nose first), and the tables above
+# remapped to positions in that set. extract_batch gathers these once per
+# batch so everything after works on a small contiguous block.
+_USED = np.unique(np.concatenate([[0], _IDX_A, _IDX_B, _HEIGHT_FOOT_IDX])).astype(np.int32)
+_USED_POS = np.full(33, -1, dtype=np.int32)
+_USED_POS[_USED] = np.arange(len(_USED), dtype=np.int32)
+_USED_IDX_A = _USED_POS[_IDX_A]
+_USED_IDX_B = _USED_POS[_IDX_B]
+_USED_FOOT_IDX = _USED_POS[_HEIGHT_FOOT_IDX]
+_USED_CONF_WEIGHTS = np.ascontiguousarray(_GROUP_CONF_WEIGHTS[:, _USED])
+
+
+def _segment_stats_numpy(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    valid: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    offsets: np.ndarray,
+    conf_weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group segment length, validity and confidence for PAIR_TABLE.
+
+    Returns:
+        Tuple of (lengths, valid flags, confidences), one entry per group
+    """
+    diff = coords[idx_a] - coords[idx_b]
+    distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    lengths = np.add.reduceat(distances, offsets)
+    group_valid = np.logical_and.reduceat(valid[idx_a] & valid[idx_b], offsets)
+    return lengths, group_valid, conf_weights @ confidence
+
+
+def _segment_stats_loop(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    valid: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    offsets: np.ndarray,
+    conf_weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Scalar-loop equivalent of _segment_stats_numpy, compiled with numba when available."""
+    n_groups = offsets.shape[0]
+    n_pairs = idx_a.shape[0]
+    lengths = np.zeros(n_groups)
+    group_valid = np.ones(n_groups, dtype=np.bool_)
+    group_conf = np.zeros(n_groups)
+
+    for g in range(n_groups):
+        end = offsets[g + 1] if g + 1 < n_groups else n_pairs
+        for p in range(offsets[g], end):
+            a = idx_a[p]
+            b = idx_b[p]
+            squared = 0.0
+            for k in range(coords.shape[1]):
+                delta = coords[a, k] - coords[b, k]
+                squared += delta * delta
+            lengths[g] += math.sqrt(squared)
+            if not (valid[a] and valid[b]):
+                group_valid[g] = False
+
+        weighted = 0.0
+        for i in range(conf_weights.shape[1]):
+            weighted += conf_weights[g, i] * confidence[i]
+        group_conf[g] = weighted
+
+    return lengths, group_valid, group_conf
+
+
+def _height_stats_numpy(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    valid: np.ndarray,
+    axis: int,
+    foot_idx: np.ndarray,
+    scale: np.ndarray,
+    conf_scale: np.ndarray
+) -> Tuple[float, float, bool]:
+    """
+    Confidence-weighted height over the nose-to-foot candidates.
+
+    Returns:
+        Tuple of (height, confidence, valid flag)
+    """
+    feet_valid = valid[foot_idx]
+    n_valid = np.count_nonzero(feet_valid)
+    if not (valid[0] and n_valid):
+        return 0.0, 0.0, False
+
+    # All candidates at once; invalid ones get zero weight (and are zeroed
+    # themselves, as their coordinates may be NaN)
+    deltas = np.abs(coords[0, axis] - coords[foot_idx, axis]) * scale
+    weights = 0.5 * (confidence[0] + confidence[foot_idx]) * conf_scale * feet_valid
+    deltas = np.where(feet_valid, deltas, 0.0)
+
+    weight_sum = weights.sum()
+    return float((deltas * weights).sum() / weight_sum), float(weight_sum / n_valid), True
+
+
+def _height_stats_loop(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    valid: np.ndarray,
+    axis: int,
+    foot_idx: np.ndarray,
+    scale: np.ndarray,
+    conf_scale: np.ndarray
+) -> Tuple[float, float, bool]:
+    """Scalar-loop equivalent of _height_stats_numpy, compiled with numba when available."""
+    if not valid[0]:
+        return 0.0, 0.0, False
+
+    weighted = 0.0
+    weight_sum = 0.0
+    n_valid = 0
+    for j in range(foot_idx.shape[0]):
+        f = foot_idx[j]
+        if valid[f]:
+            weight = 0.5 * (confidence[0] + confidence[f]) * conf_scale[j]
+            weighted += abs(coords[0, axis] - coords[f, axis]) * scale[j] * weight
+            weight_sum += weight
+            n_valid += 1
+
+    if n_valid == 0:
+        return 0.0, 0.0, False
+    return weighted / weight_sum, weight_sum / n_valid, True
+
+
+# A single compiled kernel call replaces a dozen small numpy dispatches per
+# frame; cache=True keeps the JIT cost to the first call ever
+if NUMBA_AVAILABLE:
+    _segment_stats = numba.njit(cache=True)(_segment_stats_loop)
+    _height_stats = numba.njit(cache=True)(_height_stats_loop)
+else:
+    _segment_stats = _segment_stats_numpy
+    _height_stats = _height_stats_numpy
+
+
+def _frame_stats_impl(
+    coords: np.ndarray,
+    confidence: np.ndarray,
+    valid: np.ndarray,
+    axis: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float, bool]:
+    """
+    Segment statistics and height for one frame in a single call.
+
+    Returns:
+        Tuple of (group lengths, group valid flags, group confidences,
+        height, height confidence, height valid flag)
+    """
+    lengths, group_valid, group_conf = _segment_stats(
+        coords, confidence, valid, _IDX_A, _IDX_B, _GROUP_OFFSETS, _GROUP_CONF_WEIGHTS
+    )
+    height, height_conf, height_valid = _height_stats(
+        coords, confidence, valid, axis, _HEIGHT_FOOT_IDX, _HEIGHT_SCALE, _HEIGHT_CONF_SCALE
+    )
+    return lengths, group_valid, group_conf, height, height_conf, height_valid
+
+
+# Compiled, the whole per-frame numeric part of extract_all runs without
+# returning to the interpreter
+_frame_stats = numba.njit(cache=True)(_frame_stats_impl) if NUMBA_AVAILABLE else _frame_stats_impl
+
+
+def _extract_torch_kernel(
+    coords: torch.Tensor,
+    confidence: torch.Tensor,
+    valid: torch.Tensor,
+    axis: int,
+    idx_a: torch.Tensor,
+    idx_b: torch.Tensor,
+    group_ids: torch.Tensor,
+    conf_weights: torch.Tensor,
+    foot_idx: torch.Tensor,
+    height_scale: torch.Tensor,
+    height_conf_scale: torch.Tensor
+) -> torch.Tensor:
+    """
+    Segment statistics and height for tensor landmarks, on their device.
+
+    Everything is packed into one tensor so the caller pays a single
+    device-to-host transfer.
+
+    Returns:
+        1-D tensor of [lengths (G), valid flags (G), confidences (G),
+        height, height confidence, height valid flag]
+    """
+    n_groups = conf_weights.shape[0]
+    coords = coords.to(torch.float32)
+    confidence = confidence.to(torch.float32)
+
+    distances = torch.linalg.vector_norm(coords[idx_a] - coords[idx_b], dim=1)
+    lengths = torch.zeros(n_groups, dtype=torch.float32, device=coords.device)
+    lengths = lengths.index_add(0, group_ids, distances)
+    invalid = (~(valid[idx_a] & valid[idx_b])).to(torch.float32)
+    group_invalid = torch.zeros(n_groups, dtype=torch.float32, device=coords.device)
+    group_invalid = group_invalid.index_add(0, group_ids, invalid)
+    group_conf = conf_weights @ confidence
+
+    feet_valid = valid[foot_idx]
+    n_valid = feet_valid.sum()
+    deltas = (coords[0, axis] - coords[foot_idx, axis]).abs() * height_scale
+    deltas = torch.where(feet_valid, deltas, torch.zeros_like(deltas))
+    weights = 0.5 * (confidence[0] + confidence[foot_idx]) * height_conf_scale * feet_valid
+    weight_sum = weights.sum()
+    height = (deltas * weights).sum() / weight_sum
+    height_conf = weight_sum / n_valid.clamp(min=1)
+    height_valid = (valid[0] & (n_valid > 0)).to(torch.float32)
+
+    return torch.cat([
+        lengths,
+        (group_invalid == 0).to(torch.float32),
+        group_conf,
+        torch.stack([height, height_conf, height_valid])
+    ])
+
 
 class MeasurementExtractor:
     """
@@ -57,11 +487,12 @@ class MeasurementExtractor:
     """
 
     # Anthropometric ratios for circumference estimation
-    # Based on typical human body proportions
+    # Based on typical human body proportions; float32 like the landmarks so
+    # scaling does not promote measurements to float64
     CIRCUMFERENCE_RATIOS = {
-        'waist': 2.5,  # waist_width * ratio ≈ circumference
-        'hip': 2.8,
-        'chest': 2.9
+        'waist': np.float32(2.5),  # waist_width * ratio ≈ circumference
+        'hip': np.float32(2.8),
+        'chest': np.float32(2.9)
     }
 
     def __init__(
@@ -81,6 +512,15 @@ class MeasurementExtractor:
         self.use_world_landmarks = use_world_landmarks
         self.min_confidence = min_confidence
         self.device = device
+        # Width-to-circumference factors, in _CIRCUMFERENCE_FIELDS order
+        # (waist is taken as 0.9x the hip width)
+        self._circumference_scale = np.array([
+            0.9 * self.CIRCUMFERENCE_RATIOS['waist'],
+            self.CIRCUMFERENCE_RATIOS['hip'],
+            self.CIRCUMFERENCE_RATIOS['chest']
+        ], dtype=np.float32)
+        # Index/coefficient tables for tensor input, cached per device
+        self._torch_tables: Dict[torch.device, Tuple[torch.Tensor, ...]] = {}
 
     def _euclidean_distance(
         self,
@@ -88,7 +528,9 @@ class MeasurementExtractor:
         point2: np.ndarray
     ) -> float:
         """Calculate Euclidean distance between two points."""
-        return float(np.linalg.norm(point1 - point2))
+        # Plain scalar math: for 2-3 element vectors np.linalg.norm is
+        # dominated by dispatch overhead
+        return math.hypot(*(point1 - point2).tolist())
 
     def _get_landmark_coords(
         self,
@@ -115,6 +557,32 @@ class MeasurementExtractor:
         else:
             return result.landmarks[index]
 
+    def _prepare(
+        self,
+        result: LandmarkResult
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+        """
+        Select the coordinate frame and confidence mask for a result once.
+
+        Args:
+            result: LandmarkResult object
+
+        Returns:
+            Tuple of (coords, confidence, valid mask, use_world), where coords
+            are world coordinates if used and valid marks landmarks at or above
+            min_confidence
+        """
+        use_world = self.use_world_landmarks and result.world_landmarks is not None
+        coords = result.world_landmarks if use_world else result.landmarks
+        confidence = result.confidence
+        if not isinstance(coords, torch.Tensor):
+            # MediaPipe landmarks are float32; keep the math there (no copy
+            # when they already are)
+            coords = np.asarray(coords, dtype=np.float32)
+            confidence = np.asarray(confidence, dtype=np.float32)
+        valid = confidence >= self.min_confidence
+        return coords, confidence, valid, use_world
+
     def extract_height(self, result: LandmarkResult) -> Tuple[Optional[float], float]:
         """
         Extract height from landmarks.
@@ -130,51 +598,27 @@ class MeasurementExtractor:
         Returns:
             Tuple of (height in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
-
-        # Get head and foot landmarks
-        nose = self._get_landmark_coords(result, 0, use_world)  # Nose
-        left_heel = self._get_landmark_coords(result, 29, use_world)
-        right_heel = self._get_landmark_coords(result, 30, use_world)
-        left_ankle = self._get_landmark_coords(result, 27, use_world)
-        right_ankle = self._get_landmark_coords(result, 28, use_world)
-
-        if nose is None:
-            return None, 0.0
+        return self._extract_height(*self._prepare(result))
 
-        heights = []
-        confidences = []
-
-        # Method 1: Nose to heel (most accurate)
-        if left_heel is not None:
-            heights.append(abs(nose[2] - left_heel[2]) if use_world else abs(nose[1] - left_heel[1]))
-            confidences.append(result.confidence[[0, 29]].mean())
-        if right_heel is not None:
-            heights.append(abs(nose[2] - right_heel[2]) if use_world else abs(nose[1] - right_heel[1]))
-            confidences.append(result.confidence[[0, 30]].mean())
-
-        # Method 2: Nose to ankle (fallback)
-        if left_ankle is not None:
-            # Add typical ankle-to-heel offset (≈5% of height)
-            ankle_height = abs(nose[2] - left_ankle[2]) if use_world else abs(nose[1] - left_ankle[1])
-            heights.append(ankle_height * 1.05)
-            confidences.append(result.confidence[[0, 27]].mean() * 0.9)
-        if right_ankle is not None:
-            ankle_height = abs(nose[2] - right_ankle[2]) if use_world else abs(nose[1] - right_ankle[1])
-            heights.append(ankle_height * 1.05)
-            confidences.append(result.confidence[[0, 28]].mean() * 0.9)
-
-        if not heights:
+    def _extract_height(
+        self,
+        coords: np.ndarray,
+        confidence: np.ndarray,
+        valid: np.ndarray,
+        use_world: bool
+    ) -> Tuple[Optional[float], float]:
+        """Height from prepared coordinates (see extract_height)."""
+        if isinstance(coords, torch.Tensor):
+            # The compiled kernel only types numpy arrays; tensors use the
+            # same device-side kernel as extract_all, keeping only the height
+            return self._extract_torch(coords, confidence, valid, use_world)[3]
+        height, height_conf, height_valid = _height_stats(
+            coords, confidence, valid, 2 if use_world else 1,
+            _HEIGHT_FOOT_IDX, _HEIGHT_SCALE, _HEIGHT_CONF_SCALE
+        )
+        if not height_valid:
             return None, 0.0
-
-        # Weighted average based on confidence
-        confidences = np.array(confidences)
-        heights = np.array(heights)
-
-        weighted_height = np.average(heights, weights=confidences)
-        avg_confidence = float(confidences.mean())
-
-        return float(weighted_height), avg_confidence
+        return float(height), float(height_conf)
 
     def extract_shoulder_width(self, result: LandmarkResult) -> Tuple[Optional[float], float]:
         """
@@ -186,18 +630,13 @@ class MeasurementExtractor:
         Returns:
             Tuple of (shoulder width in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
+        coords, confidence, valid, _ = self._prepare(result)
 
-        left_shoulder = self._get_landmark_coords(result, 11, use_world)
-        right_shoulder = self._get_landmark_coords(result, 12, use_world)
-
-        if left_shoulder is None or right_shoulder is None:
+        if not valid[_SHOULDER_IDX].all():
             return None, 0.0
 
-        width = self._euclidean_distance(left_shoulder, right_shoulder)
-        confidence = float(result.confidence[[11, 12]].mean())
-
-        return width, confidence
+        width = self._euclidean_distance(coords[11], coords[12])
+        return width, float(confidence[_SHOULDER_IDX].mean())
 
     def extract_waist_circumference(self, result: LandmarkResult) -> Tuple[Optional[float], float]:
         """
@@ -213,22 +652,19 @@ class MeasurementExtractor:
         Returns:
             Tuple of (waist circumference in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
+        coords, confidence, valid, _ = self._prepare(result)
 
-        left_hip = self._get_landmark_coords(result, 23, use_world)
-        right_hip = self._get_landmark_coords(result, 24, use_world)
-
-        if left_hip is None or right_hip is None:
+        if not valid[_HIP_IDX].all():
             return None, 0.0
 
-        hip_width = self._euclidean_distance(left_hip, right_hip)
+        hip_width = self._euclidean_distance(coords[23], coords[24])
 
         # Estimate circumference using anthropometric ratio
         # Waist is typically narrower than hips (0.85-0.95 ratio)
         waist_width = hip_width * 0.9
-        circumference = waist_width * self.CIRCUMFERENCE_RATIOS['waist']
+        circumference = float(waist_width * self.CIRCUMFERENCE_RATIOS['waist'])
 
-        confidence = float(result.confidence[[23, 24]].mean() * 0.7)  # Lower confidence for estimation
+        confidence = float(confidence[_HIP_IDX].mean() * 0.7)  # Lower confidence for estimation
 
         return circumference, confidence
 
@@ -242,20 +678,15 @@ class MeasurementExtractor:
         Returns:
             Tuple of (hip circumference in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
+        coords, confidence, valid, _ = self._prepare(result)
 
-        left_hip = self._get_landmark_coords(result, 23, use_world)
-        right_hip = self._get_landmark_coords(result, 24, use_world)
-
-        if left_hip is None or right_hip is None:
+        if not valid[_HIP_IDX].all():
             return None, 0.0
 
-        hip_width = self._euclidean_distance(left_hip, right_hip)
-        circumference = hip_width * self.CIRCUMFERENCE_RATIOS['hip']
-
-        confidence = float(result.confidence[[23, 24]].mean() * 0.7)
+        hip_width = self._euclidean_distance(coords[23], coords[24])
+        circumference = float(hip_width * self.CIRCUMFERENCE_RATIOS['hip'])
 
-        return circumference, confidence
+        return circumference, float(confidence[_HIP_IDX].mean() * 0.7)
 
     def extract_chest_circumference(self, result: LandmarkResult) -> Tuple[Optional[float], float]:
         """
@@ -267,20 +698,15 @@ class MeasurementExtractor:
         Returns:
             Tuple of (chest circumference in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
-
-        left_shoulder = self._get_landmark_coords(result, 11, use_world)
-        right_shoulder = self._get_landmark_coords(result, 12, use_world)
+        coords, confidence, valid, _ = self._prepare(result)
 
-        if left_shoulder is None or right_shoulder is None:
+        if not valid[_SHOULDER_IDX].all():
             return None, 0.0
 
-        shoulder_width = self._euclidean_distance(left_shoulder, right_shoulder)
-        circumference = shoulder_width * self.CIRCUMFERENCE_RATIOS['chest']
+        shoulder_width = self._euclidean_distance(coords[11], coords[12])
+        circumference = float(shoulder_width * self.CIRCUMFERENCE_RATIOS['chest'])
 
-        confidence = float(result.confidence[[11, 12]].mean() * 0.7)
-
-        return circumference, confidence
+        return circumference, float(confidence[_SHOULDER_IDX].mean() * 0.7)
 
     def extract_arm_length(
         self,
@@ -297,27 +723,8 @@ class MeasurementExtractor:
         Returns:
             Tuple of (arm length in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
-
-        if side == 'left':
-            shoulder_idx, elbow_idx, wrist_idx = 11, 13, 15
-        else:
-            shoulder_idx, elbow_idx, wrist_idx = 12, 14, 16
-
-        shoulder = self._get_landmark_coords(result, shoulder_idx, use_world)
-        elbow = self._get_landmark_coords(result, elbow_idx, use_world)
-        wrist = self._get_landmark_coords(result, wrist_idx, use_world)
-
-        if shoulder is None or elbow is None or wrist is None:
-            return None, 0.0
-
-        upper_arm = self._euclidean_distance(shoulder, elbow)
-        forearm = self._euclidean_distance(elbow, wrist)
-        total_length = upper_arm + forearm
-
-        confidence = float(result.confidence[[shoulder_idx, elbow_idx, wrist_idx]].mean())
-
-        return total_length, confidence
+        indices = _ARM_L_IDX if side == 'left' else _ARM_R_IDX
+        return self._extract_limb_length(*self._prepare(result)[:3], indices)
 
     def extract_leg_length(
         self,
@@ -334,27 +741,27 @@ class MeasurementExtractor:
         Returns:
             Tuple of (leg length in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
-
-        if side == 'left':
-            hip_idx, knee_idx, ankle_idx = 23, 25, 27
-        else:
-            hip_idx, knee_idx, ankle_idx = 24, 26, 28
-
-        hip = self._get_landmark_coords(result, hip_idx, use_world)
-        knee = self._get_landmark_coords(result, knee_idx, use_world)
-        ankle = self._get_landmark_coords(result, ankle_idx, use_world)
+        indices = _LEG_L_IDX if side == 'left' else _LEG_R_IDX
+        return self._extract_limb_length(*self._prepare(result)[:3], indices)
 
-        if hip is None or knee is None or ankle is None:
+    def _extract_limb_length(
+        self,
+        coords: np.ndarray,
+        confidence: np.ndarray,
+        valid: np.ndarray,
+        indices: np.ndarray
+    ) -> Tuple[Optional[float], float]:
+        """Length of the two-segment limb through the given (proximal, joint, distal) landmarks."""
+        if not valid[indices].all():
             return None, 0.0
 
-        thigh = self._euclidean_distance(hip, knee)
-        shin = self._euclidean_distance(knee, ankle)
-        total_length = thigh + shin
-
-        confidence = float(result.confidence[[hip_idx, knee_idx, ankle_idx]].mean())
+        proximal, joint, distal = indices
+        total_length = (
+            self._euclidean_distance(coords[proximal], coords[joint])
+            + self._euclidean_distance(coords[joint], coords[distal])
+        )
 
-        return total_length, confidence
+        return total_length, float(confidence[indices].mean())
 
     def extract_torso_length(self, result: LandmarkResult) -> Tuple[Optional[float], float]:
         """
@@ -366,29 +773,24 @@ class MeasurementExtractor:
         Returns:
             Tuple of (torso length in meters, confidence score)
         """
-        use_world = self.use_world_landmarks and result.world_landmarks is not None
-
-        left_shoulder = self._get_landmark_coords(result, 11, use_world)
-        right_shoulder = self._get_landmark_coords(result, 12, use_world)
-        left_hip = self._get_landmark_coords(result, 23, use_world)
-        right_hip = self._get_landmark_coords(result, 24, use_world)
+        coords, confidence, valid, _ = self._prepare(result)
 
         lengths = []
         confidences = []
 
-        if left_shoulder is not None and left_hip is not None:
-            lengths.append(self._euclidean_distance(left_shoulder, left_hip))
-            confidences.append(result.confidence[[11, 23]].mean())
+        if valid[_TORSO_L_IDX].all():
+            lengths.append(self._euclidean_distance(coords[11], coords[23]))
+            confidences.append(confidence[_TORSO_L_IDX].mean())
 
-        if right_shoulder is not None and right_hip is not None:
-            lengths.append(self._euclidean_distance(right_shoulder, right_hip))
-            confidences.append(result.confidence[[12, 24]].mean())
+        if valid[_TORSO_R_IDX].all():
+            lengths.append(self._euclidean_distance(coords[12], coords[24]))
+            confidences.append(confidence[_TORSO_R_IDX].mean())
 
         if not lengths:
             return None, 0.0
 
-        avg_length = float(np.mean(lengths))
-        avg_confidence = float(np.mean(confidences))
+        avg_length = float(sum(lengths) / len(lengths))
+        avg_confidence = float(sum(confidences) / len(confidences))
 
         return avg_length, avg_confidence
 
@@ -396,91 +798,322 @@ class MeasurementExtractor:
         """
         Extract all available body measurements.
 
+        All segment distances are computed in one vectorized pass over
+        PAIR_TABLE rather than through the per-measurement extractors.
+
         Args:
             result: LandmarkResult object
 
         Returns:
             BodyMeasurements object with all extracted measurements
         """
-        measurements = BodyMeasurements()
+        coords, confidence, valid, use_world = self._prepare(result)
+
+        if isinstance(coords, torch.Tensor):
+            # Landmarks already on a device: compute there, transfer once
+            group_lengths, group_valid, group_conf, (height, height_conf) = (
+                self._extract_torch(coords, confidence, valid, use_world)
+            )
+        else:
+            # Every pair distance, per-group sums, validity and confidence,
+            # and height in one kernel call
+            group_lengths, group_valid, group_conf, height, height_conf, height_valid = (
+                _frame_stats(coords, confidence, valid, 2 if use_world else 1)
+            )
+            if height_valid:
+                height, height_conf = float(height), float(height_conf)
+            else:
+                height, height_conf = None, 0.0
+
+        return self._assemble(group_lengths, group_valid, group_conf, height, height_conf)
+
+    def _assemble(
+        self,
+        group_lengths: np.ndarray,
+        group_valid: np.ndarray,
+        group_conf: np.ndarray,
+        height: Optional[float],
+        height_conf: float
+    ) -> BodyMeasurements:
+        """
+        Build BodyMeasurements from per-group segment statistics and height.
+
+        Scalar counterpart of _measurement_columns, which is cheaper per
+        frame than going through a one-row batch.
+        """
+        def group(name: str) -> Tuple[Optional[float], float]:
+            g = _GROUP[name]
+            if not group_valid[g]:
+                return None, 0.0
+            return float(group_lengths[g]), float(group_conf[g])
+
+        values = {}
         confidence_scores = {}
 
-        # Extract each measurement
-        height, conf = self.extract_height(result)
-        measurements.height = height
-        confidence_scores['height'] = conf
+        values['height'] = height
+        confidence_scores['height'] = height_conf
+
+        values['shoulder_width'], confidence_scores['shoulder_width'] = group('shoulder_width')
+
+        # Circumferences are estimated from widths via anthropometric ratios,
+        # with lower confidence; all three in one multiply
+        circumferences = (group_lengths[_CIRCUMFERENCE_GROUPS] * self._circumference_scale).tolist()
+        circumference_conf = (group_conf[_CIRCUMFERENCE_GROUPS] * 0.7).tolist()
+        for name, g, circumference, conf in zip(
+            _CIRCUMFERENCE_FIELDS, _CIRCUMFERENCE_GROUPS, circumferences, circumference_conf
+        ):
+            valid = group_valid[g]
+            values[name] = circumference if valid else None
+            confidence_scores[name] = conf if valid else 0.0
+
+        for name in ('left_arm_length', 'right_arm_length', 'left_leg_length', 'right_leg_length'):
+            values[name], confidence_scores[name] = group(name)
+
+        # Torso length averages whichever sides are valid
+        sides = [_GROUP['left_torso_length'], _GROUP['right_torso_length']]
+        sides = [g for g in sides if group_valid[g]]
+        if sides:
+            values['torso_length'] = float(group_lengths[sides].mean())
+            confidence_scores['torso_length'] = float(group_conf[sides].mean())
+        else:
+            confidence_scores['torso_length'] = 0.0
 
-        shoulder_width, conf = self.extract_shoulder_width(result)
-        measurements.shoulder_width = shoulder_width
-        confidence_scores['shoulder_width'] = conf
+        # Calculate overall confidence; for ten scalars a plain sum beats
+        # building an array (the batch path reduces whole columns instead)
+        valid_confidences = [c for c in confidence_scores.values() if c > 0]
+        overall_confidence = (
+            sum(valid_confidences) / len(valid_confidences) if valid_confidences else 0.0
+        )
 
-        waist, conf = self.extract_waist_circumference(result)
-        measurements.waist_circumference = waist
-        confidence_scores['waist_circumference'] = conf
+        return BodyMeasurements(
+            **values,
+            confidence_scores=confidence_scores,
+            overall_confidence=overall_confidence
+        )
 
-        hip, conf = self.extract_hip_circumference(result)
-        measurements.hip_circumference = hip
-        confidence_scores['hip_circumference'] = conf
+    def _extract_torch(
+        self,
+        coords: torch.Tensor,
+        confidence: torch.Tensor,
+        valid: torch.Tensor,
+        use_world: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[Optional[float], float]]:
+        """
+        Run the extraction kernel on tensor landmarks.
 
-        chest, conf = self.extract_chest_circumference(result)
-        measurements.chest_circumference = chest
-        confidence_scores['chest_circumference'] = conf
+        Returns:
+            Tuple of (group lengths, group valid flags, group confidences,
+            (height, height confidence)) as host values
+        """
+        device = coords.device
+        tables = self._torch_tables.get(device)
+        if tables is None:
+            group_ids = np.repeat(
+                np.arange(len(PAIR_TABLE)), [len(pairs) for pairs in PAIR_TABLE.values()]
+            )
+            tables = tuple(
+                torch.as_tensor(array, device=device)
+                for array in (
+                    _IDX_A.astype(np.int64), _IDX_B.astype(np.int64), group_ids,
+                    _GROUP_CONF_WEIGHTS,
+                    _HEIGHT_FOOT_IDX.astype(np.int64), _HEIGHT_SCALE, _HEIGHT_CONF_SCALE
+                )
+            )
+            self._torch_tables[device] = tables
+
+        valid = torch.as_tensor(valid, device=device)
+        packed = _extract_torch_kernel(
+            coords, torch.as_tensor(confidence, device=device), valid,
+            2 if use_world else 1, *tables
+        ).cpu().numpy()
+
+        n_groups = len(PAIR_TABLE)
+        group_lengths = packed[:n_groups]
+        group_valid = packed[n_groups:2 * n_groups].astype(bool)
+        group_conf = packed[2 * n_groups:3 * n_groups]
+        height, height_conf, height_valid = packed[3 * n_groups:]
+        if not height_valid:
+            return group_lengths, group_valid, group_conf, (None, 0.0)
+        return group_lengths, group_valid, group_conf, (float(height), float(height_conf))
+
+    def extract_all_batch(self, results: List[LandmarkResult]) -> List[BodyMeasurements]:
+        """
+        Extract all available body measurements for a batch of detections.
 
-        # Arm lengths
-        left_arm, conf = self.extract_arm_length(result, 'left')
-        measurements.left_arm_length = left_arm
-        confidence_scores['left_arm_length'] = conf
+        Landmarks from all frames are stacked so that every distance,
+        validity and confidence reduction runs once over the whole batch;
+        only the final BodyMeasurements assembly loops over frames.
 
-        right_arm, conf = self.extract_arm_length(result, 'right')
-        measurements.right_arm_length = right_arm
-        confidence_scores['right_arm_length'] = conf
+        Args:
+            results: List of LandmarkResult objects (e.g. the successful
+                entries returned by LandmarkDetector.detect_batch)
 
-        # Leg lengths
-        left_leg, conf = self.extract_leg_length(result, 'left')
-        measurements.left_leg_length = left_leg
-        confidence_scores['left_leg_length'] = conf
+        Returns:
+            List of BodyMeasurements objects, in the same order as ``results``
+        """
+        if any(isinstance(result.confidence, torch.Tensor) for result in results):
+            return [self.extract_all(result) for result in results]
+        return self.extract_batch(results).to_list()
 
-        right_leg, conf = self.extract_leg_length(result, 'right')
-        measurements.right_leg_length = right_leg
-        confidence_scores['right_leg_length'] = conf
+    def extract_batch(self, results: List[LandmarkResult]) -> BodyMeasurementsBatch:
+        """
+        Extract all available body measurements for a batch of detections
+        into struct-of-arrays form.
 
-        # Torso length
-        torso, conf = self.extract_torso_length(result)
-        measurements.torso_length = torso
-        confidence_scores['torso_length'] = conf
+        Args:
+            results: List of LandmarkResult objects with numpy landmarks
 
-        # Calculate overall confidence
-        valid_confidences = [c for c in confidence_scores.values() if c > 0]
-        measurements.overall_confidence = (
-            float(np.mean(valid_confidences)) if valid_confidences else 0.0
+        Returns:
+            BodyMeasurementsBatch with one row per result
+        """
+        if not results:
+            empty = np.empty((0, len(MEASUREMENT_FIELDS)), dtype=np.float32)
+            return BodyMeasurementsBatch(
+                values=empty,
+                confidences=empty.copy(),
+                overall_confidence=np.empty(0, dtype=np.float32)
+            )
+
+        prepared = [self._prepare(result) for result in results]
+
+        # One gather of the landmarks measurements actually use, and one
+        # confidence check over them
+        coords = np.take(np.stack([p[0] for p in prepared]), _USED, axis=1)  # (F, U, 3)
+        confidence = np.take(np.stack([p[1] for p in prepared]), _USED, axis=1)  # (F, U)
+        valid = confidence >= self.min_confidence
+        use_world = np.array([p[3] for p in prepared])
+
+        # Segment statistics for every frame at once
+        diff = coords[:, _USED_IDX_A] - coords[:, _USED_IDX_B]
+        distances = np.sqrt(np.einsum('fpk,fpk->fp', diff, diff))
+        group_lengths = np.add.reduceat(distances, _GROUP_OFFSETS, axis=1)
+        group_valid = np.logical_and.reduceat(
+            valid[:, _USED_IDX_A] & valid[:, _USED_IDX_B], _GROUP_OFFSETS, axis=1
+        )
+        group_conf = confidence @ _USED_CONF_WEIGHTS.T
+
+        # Height candidates along each frame's vertical axis (see _height_stats_numpy);
+        # the nose is position 0 of _USED
+        vertical = np.where(use_world[:, None], coords[:, :, 2], coords[:, :, 1])
+        feet_valid = valid[:, _USED_FOOT_IDX]
+        n_valid = np.count_nonzero(feet_valid, axis=1)
+        deltas = np.abs(vertical[:, :1] - vertical[:, _USED_FOOT_IDX]) * _HEIGHT_SCALE
+        deltas = np.where(feet_valid, deltas, 0.0)
+        weights = (
+            0.5 * (confidence[:, :1] + confidence[:, _USED_FOOT_IDX])
+            * _HEIGHT_CONF_SCALE * feet_valid
+        )
+        weight_sum = weights.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            heights = (deltas * weights).sum(axis=1) / weight_sum
+        height_conf = weight_sum / np.maximum(n_valid, 1)
+        height_valid = valid[:, 0] & (n_valid > 0)
+
+        return self._measurement_columns(
+            group_lengths, group_valid, group_conf, heights, height_conf, height_valid
         )
-        measurements.confidence_scores = confidence_scores
 
-        return measurements
+    def _measurement_columns(
+        self,
+        group_lengths: np.ndarray,
+        group_valid: np.ndarray,
+        group_conf: np.ndarray,
+        heights: np.ndarray,
+        height_conf: np.ndarray,
+        height_valid: np.ndarray
+    ) -> BodyMeasurementsBatch:
+        """Turn (F, G) segment statistics and per-frame height into measurement columns."""
+        num_frames = group_lengths.shape[0]
+        values = np.empty((num_frames, len(MEASUREMENT_FIELDS)), dtype=np.float32)
+        conf = np.empty((num_frames, len(MEASUREMENT_FIELDS)), dtype=np.float32)
+        index = BodyMeasurementsBatch.FIELD_INDEX
+
+        def put(field: str, valid: np.ndarray, value: np.ndarray, confidence: np.ndarray) -> None:
+            values[:, index[field]] = np.where(valid, value, np.nan)
+            conf[:, index[field]] = np.where(valid, confidence, 0.0)
+
+        def put_group(field: str, name: str) -> None:
+            g = _GROUP[name]
+            put(field, group_valid[:, g], group_lengths[:, g], group_conf[:, g])
+
+        put('height', height_valid, heights, height_conf)
+        put_group('shoulder_width', 'shoulder_width')
+        circumferences = group_lengths[:, _CIRCUMFERENCE_GROUPS] * self._circumference_scale
+        circumference_conf = group_conf[:, _CIRCUMFERENCE_GROUPS] * 0.7
+        for j, (name, g) in enumerate(zip(_CIRCUMFERENCE_FIELDS, _CIRCUMFERENCE_GROUPS)):
+            put(name, group_valid[:, g], circumferences[:, j], circumference_conf[:, j])
+        for name in ('left_arm_length', 'right_arm_length', 'left_leg_length', 'right_leg_length'):
+            put_group(name, name)
+
+        # Torso length averages whichever sides are valid
+        sides = [_GROUP['left_torso_length'], _GROUP['right_torso_length']]
+        side_valid = group_valid[:, sides]
+        n_sides = side_valid.sum(axis=1)
+        with np.errstate(invalid='ignore'):
+            torso = np.where(side_valid, group_lengths[:, sides], 0.0).sum(axis=1) / n_sides
+            torso_conf = np.where(side_valid, group_conf[:, sides], 0.0).sum(axis=1) / n_sides
+        put('torso_length', n_sides > 0, torso, torso_conf)
+
+        # Overall confidence: mean of the non-zero measurement confidences
+        positive = conf > 0
+        n_positive = positive.sum(axis=1)
+        overall = np.where(positive, conf, 0.0).sum(axis=1) / np.maximum(n_positive, 1)
+
+        return BodyMeasurementsBatch(values=values, confidences=conf, overall_confidence=overall)
+
+    def extract_all_parallel(
+        self,
+        results: List[LandmarkResult],
+        num_workers: Optional[int] = None
+    ) -> List[BodyMeasurements]:
+        """
+        Extract measurements for a large set of detections using a process pool.
+
+        The results are split into one contiguous chunk per worker and each
+        worker runs extract_all_batch on its chunk. Worth it for offline,
+        directory-scale workloads; for small batches extract_all_batch alone
+        is faster than starting the pool.
+
+        Args:
+            results: List of LandmarkResult objects
+            num_workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            List of BodyMeasurements objects, in the same order as ``results``
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, len(results))
+
+        if num_workers <= 1:
+            return self.extract_all_batch(results)
+
+        bounds = np.linspace(0, len(results), num_workers + 1).astype(int)
+        chunks = [results[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            chunk_measurements = executor.map(self.extract_all_batch, chunks)
+            return [m for chunk in chunk_measurements for m in chunk]
 
     def to_dict(self, measurements: BodyMeasurements) -> Dict[str, any]:
         """
         Convert measurements to dictionary format.
 
+        The result is built once per BodyMeasurements instance and reused on
+        later calls; treat it as read-only.
+
         Args:
             measurements: BodyMeasurements object
 
         Returns:
             Dictionary with all measurements and confidence scores
         """
-        return {
-            'measurements': {
-                'height': measurements.height,
-                'shoulder_width': measurements.shoulder_width,
-                'waist_circumference': measurements.waist_circumference,
-                'hip_circumference': measurements.hip_circumference,
-                'chest_circumference': measurements.chest_circumference,
-                'left_arm_length': measurements.left_arm_length,
-                'right_arm_length': measurements.right_arm_length,
-                'left_leg_length': measurements.left_leg_length,
-                'right_leg_length': measurements.right_leg_length,
-                'torso_length': measurements.torso_length
-            },
-            'confidence_scores': measurements.confidence_scores,
-            'overall_confidence': measurements.overall_confidence
-        }
+        cached = measurements._dict_cache
+        if cached is None:
+            cached = {
+                'measurements': {name: getattr(measurements, name) for name in MEASUREMENT_FIELDS},
+                'confidence_scores': measurements.confidence_scores,
+                'overall_confidence': measurements.overall_confidence
+            }
+            object.__setattr__(measurements, '_dict_cache', cached)
+        return cached
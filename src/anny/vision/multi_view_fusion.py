@@ -2,11 +2,27 @@
 # Copyright (C) 2025 NAVER Corp.
 # Apache License, Version 2.0
 
+import math
+import operator
 import numpy as np
 from typing import List, Optional, Dict
 from dataclasses import dataclass
 from .landmark_detector import LandmarkResult
-from .measurement_extractor import BodyMeasurements, MeasurementExtractor
+from .measurement_extractor import BodyMeasurements, MeasurementExtractor, MEASUREMENT_FIELDS
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+# View count from which fuse_from_landmarks extracts all views in one
+# batched call rather than per view
+BATCH_EXTRACT_MIN_VIEWS = 8
+
+# Stand-in for a missing confidence_scores dict (read-only by convention)
+_EMPTY: Dict[str, float] = {}
 
 
 @dataclass
@@ -19,6 +35,166 @@ class FusedMeasurements:
     measurement_variance: Dict[str, float]  # Variance across views for each measurement
 
 
+def _valid_views(values: np.ndarray, confidences: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Usable views (finite value, positive confidence) and their count, along the last axis."""
+    valid_mask = ~np.isnan(values) & (confidences > 0)
+    return valid_mask, valid_mask.sum(axis=-1)
+
+
+def _masked_median(values: np.ndarray, valid_mask: np.ndarray, n_valid: np.ndarray) -> np.ndarray:
+    """Median of the valid entries along the last axis (NaN where there are none)."""
+    # NaN sorts last, so the valid entries of each row come first. One sort
+    # for all rows; np.nanmedian along the same axis is several times slower
+    # on these small (fields, views) matrices
+    ordered = np.sort(np.where(valid_mask, values, np.nan), axis=-1)
+    lower = np.take_along_axis(ordered, np.maximum(n_valid - 1, 0)[..., None] // 2, axis=-1)
+    upper = np.take_along_axis(ordered, (n_valid // 2)[..., None], axis=-1)
+    median = ((lower + upper) / 2)[..., 0]
+    return np.where(n_valid > 0, median, np.nan)
+
+
+def _masked_var(values: np.ndarray, valid_mask: np.ndarray, n_valid: np.ndarray) -> np.ndarray:
+    """Population variance of the valid entries along the last axis (NaN where there are none)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(valid_mask, values, 0.0).sum(axis=-1) / n_valid
+        deviation = np.where(valid_mask, values - mean[..., None], 0.0)
+        return (deviation * deviation).sum(axis=-1) / n_valid
+
+
+def _reject_outliers_numpy(
+    values: np.ndarray,
+    confidences: np.ndarray,
+    threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    MAD outlier rejection for each row of (num_rows, num_views) arrays.
+
+    Rows with fewer than 3 non-NaN values are left unchanged. Rows whose
+    MAD is zero (most views identical) fall back to plain Z-scores around
+    the median, so a lone deviating view is still rejected.
+
+    Returns:
+        Tuple of (filtered values, filtered confidences) as new arrays
+    """
+    valid_mask = ~np.isnan(values)
+    n_valid = valid_mask.sum(axis=-1)
+
+    median = _masked_median(values, valid_mask, n_valid)
+    deviation = np.abs(values - median[..., None])
+    mad = _masked_median(deviation, valid_mask, n_valid)  # Median Absolute Deviation
+
+    std = np.sqrt(_masked_var(values, valid_mask, n_valid))
+
+    # Modified Z-score (more robust than standard deviation), or the plain
+    # Z-score where the MAD has collapsed to zero
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_scores = np.where(
+            (mad > 0)[..., None],
+            0.6745 * deviation / mad[..., None],
+            deviation / std[..., None]
+        )
+    checked = ((n_valid >= 3) & ((mad > 0) | (std > 0)))[..., None]
+    outliers = valid_mask & checked & (z_scores > threshold)
+
+    return np.where(outliers, np.nan, values), np.where(outliers, 0.0, confidences)
+
+
+def _reject_outliers_loop(
+    values: np.ndarray,
+    confidences: np.ndarray,
+    threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scalar-loop equivalent of _reject_outliers_numpy, compiled with numba when available."""
+    filtered_values = values.copy()
+    filtered_confidences = confidences.copy()
+    num_views = values.shape[1]
+    ordered = np.empty(num_views)
+    deviations = np.empty(num_views)
+
+    for r in range(values.shape[0]):
+        # Insertion-sort the valid values: a handful of views at most
+        n = 0
+        for j in range(num_views):
+            v = values[r, j]
+            if not np.isnan(v):
+                k = n
+                while k > 0 and ordered[k - 1] > v:
+                    ordered[k] = ordered[k - 1]
+                    k -= 1
+                ordered[k] = v
+                n += 1
+        if n < 3:
+            continue
+        median = (ordered[(n - 1) // 2] + ordered[n // 2]) / 2
+
+        n = 0
+        for j in range(num_views):
+            v = values[r, j]
+            if not np.isnan(v):
+                d = abs(v - median)
+                k = n
+                while k > 0 and deviations[k - 1] > d:
+                    deviations[k] = deviations[k - 1]
+                    k -= 1
+                deviations[k] = d
+                n += 1
+        mad = (deviations[(n - 1) // 2] + deviations[n // 2]) / 2
+        if mad > 0:
+            scale = mad / 0.6745
+        else:
+            # Zero MAD: fall back to the standard deviation (Welford)
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for j in range(num_views):
+                v = values[r, j]
+                if not np.isnan(v):
+                    count += 1
+                    delta = v - mean
+                    mean += delta / count
+                    m2 += delta * (v - mean)
+            scale = np.sqrt(m2 / count)
+            if scale <= 0:
+                continue
+
+        for j in range(num_views):
+            v = values[r, j]
+            if not np.isnan(v) and abs(v - median) / scale > threshold:
+                filtered_values[r, j] = np.nan
+                filtered_confidences[r, j] = 0.0
+
+    return filtered_values, filtered_confidences
+
+
+# Tiny per-row sorts are all interpreter/dispatch overhead in numpy; no
+# fastmath, as the kernel depends on NaN checks
+if NUMBA_AVAILABLE:
+    _reject_outliers_kernel = numba.njit(cache=True)(_reject_outliers_loop)
+else:
+    _reject_outliers_kernel = _reject_outliers_numpy
+
+
+def _fusion_result(
+    n_valid: np.ndarray,
+    value: np.ndarray,
+    confidence: np.ndarray,
+    variance: np.ndarray
+) -> tuple:
+    """
+    Finish a fusion method: rows without valid views become (NaN, 0, 0);
+    a single row (1-D input) is returned as (value or None, confidence, variance).
+    """
+    empty = n_valid == 0
+    value = np.where(empty, np.nan, value)
+    confidence = np.where(empty, 0.0, confidence)
+    variance = np.where(empty, 0.0, variance)
+    if np.ndim(n_valid) == 0:
+        if empty:
+            return None, 0.0, 0.0
+        return float(value), float(confidence), float(variance)
+    return value, confidence, variance
+
+
 class MultiViewFusion:
     """
     Fuses measurements from multiple camera views/images for improved accuracy.
@@ -32,6 +208,11 @@ class MultiViewFusion:
     Handles missing measurements gracefully and provides variance estimates.
     """
 
+    # Measurement fields to fuse, and a C-level getter returning them as a tuple
+    _MEASUREMENT_FIELDS = MEASUREMENT_FIELDS
+    _get_fields = operator.attrgetter(*MEASUREMENT_FIELDS)
+    _ZERO_CONFIDENCES = (0.0,) * len(MEASUREMENT_FIELDS)
+
     def __init__(
         self,
         fusion_method: str = 'weighted_average',
@@ -76,6 +257,9 @@ class MultiViewFusion:
         """
         Reject outlier measurements using statistical methods.
 
+        Works along the last axis, so a (num_fields, num_views) array
+        filters every measurement type at once.
+
         Args:
             values: Array of measurement values
             confidences: Corresponding confidence scores
@@ -83,39 +267,19 @@ class MultiViewFusion:
         Returns:
             Tuple of (filtered_values, filtered_confidences)
         """
-        if len(values) < 3:  # Need at least 3 points for outlier detection
+        if values.shape[-1] < 3:  # Need at least 3 points for outlier detection
             return values, confidences
 
-        # Remove None/NaN values
-        valid_mask = ~np.isnan(values)
-        if valid_mask.sum() < 3:
-            return values, confidences
-
-        valid_values = values[valid_mask]
-        valid_confidences = confidences[valid_mask]
-
-        # Calculate statistics
-        median = np.median(valid_values)
-        mad = np.median(np.abs(valid_values - median))  # Median Absolute Deviation
-
-        # Modified Z-score (more robust than standard deviation)
-        if mad > 0:
-            modified_z_scores = 0.6745 * (valid_values - median) / mad
-            outlier_mask = np.abs(modified_z_scores) <= self.outlier_threshold
-        else:
-            outlier_mask = np.ones(len(valid_values), dtype=bool)
-
-        # Create output arrays
-        filtered_values = values.copy()
-        filtered_confidences = confidences.copy()
-
-        # Set outliers to NaN
-        valid_indices = np.where(valid_mask)[0]
-        outlier_indices = valid_indices[~outlier_mask]
-        filtered_values[outlier_indices] = np.nan
-        filtered_confidences[outlier_indices] = 0.0
+        # Median/MAD modified Z-scores per row; outliers become NaN with
+        # zero confidence
+        rows = values.reshape(-1, values.shape[-1])
+        filtered_values, filtered_confidences = _reject_outliers_kernel(
+            rows.astype(np.float64, copy=False),
+            confidences.reshape(rows.shape).astype(np.float64, copy=False),
+            float(self.outlier_threshold)
+        )
 
-        return filtered_values, filtered_confidences
+        return filtered_values.reshape(values.shape), filtered_confidences.reshape(values.shape)
 
     def _weighted_average(
         self,
@@ -132,24 +296,20 @@ class MultiViewFusion:
         Returns:
             Tuple of (fused_value, average_confidence, variance)
         """
-        # Filter out invalid values
-        valid_mask = ~np.isnan(values) & (confidences > 0)
-
-        if valid_mask.sum() == 0:
-            return None, 0.0, 0.0
-
-        valid_values = values[valid_mask]
-        valid_confidences = confidences[valid_mask]
+        valid_mask, n_valid = _valid_views(values, confidences)
+        weights = np.where(valid_mask, confidences, 0.0)
+        weight_sum = weights.sum(axis=-1)
 
-        # Weighted average
-        weights = valid_confidences / valid_confidences.sum()
-        fused_value = np.average(valid_values, weights=weights)
-        avg_confidence = valid_confidences.mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Weighted average
+            fused_value = (np.where(valid_mask, values, 0.0) * weights).sum(axis=-1) / weight_sum
+            avg_confidence = weight_sum / n_valid
 
-        # Weighted variance
-        variance = np.average((valid_values - fused_value) ** 2, weights=weights)
+            # Weighted variance
+            deviation = np.where(valid_mask, values - fused_value[..., None], 0.0)
+            variance = (deviation * deviation * weights).sum(axis=-1) / weight_sum
 
-        return float(fused_value), float(avg_confidence), float(variance)
+        return _fusion_result(n_valid, fused_value, avg_confidence, variance)
 
     def _median_fusion(
         self,
@@ -166,19 +326,14 @@ class MultiViewFusion:
         Returns:
             Tuple of (median_value, average_confidence, variance)
         """
-        valid_mask = ~np.isnan(values) & (confidences > 0)
+        valid_mask, n_valid = _valid_views(values, confidences)
 
-        if valid_mask.sum() == 0:
-            return None, 0.0, 0.0
-
-        valid_values = values[valid_mask]
-        valid_confidences = confidences[valid_mask]
-
-        median_value = np.median(valid_values)
-        avg_confidence = valid_confidences.mean()
-        variance = np.var(valid_values)
+        median_value = _masked_median(values, valid_mask, n_valid)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_confidence = np.where(valid_mask, confidences, 0.0).sum(axis=-1) / n_valid
+        variance = _masked_var(values, valid_mask, n_valid)
 
-        return float(median_value), float(avg_confidence), float(variance)
+        return _fusion_result(n_valid, median_value, avg_confidence, variance)
 
     def _max_confidence_fusion(
         self,
@@ -195,20 +350,14 @@ class MultiViewFusion:
         Returns:
             Tuple of (best_value, max_confidence, variance)
         """
-        valid_mask = ~np.isnan(values) & (confidences > 0)
-
-        if valid_mask.sum() == 0:
-            return None, 0.0, 0.0
+        valid_mask, n_valid = _valid_views(values, confidences)
 
-        valid_values = values[valid_mask]
-        valid_confidences = confidences[valid_mask]
+        max_idx = np.argmax(np.where(valid_mask, confidences, -np.inf), axis=-1)[..., None]
+        best_value = np.take_along_axis(values, max_idx, axis=-1)[..., 0]
+        max_confidence = np.take_along_axis(confidences, max_idx, axis=-1)[..., 0]
+        variance = _masked_var(values, valid_mask, n_valid)
 
-        max_idx = np.argmax(valid_confidences)
-        best_value = valid_values[max_idx]
-        max_confidence = valid_confidences[max_idx]
-        variance = np.var(valid_values)
-
-        return float(best_value), float(max_confidence), float(variance)
+        return _fusion_result(n_valid, best_value, max_confidence, variance)
 
     def _adaptive_fusion(
         self,
@@ -225,23 +374,38 @@ class MultiViewFusion:
         Returns:
             Tuple of (fused_value, confidence, variance)
         """
-        valid_mask = ~np.isnan(values) & (confidences > 0)
-
-        if valid_mask.sum() == 0:
-            return None, 0.0, 0.0
-
-        valid_values = values[valid_mask]
-
-        # Calculate coefficient of variation
-        mean_val = np.mean(valid_values)
-        std_val = np.std(valid_values)
-        cv = std_val / mean_val if mean_val > 0 else 0
+        # One mask and one set of reductions shared by both strategies; the
+        # average confidence is the same for median and weighted average
+        valid_mask, n_valid = _valid_views(values, confidences)
+        masked_values = np.where(valid_mask, values, 0.0)
+        weights = np.where(valid_mask, confidences, 0.0)
+        weight_sum = weights.sum(axis=-1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_confidence = weight_sum / n_valid
+
+            # Coefficient of variation
+            mean_val = masked_values.sum(axis=-1) / n_valid
+            deviation = np.where(valid_mask, values - mean_val[..., None], 0.0)
+            variance = (deviation * deviation).sum(axis=-1) / n_valid
+            cv = np.where(mean_val > 0, np.sqrt(variance) / mean_val, 0.0)
+
+            # Weighted average and weighted variance
+            weighted_value = (masked_values * weights).sum(axis=-1) / weight_sum
+            deviation = np.where(valid_mask, values - weighted_value[..., None], 0.0)
+            weighted_variance = (deviation * deviation * weights).sum(axis=-1) / weight_sum
 
         # Use median if high variance (CV > 0.2), weighted average otherwise
-        if cv > 0.2:
-            return self._median_fusion(values, confidences)
+        use_median = cv > 0.2
+        if use_median.any():
+            fused_value = np.where(
+                use_median, _masked_median(values, valid_mask, n_valid), weighted_value
+            )
+            variance = np.where(use_median, variance, weighted_variance)
         else:
-            return self._weighted_average(values, confidences)
+            fused_value, variance = weighted_value, weighted_variance
+
+        return _fusion_result(n_valid, fused_value, avg_confidence, variance)
 
     def _fuse_single_measurement(
         self,
@@ -262,21 +426,33 @@ class MultiViewFusion:
         values_array = np.array([v if v is not None else np.nan for v in values])
         confidences_array = np.array(confidences)
 
+        return self._fuse_arrays(values_array, confidences_array)
+
+    def _fuse_arrays(
+        self,
+        values: np.ndarray,
+        confidences: np.ndarray
+    ) -> tuple:
+        """
+        Outlier rejection and fusion along the last axis.
+
+        A 1-D array of views gives scalars as in _fuse_single_measurement; a
+        (num_fields, num_views) array gives per-field arrays, NaN where a
+        field has no valid view.
+        """
         # Outlier rejection if enabled
         if self.outlier_rejection:
-            values_array, confidences_array = self._reject_outliers(
-                values_array, confidences_array
-            )
+            values, confidences = self._reject_outliers(values, confidences)
 
         # Apply fusion method
         if self.fusion_method == 'weighted_average':
-            return self._weighted_average(values_array, confidences_array)
+            return self._weighted_average(values, confidences)
         elif self.fusion_method == 'median':
-            return self._median_fusion(values_array, confidences_array)
+            return self._median_fusion(values, confidences)
         elif self.fusion_method == 'max_confidence':
-            return self._max_confidence_fusion(values_array, confidences_array)
+            return self._max_confidence_fusion(values, confidences)
         elif self.fusion_method == 'adaptive':
-            return self._adaptive_fusion(values_array, confidences_array)
+            return self._adaptive_fusion(values, confidences)
         else:
             raise ValueError(f"Unknown fusion method: {self.fusion_method}")
 
@@ -302,44 +478,39 @@ class MultiViewFusion:
                 f"minimum required: {self.min_views}"
             )
 
+        if len(measurements_list) == 1:
+            return self._fuse_single_view(measurements_list[0])
+
         # Extract view confidences
         view_confidences = [m.overall_confidence for m in measurements_list]
 
-        # Initialize fused measurements
-        fused = BodyMeasurements()
-        fused.confidence_scores = {}
-        measurement_variance = {}
-
-        # Measurement fields to fuse
-        measurement_fields = [
-            'height', 'shoulder_width', 'waist_circumference',
-            'hip_circumference', 'chest_circumference',
-            'left_arm_length', 'right_arm_length',
-            'left_leg_length', 'right_leg_length', 'torso_length'
-        ]
-
-        # Fuse each measurement type
-        for field in measurement_fields:
-            values = [getattr(m, field) for m in measurements_list]
-            confidences = [
-                m.confidence_scores.get(field, 0.0) if m.confidence_scores else 0.0
-                for m in measurements_list
-            ]
+        measurement_fields = self._MEASUREMENT_FIELDS
 
-            fused_value, fused_conf, variance = self._fuse_single_measurement(
-                values, confidences
-            )
+        # One (num_fields, num_views) matrix each, fused in one pass;
+        # None becomes NaN
+        values = np.array(
+            [self._get_fields(m) for m in measurements_list], dtype=np.float64
+        ).T
+        # dict.get mapped over the field tuple, with 0.0 for missing scores
+        conf_dicts = [m.confidence_scores or _EMPTY for m in measurements_list]
+        confidences = np.array(
+            [list(map(d.get, measurement_fields, self._ZERO_CONFIDENCES)) for d in conf_dicts],
+            dtype=np.float64
+        ).T
 
-            setattr(fused, field, fused_value)
-            fused.confidence_scores[field] = fused_conf
-            measurement_variance[field] = variance
+        fused_array, fused_conf_array, variance_array = self._fuse_arrays(values, confidences)
+        fused_confidences = fused_conf_array.tolist()
+        measurement_variance = dict(zip(measurement_fields, variance_array.tolist()))
 
         # Calculate overall fused confidence
-        valid_confidences = [
-            c for c in fused.confidence_scores.values() if c > 0
-        ]
-        fused.overall_confidence = (
-            float(np.mean(valid_confidences)) if valid_confidences else 0.0
+        valid_confidences = [c for c in fused_confidences if c > 0]
+        fused = BodyMeasurements.from_vector(
+            fused_array,
+            fused_confidences,
+            overall_confidence=(
+                float(sum(valid_confidences) / len(valid_confidences))
+                if valid_confidences else 0.0
+            )
         )
 
         return FusedMeasurements(
@@ -350,6 +521,50 @@ class MultiViewFusion:
             measurement_variance=measurement_variance
         )
 
+    def _fuse_single_view(self, measurements: BodyMeasurements) -> FusedMeasurements:
+        """
+        fuse_measurements specialised to one view, without numpy.
+
+        Every fusion method reduces to the view itself: a measurement is kept
+        with its own confidence if it is present with positive confidence,
+        and all variances are zero.
+
+        Args:
+            measurements: The only view
+
+        Returns:
+            FusedMeasurements object
+        """
+        scores = measurements.confidence_scores or _EMPTY
+        fused_values = {}
+        fused_confidences = {}
+        for field, value in zip(self._MEASUREMENT_FIELDS, self._get_fields(measurements)):
+            confidence = scores.get(field, 0.0)
+            if value is None or math.isnan(value) or not confidence > 0:
+                fused_values[field] = None
+                fused_confidences[field] = 0.0
+            else:
+                fused_values[field] = float(value)
+                fused_confidences[field] = float(confidence)
+
+        valid_confidences = [c for c in fused_confidences.values() if c > 0]
+        fused = BodyMeasurements(
+            **fused_values,
+            confidence_scores=fused_confidences,
+            overall_confidence=(
+                float(sum(valid_confidences) / len(valid_confidences))
+                if valid_confidences else 0.0
+            )
+        )
+
+        return FusedMeasurements(
+            measurements=fused,
+            num_views=1,
+            view_confidences=[measurements.overall_confidence],
+            fusion_method=self.fusion_method,
+            measurement_variance=dict.fromkeys(self._MEASUREMENT_FIELDS, 0.0)
+        )
+
     def fuse_from_landmarks(
         self,
         landmark_results: List[LandmarkResult]
@@ -363,11 +578,15 @@ class MultiViewFusion:
         Returns:
             FusedMeasurements object
         """
-        # Extract measurements from each view
-        measurements_list = [
-            self.extractor.extract_all(result)
-            for result in landmark_results
-        ]
+        # Stacked extraction has a fixed setup cost that only pays off once
+        # there are enough views; typical 2-4 view rigs stay per-view
+        if len(landmark_results) >= BATCH_EXTRACT_MIN_VIEWS:
+            measurements_list = self.extractor.extract_all_batch(landmark_results)
+        else:
+            measurements_list = [
+                self.extractor.extract_all(result)
+                for result in landmark_results
+            ]
 
         # Fuse measurements
         return self.fuse_measurements(measurements_list)
@@ -385,21 +604,33 @@ class MultiViewFusion:
         Returns:
             Dictionary with statistics for each measurement
         """
-        stats = {}
+        measurements = fused.measurements
+        values = measurements.to_vector()
+        confidences = measurements.confidence_vector()
+        variances = np.array(
+            [fused.measurement_variance.get(field, 0.0) for field in self._MEASUREMENT_FIELDS]
+        )
+        std_devs = np.sqrt(variances)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cvs = np.where(values > 0, std_devs / values, 0.0)  # Coefficient of variation
 
-        for field, value in vars(fused.measurements).items():
-            if field == 'confidence_scores' or value is None:
+        stats = {}
+        for field, value, confidence, variance, std_dev, cv in zip(
+            self._MEASUREMENT_FIELDS,
+            values.tolist(),
+            confidences.tolist(),
+            variances.tolist(),
+            std_devs.tolist(),
+            cvs.tolist()
+        ):
+            if math.isnan(value):
                 continue
-
-            variance = fused.measurement_variance.get(field, 0.0)
-            confidence = fused.measurements.confidence_scores.get(field, 0.0)
-
             stats[field] = {
                 'value': value,
                 'confidence': confidence,
                 'variance': variance,
-                'std_dev': np.sqrt(variance),
-                'cv': np.sqrt(variance) / value if value > 0 else 0.0  # Coefficient of variation
+                'std_dev': std_dev,
+                'cv': cv
             }
 
         return stats
@@ -0,0 +1,63 @@
+"""Shared FastAPI dependencies for the API routers."""
+
+from typing import Any, Type, TypeVar
+
+from fastapi import Request
+
+from src.api.services.fitting_service import FittingService
+from src.api.services.metrics_service import MetricsService
+from src.api.services.photo_service import DEFAULT_PHOTO_STORAGE_PATH, PhotoService
+from src.api.services.subject_service import SubjectService
+
+ServiceT = TypeVar("ServiceT")
+
+
+def _get_service(
+    request: Request, name: str, service_class: Type[ServiceT], **kwargs: Any
+) -> ServiceT:
+    """
+    Return the app's shared instance of a service, creating it on first use.
+
+    Services are stateless apart from their database handle, so one
+    instance per app is reused across requests. It is rebuilt if
+    app.state.db has been replaced since it was created.
+
+    Args:
+        request: Incoming request
+        name: Attribute name on app.state
+        service_class: Service class, constructed with the database
+        **kwargs: Extra constructor arguments
+
+    Returns:
+        Shared service instance
+    """
+    state = request.app.state
+    db = state.db
+    service = getattr(state, name, None)
+    if service is None or service.db is not db:
+        service = service_class(db, **kwargs)
+        setattr(state, name, service)
+    return service
+
+
+def get_subject_service(request: Request) -> SubjectService:
+    """Dependency to get subject service."""
+    return _get_service(request, "subject_service", SubjectService)
+
+
+def get_photo_service(request: Request) -> PhotoService:
+    """Dependency to get photo service."""
+    storage_path = getattr(
+        request.app.state, "photo_storage_path", DEFAULT_PHOTO_STORAGE_PATH
+    )
+    return _get_service(request, "photo_service", PhotoService, storage_path=storage_path)
+
+
+def get_fitting_service(request: Request) -> FittingService:
+    """Dependency to get fitting service."""
+    return _get_service(request, "fitting_service", FittingService)
+
+
+def get_metrics_service(request: Request) -> MetricsService:
+    """Dependency to get metrics service."""
+    return _get_service(request, "metrics_service", MetricsService)
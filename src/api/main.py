@@ -9,12 +9,15 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
+import os
 import time
 
 from src.api.routes import subjects, fitting
 from src.api.middleware.auth import AuthMiddleware
 from src.api.middleware.rate_limit import RateLimitMiddleware
 from src.api.services.database import DatabaseService
+from src.api.services.fitting_service import shutdown_fitting_executor
+from src.api.services.photo_service import DEFAULT_PHOTO_STORAGE_PATH
 
 # Configure logging
 logging.basicConfig(
@@ -29,14 +32,19 @@ async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
     # Startup
     logger.info("Starting Anny Body Fitter API")
-    db_service = DatabaseService()
+    db_service = DatabaseService(
+        db_path=os.getenv("DATABASE_PATH", "data/anny_fitter.db"),
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5"))
+    )
     await db_service.initialize()
     app.state.db = db_service
+    app.state.photo_storage_path = os.getenv("PHOTO_STORAGE_PATH", DEFAULT_PHOTO_STORAGE_PATH)
 
     yield
 
     # Shutdown
     logger.info("Shutting down Anny Body Fitter API")
+    shutdown_fitting_executor()
     await app.state.db.close()
 
 
@@ -68,16 +76,20 @@ app.add_middleware(
 
 # Custom Middlewares
 app.add_middleware(AuthMiddleware)
-app.add_middleware(RateLimitMiddleware)
+app.add_middleware(
+    RateLimitMiddleware,
+    requests_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
+    requests_per_hour=int(os.getenv("RATE_LIMIT_PER_HOUR", "1000"))
+)
 
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add processing time to response headers."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    # Seconds, at microsecond resolution
+    response.headers["X-Process-Time"] = f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}"
     return response
 
 
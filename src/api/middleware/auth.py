@@ -3,10 +3,12 @@
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette.middleware.base import BaseHTTPMiddleware
+from collections import OrderedDict
 from typing import Optional
 import logging
 import jwt
 import os
+import time
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,16 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Successfully decoded tokens by raw token string (LRU): a client reusing
+# its token skips signature verification until the token expires
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _auth_disabled() -> bool:
+    """Whether DISABLE_AUTH is set (development only)."""
+    return os.getenv("DISABLE_AUTH", "false").lower() == "true"
+
 
 class AuthMiddleware(BaseHTTPMiddleware):
     """Authentication middleware for protecting API endpoints."""
@@ -30,17 +42,25 @@ class AuthMiddleware(BaseHTTPMiddleware):
         "/openapi.json",
     }
 
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        # Documentation paths match by prefix in a single startswith call
+        self._public_prefixes = ("/docs", "/redoc", "/openapi.json")
+        self._public_exact = frozenset(self.PUBLIC_PATHS)
+        # For development only; read once per app rather than on every request
+        self._disable_auth = _auth_disabled()
+
     async def dispatch(self, request: Request, call_next):
         """Process request and validate authentication."""
         path = request.url.path
 
         # Allow public endpoints
-        if path in self.PUBLIC_PATHS or path.startswith("/docs") or path.startswith("/redoc"):
+        if path in self._public_exact or path.startswith(self._public_prefixes):
             return await call_next(request)
 
         # For development: allow unauthenticated access
         # Remove this in production!
-        if os.getenv("DISABLE_AUTH", "false").lower() == "true":
+        if self._disable_auth:
             logger.warning("Authentication disabled - development mode only!")
             request.state.user = {"id": "dev_user", "username": "developer"}
             return await call_next(request)
@@ -109,9 +129,17 @@ def decode_access_token(token: str) -> dict:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    payload = _token_cache.get(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            _token_cache.move_to_end(token)
+            return dict(payload)
+        # Expired since it was cached: let jwt.decode report it
+        del _token_cache[token]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -125,6 +153,13 @@ def decode_access_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+    _token_cache[token] = payload
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+    # Copies, so callers cannot alter the cached payload
+    return dict(payload)
+
 
 async def get_current_user(request: Request) -> dict:
     """
@@ -165,7 +200,7 @@ async def authenticate_user(username: str, password: str) -> Optional[dict]:
     """
     # TODO: Implement actual user authentication
     # For now, accept any credentials in development
-    if os.getenv("DISABLE_AUTH", "false").lower() == "true":
+    if _auth_disabled():
         return {
             "id": "dev_user",
             "username": username,
@@ -2,9 +2,10 @@
 
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import List
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +14,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware to prevent abuse.
 
-    Implements sliding window rate limiting per IP address.
+    Implements per-IP token buckets for the minute and hour limits: each
+    refills continuously at its limit per window, and a request spends one
+    token from both. State per IP is constant-size regardless of traffic.
     """
 
+    # Requests between sweeps that drop buckets idle for a full hour
+    GC_INTERVAL = 10_000
+
+    # Most client IPs tracked at once; the least recently seen is evicted
+    MAX_BUCKETS = 100_000
+
     def __init__(self, app, requests_per_minute: int = 60, requests_per_hour: int = 1000):
         """
         Initialize rate limiter.
@@ -29,9 +38,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
 
-        # Store request timestamps per IP
-        self.minute_requests = defaultdict(list)
-        self.hour_requests = defaultdict(list)
+        # Per IP: [minute tokens, hour tokens, last refill time], least
+        # recently seen first
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._requests_since_gc = 0
 
     async def dispatch(self, request: Request, call_next):
         """Process request and enforce rate limits."""
@@ -42,36 +52,45 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if request.url.path in ["/health", "/"]:
             return await call_next(request)
 
-        # Check rate limits
-        now = datetime.utcnow()
-
-        # Clean old entries
-        self._clean_old_entries(client_ip, now)
+        # Check rate limits; windows are relative, so a monotonic clock is
+        # enough and immune to wall-clock jumps
+        now = time.monotonic()
+
+        # No await until the bucket is updated, so this is safe on the event loop
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            bucket = [float(self.requests_per_minute), float(self.requests_per_hour), now]
+            self.buckets[client_ip] = bucket
+            if len(self.buckets) > self.MAX_BUCKETS:
+                self.buckets.popitem(last=False)
+        else:
+            self._refill(bucket, now)
+            self.buckets.move_to_end(client_ip)
 
         # Check minute limit
-        if len(self.minute_requests[client_ip]) >= self.requests_per_minute:
+        if bucket[0] < 1.0:
             logger.warning(f"Rate limit exceeded for {client_ip} (minute)")
             return self._rate_limit_response("Too many requests per minute")
 
         # Check hour limit
-        if len(self.hour_requests[client_ip]) >= self.requests_per_hour:
+        if bucket[1] < 1.0:
             logger.warning(f"Rate limit exceeded for {client_ip} (hour)")
             return self._rate_limit_response("Too many requests per hour")
 
         # Record request
-        self.minute_requests[client_ip].append(now)
-        self.hour_requests[client_ip].append(now)
+        bucket[0] -= 1.0
+        bucket[1] -= 1.0
+
+        self._requests_since_gc += 1
+        if self._requests_since_gc >= self.GC_INTERVAL:
+            self._collect_idle_buckets(now)
 
         # Add rate limit headers
         response = await call_next(request)
         response.headers["X-RateLimit-Minute-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Minute-Remaining"] = str(
-            self.requests_per_minute - len(self.minute_requests[client_ip])
-        )
+        response.headers["X-RateLimit-Minute-Remaining"] = str(int(bucket[0]))
         response.headers["X-RateLimit-Hour-Limit"] = str(self.requests_per_hour)
-        response.headers["X-RateLimit-Hour-Remaining"] = str(
-            self.requests_per_hour - len(self.hour_requests[client_ip])
-        )
+        response.headers["X-RateLimit-Hour-Remaining"] = str(int(bucket[1]))
 
         return response
 
@@ -92,27 +111,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return "unknown"
 
-    def _clean_old_entries(self, client_ip: str, now: datetime):
-        """Remove expired entries from request history."""
-        # Clean minute requests (keep last minute)
-        minute_ago = now - timedelta(minutes=1)
-        self.minute_requests[client_ip] = [
-            ts for ts in self.minute_requests[client_ip]
-            if ts > minute_ago
-        ]
-
-        # Clean hour requests (keep last hour)
-        hour_ago = now - timedelta(hours=1)
-        self.hour_requests[client_ip] = [
-            ts for ts in self.hour_requests[client_ip]
-            if ts > hour_ago
-        ]
-
-        # Clean up empty entries
-        if not self.minute_requests[client_ip]:
-            del self.minute_requests[client_ip]
-        if not self.hour_requests[client_ip]:
-            del self.hour_requests[client_ip]
+    def _refill(self, bucket: List[float], now: float):
+        """Top up a bucket for the time elapsed since its last refill."""
+        elapsed = now - bucket[2]
+        bucket[0] = min(
+            float(self.requests_per_minute),
+            bucket[0] + elapsed * (self.requests_per_minute / 60.0)
+        )
+        bucket[1] = min(
+            float(self.requests_per_hour),
+            bucket[1] + elapsed * (self.requests_per_hour / 3600.0)
+        )
+        bucket[2] = now
+
+    def _collect_idle_buckets(self, now: float):
+        """Drop buckets untouched for an hour; they would be full again anyway."""
+        hour_ago = now - 3600.0
+        # Buckets are ordered by last use, so the idle ones are all at the front
+        while self.buckets:
+            bucket = next(iter(self.buckets.values()))
+            if bucket[2] > hour_ago:
+                break
+            self.buckets.popitem(last=False)
+        self._requests_since_gc = 0
 
     def _rate_limit_response(self, detail: str):
         """Return rate limit exceeded response."""
@@ -0,0 +1,69 @@
+"""HTTP cache validators (ETag / If-None-Match) for read-only endpoints."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Clients may store responses but must revalidate before reuse: a poll whose
+# If-None-Match still matches gets an empty 304 instead of the full body.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(content: bytes) -> str:
+    """Build a weak ETag from a response body or other version-identifying bytes."""
+    return f'W/"{hashlib.sha1(content).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in header.split(","))
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Check whether the request's Accept-Encoding allows a gzip response.
+
+    q-values are honoured: "gzip;q=0" refuses gzip, and "*" accepts it
+    unless gzip is listed on its own. Only the "gzip" token is matched, so
+    clients naming just "x-gzip" get the identity encoding.
+    """
+    header = request.headers.get("accept-encoding")
+    if not header:
+        return False
+    gzip_q = wildcard_q = None
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            gzip_q = q
+        elif coding == "*":
+            wildcard_q = q
+    if gzip_q is None:
+        gzip_q = wildcard_q
+    return bool(gzip_q)
+
+
+def set_validators(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation policy to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching If-None-Match."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag)
+    return response
@@ -9,44 +9,35 @@ from fastapi import (
     File,
     Form,
     BackgroundTasks,
-    Request
+    Request,
+    Response
 )
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import asyncio
 import logging
-import json
+
+from pydantic import ValidationError
 
 from src.api.schemas import (
     FittingRequest,
     FittingResponse,
     FittingStatus,
     PhotoResponse,
-    PhotoMetadata,
+    PhotoMetadataList,
     ModelParameters
 )
-from src.api.services.fitting_service import FittingService
+from src.api.services.fitting_service import FittingService, allow_status_poll
 from src.api.services.photo_service import PhotoService
 from src.api.services.subject_service import SubjectService
 from src.api.middleware.auth import get_current_user
+from src.api.dependencies import get_fitting_service, get_photo_service, get_subject_service
+from src.api.routes.caching import accepts_gzip, etag_matches, not_modified, set_validators
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_fitting_service(request: Request) -> FittingService:
-    """Dependency to get fitting service."""
-    return FittingService(request.app.state.db)
-
-
-def get_photo_service(request: Request) -> PhotoService:
-    """Dependency to get photo service."""
-    return PhotoService(request.app.state.db)
-
-
-def get_subject_service(request: Request) -> SubjectService:
-    """Dependency to get subject service."""
-    return SubjectService(request.app.state.db)
-
-
 @router.post(
     "/subjects/{subject_id}/photos",
     response_model=List[PhotoResponse],
@@ -89,13 +80,13 @@ async def upload_photos(
                 detail=f"Subject {subject_id} not found"
             )
 
-        # Parse metadata
+        # Parse and validate metadata
         try:
-            metadata_list = json.loads(metadata)
-        except json.JSONDecodeError:
+            metadata_list = PhotoMetadataList.validate_json(metadata)
+        except ValidationError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid metadata JSON format"
+                detail=f"Invalid metadata: {e.errors(include_url=False)}"
             )
 
         if len(files) != len(metadata_list):
@@ -104,16 +95,7 @@ async def upload_photos(
                 detail="Number of files must match number of metadata entries"
             )
 
-        # Validate file types
-        allowed_types = {"image/jpeg", "image/png", "image/jpg"}
-        for file in files:
-            if file.content_type not in allowed_types:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid file type: {file.content_type}. Allowed: JPEG, PNG"
-                )
-
-        # Upload photos
+        # Validate and upload photos concurrently
         uploaded_photos = await photo_service.upload_photos(
             subject_id=subject_id,
             files=files,
@@ -126,6 +108,11 @@ async def upload_photos(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error uploading photos for subject {subject_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -199,9 +186,9 @@ async def fit_model(
                 detail=f"Subject {subject_id} not found"
             )
 
-        # Verify photos exist
-        photos = await photo_service.get_subject_photos(subject_id, current_user.get("id"))
-        if not photos:
+        # Verify photos exist; photo_count may be stale in the subject cache,
+        # so only a zero count falls back to probing the photos table
+        if not subject.photo_count and not await photo_service.has_photos(subject_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No photos uploaded for this subject. Upload photos first."
@@ -246,7 +233,16 @@ async def get_fitting_status(
     - Current status (pending/processing/completed/failed)
     - Progress percentage
     - Estimated time remaining (if available)
+
+    Polls are limited per subject to a few per second; excess polls get 429.
     """
+    if not allow_status_poll(current_user.get("id"), subject_id):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many status requests for this subject",
+            headers={"Retry-After": "1"}
+        )
+
     try:
         fitting_status = await fitting_service.get_fitting_status(
             subject_id,
@@ -268,6 +264,66 @@ async def get_fitting_status(
         )
 
 
+@router.get(
+    "/subjects/{subject_id}/fit/stream",
+    summary="Stream fitting status",
+    description="Server-Sent Events stream of fitting status changes",
+    response_class=StreamingResponse
+)
+async def stream_fitting_status(
+    subject_id: str,
+    fitting_service: FittingService = Depends(get_fitting_service),
+    subject_service: SubjectService = Depends(get_subject_service),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Follow a fitting task over one long-lived connection instead of polling.
+
+    Sends the current status immediately, then one `data:` event (a
+    FittingStatus JSON object) per change, with `: keep-alive` comments in
+    between. The stream ends once the fit completes or fails.
+    """
+    try:
+        subject = await subject_service.get_subject(subject_id, current_user.get("id"))
+        if not subject:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Subject {subject_id} not found"
+            )
+
+        initial = await fitting_service.get_fitting_status(subject_id, current_user.get("id"))
+        if not initial:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No fitting task found for subject {subject_id}"
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming fitting status for subject {subject_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream fitting status: {str(e)}"
+        )
+
+    async def events():
+        yield f"data: {initial.model_dump_json()}\n\n"
+        async for fitting_status in fitting_service.watch_fitting_status(
+            subject_id, current_user.get("id"), initial
+        ):
+            if fitting_status is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {fitting_status.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Proxies (e.g. nginx) must pass events through as they are sent
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get(
     "/subjects/{subject_id}/model",
     response_model=ModelParameters,
@@ -276,6 +332,7 @@ async def get_fitting_status(
 )
 async def get_fitted_model(
     subject_id: str,
+    request: Request,
     fitting_service: FittingService = Depends(get_fitting_service),
     subject_service: SubjectService = Depends(get_subject_service),
     current_user: dict = Depends(get_current_user)
@@ -290,28 +347,40 @@ async def get_fitted_model(
     - Mesh information (vertices, faces)
 
     This endpoint only returns data if fitting has completed successfully.
+    The body is served pre-serialized (gzipped when the client accepts it)
+    with an ETag; a matching If-None-Match gets 304 Not Modified.
     """
     try:
-        # Verify subject exists
-        subject = await subject_service.get_subject(subject_id, current_user.get("id"))
+        # Look up the subject and its model concurrently; the model is only
+        # returned once the subject is confirmed to belong to the caller
+        subject, payload = await asyncio.gather(
+            subject_service.get_subject(subject_id, current_user.get("id")),
+            fitting_service.get_model_payload(subject_id, current_user.get("id"))
+        )
         if not subject:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Subject {subject_id} not found"
             )
 
-        if not subject.has_fitted_model:
+        # The stored model, not a possibly cached has_fitted_model flag, decides
+        if payload is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No fitted model available for subject {subject_id}. Run fitting first."
             )
 
-        model_params = await fitting_service.get_model_parameters(
-            subject_id,
-            current_user.get("id")
-        )
-
-        return model_params
+        if etag_matches(request, payload.etag):
+            return not_modified(payload.etag)
+
+        if accepts_gzip(request):
+            response = Response(payload.gzipped, media_type="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(payload.body, media_type="application/json")
+        response.headers["Vary"] = "Accept-Encoding"
+        set_validators(response, payload.etag)
+        return response
 
     except HTTPException:
         raise
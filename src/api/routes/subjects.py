@@ -1,6 +1,6 @@
 """Subject management API endpoints."""
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 from typing import List, Optional
 import logging
 
@@ -15,21 +15,13 @@ from src.api.schemas import (
 from src.api.services.subject_service import SubjectService
 from src.api.services.metrics_service import MetricsService
 from src.api.middleware.auth import get_current_user
+from src.api.dependencies import get_metrics_service, get_subject_service
+from src.api.routes.caching import etag_matches, make_etag, not_modified, set_validators
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_subject_service(request: Request) -> SubjectService:
-    """Dependency to get subject service."""
-    return SubjectService(request.app.state.db)
-
-
-def get_metrics_service(request: Request) -> MetricsService:
-    """Dependency to get metrics service."""
-    return MetricsService(request.app.state.db)
-
-
 @router.post(
     "",
     response_model=SubjectResponse,
@@ -70,6 +62,7 @@ async def create_subject(
     description="Get paginated list of all subjects"
 )
 async def list_subjects(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by name"),
@@ -89,7 +82,14 @@ async def list_subjects(
             search=search,
             user_id=current_user.get("id")
         )
-        return subjects_list
+        # Serialize once: the bytes that are hashed are the bytes sent
+        body = subjects_list.model_dump_json().encode()
+        etag = make_etag(body)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response = Response(body, media_type="application/json")
+        set_validators(response, etag)
+        return response
     except Exception as e:
         logger.error(f"Error listing subjects: {e}", exc_info=True)
         raise HTTPException(
@@ -106,6 +106,7 @@ async def list_subjects(
 )
 async def get_subject(
     subject_id: str,
+    request: Request,
     service: SubjectService = Depends(get_subject_service),
     current_user: dict = Depends(get_current_user)
 ):
@@ -119,7 +120,16 @@ async def get_subject(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Subject {subject_id} not found"
             )
-        return subject
+        # Hash the content: updated_at has one-second resolution and is not
+        # bumped by photo uploads or fit completion. The hashed bytes are
+        # also the body, so the model is serialized once
+        body = subject.model_dump_json().encode()
+        etag = make_etag(body)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response = Response(body, media_type="application/json")
+        set_validators(response, etag)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -265,18 +275,35 @@ async def add_metrics(
     "/{subject_id}/metrics",
     response_model=List[MetricsResponse],
     summary="Get subject metrics",
-    description="Get all performance metrics for a subject"
+    description="Get paginated performance metrics for a subject, newest first"
 )
 async def get_subject_metrics(
     subject_id: str,
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=200, description="Items per page"),
     service: MetricsService = Depends(get_metrics_service),
     current_user: dict = Depends(get_current_user)
 ):
     """
-    Get all performance metrics associated with a subject.
+    Get performance metrics associated with a subject, newest first.
+
+    - **page**: Page number (starts at 1)
+    - **page_size**: Number of items per page (max 200)
     """
     try:
-        metrics = await service.get_subject_metrics(subject_id, current_user.get("id"))
+        metrics = await service.get_subject_metrics(
+            subject_id,
+            current_user.get("id"),
+            page=page,
+            page_size=page_size
+        )
+        # Metrics rows are never modified, so their IDs identify the page
+        etag = make_etag(",".join(m.id for m in metrics).encode())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_validators(response, etag)
         return metrics
     except Exception as e:
         logger.error(f"Error getting metrics for subject {subject_id}: {e}", exc_info=True)
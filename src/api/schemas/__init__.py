@@ -10,12 +10,15 @@ from .fitting import (
     FittingRequest,
     FittingResponse,
     ModelParameters,
-    FittingStatus
+    FittingStatus,
+    FittingStatusEnum,
+    FittingMetrics
 )
 from .photo import (
     PhotoUpload,
     PhotoResponse,
-    PhotoMetadata
+    PhotoMetadata,
+    PhotoMetadataList
 )
 from .metrics import (
     MetricsCreate,
@@ -32,9 +35,12 @@ __all__ = [
     "FittingResponse",
     "ModelParameters",
     "FittingStatus",
+    "FittingStatusEnum",
+    "FittingMetrics",
     "PhotoUpload",
     "PhotoResponse",
     "PhotoMetadata",
+    "PhotoMetadataList",
     "MetricsCreate",
     "MetricsResponse",
     "PerformanceMetrics",
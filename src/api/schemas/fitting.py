@@ -1,6 +1,6 @@
 """Fitting-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, List
 from datetime import datetime
 from enum import Enum
@@ -22,8 +22,8 @@ class FittingRequest(BaseModel):
     lambda_shape: float = Field(0.01, gt=0, description="Shape regularization weight")
     lambda_pose: float = Field(0.01, gt=0, description="Pose regularization weight")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "optimization_iterations": 100,
                 "use_shape_prior": True,
@@ -32,6 +32,7 @@ class FittingRequest(BaseModel):
                 "lambda_pose": 0.01
             }
         }
+    )
 
 
 class ModelParameters(BaseModel):
@@ -43,8 +44,8 @@ class ModelParameters(BaseModel):
     num_vertices: int = Field(..., description="Number of mesh vertices")
     num_faces: int = Field(..., description="Number of mesh faces")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "shape_params": [0.1, -0.2, 0.3, 0.0, -0.1],
                 "pose_params": [0.0] * 72,
@@ -54,6 +55,7 @@ class ModelParameters(BaseModel):
                 "num_faces": 27386
             }
         }
+    )
 
 
 class FittingMetrics(BaseModel):
@@ -76,8 +78,8 @@ class FittingResponse(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "subject_id": "subj_abc123xyz",
                 "status": "completed",
@@ -101,6 +103,7 @@ class FittingResponse(BaseModel):
                 "completed_at": "2025-11-10T10:16:00"
             }
         }
+    )
 
 
 class FittingStatus(BaseModel):
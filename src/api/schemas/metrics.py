@@ -1,6 +1,6 @@
 """Metrics-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -14,8 +14,8 @@ class PerformanceMetrics(BaseModel):
     mean_error_cm: Optional[float] = Field(None, ge=0, description="Mean error in centimeters")
     max_error_cm: Optional[float] = Field(None, ge=0, description="Maximum error in centimeters")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "accuracy_score": 0.95,
                 "precision": 0.92,
@@ -25,6 +25,7 @@ class PerformanceMetrics(BaseModel):
                 "max_error_cm": 4.5
             }
         }
+    )
 
 
 class MetricsCreate(BaseModel):
@@ -35,8 +36,8 @@ class MetricsCreate(BaseModel):
     notes: Optional[str] = Field(None, max_length=1000)
     custom_metrics: Optional[Dict[str, Any]] = Field(None, description="Additional custom metrics")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "metrics": {
                     "accuracy_score": 0.95,
@@ -52,6 +53,7 @@ class MetricsCreate(BaseModel):
                 }
             }
         }
+    )
 
 
 class MetricsResponse(BaseModel):
@@ -65,9 +67,9 @@ class MetricsResponse(BaseModel):
     custom_metrics: Optional[Dict[str, Any]] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "metrics_123abc",
                 "subject_id": "subj_abc123",
@@ -82,3 +84,4 @@ class MetricsResponse(BaseModel):
                 "created_at": "2025-11-10T10:20:00"
             }
         }
+    )
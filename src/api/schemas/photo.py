@@ -1,7 +1,7 @@
 """Photo-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -22,12 +22,17 @@ class PhotoMetadata(BaseModel):
     notes: Optional[str] = Field(None, max_length=500)
 
 
+# Validates the upload form's JSON metadata array in one pass; built once at
+# import since FastAPI does not validate form strings against a model.
+PhotoMetadataList = TypeAdapter(List[PhotoMetadata])
+
+
 class PhotoUpload(BaseModel):
     """Schema for photo upload metadata (file sent separately)."""
     metadata: PhotoMetadata
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "metadata": {
                     "photo_type": "front",
@@ -37,6 +42,7 @@ class PhotoUpload(BaseModel):
                 }
             }
         }
+    )
 
 
 class PhotoResponse(BaseModel):
@@ -53,9 +59,9 @@ class PhotoResponse(BaseModel):
     notes: Optional[str] = None
     uploaded_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "photo_xyz789",
                 "subject_id": "subj_abc123",
@@ -70,3 +76,4 @@ class PhotoResponse(BaseModel):
                 "uploaded_at": "2025-11-10T10:05:00"
             }
         }
+    )
@@ -1,6 +1,6 @@
 """Subject-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -23,8 +23,8 @@ class SubjectCreate(BaseModel):
     weight_kg: Optional[float] = Field(None, ge=2, le=300, description="Weight in kilograms")
     notes: Optional[str] = Field(None, max_length=1000, description="Additional notes")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Subject_001",
                 "age": 25,
@@ -34,6 +34,7 @@ class SubjectCreate(BaseModel):
                 "notes": "Athletic build"
             }
         }
+    )
 
 
 class SubjectUpdate(BaseModel):
@@ -60,9 +61,9 @@ class SubjectResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "subj_abc123xyz",
                 "name": "Subject_001",
@@ -77,6 +78,7 @@ class SubjectResponse(BaseModel):
                 "updated_at": "2025-11-10T10:30:00"
             }
         }
+    )
 
 
 class SubjectList(BaseModel):
@@ -86,8 +88,8 @@ class SubjectList(BaseModel):
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, le=100, description="Items per page")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "subjects": [],
                 "total": 42,
@@ -95,3 +97,4 @@ class SubjectList(BaseModel):
                 "page_size": 20
             }
         }
+    )
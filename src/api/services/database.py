@@ -3,37 +3,73 @@
 import aiosqlite
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Compiled statements kept per connection, keyed by SQL text. Services use
+# constant query strings, so repeat queries skip SQLite's parse/plan step
+# (about 3x faster for a primary-key SELECT). Sized above the default 128
+# to hold every variant of the dynamically built UPDATE/list queries.
+STATEMENT_CACHE_SIZE = 256
+
 
 class DatabaseService:
     """Service for managing database connections and operations."""
 
-    def __init__(self, db_path: str = "data/anny_fitter.db"):
+    def __init__(self, db_path: str = "data/anny_fitter.db", pool_size: int = 5):
         """
         Initialize database service.
 
+        All writes go through one connection. Reads are spread over
+        pool_size - 1 read-only connections, each served by its own aiosqlite
+        thread, so concurrent requests do not queue behind one another.
+
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file (":memory:" for a
+                private in-memory database, which uses a single connection)
+            pool_size: Total number of connections opened at startup
         """
         self.db_path = db_path
+        self.pool_size = pool_size
         self.connection: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._next_reader = 0
 
     async def initialize(self):
         """Initialize database and create tables."""
-        # Ensure data directory exists
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        in_memory = self.db_path == ":memory:"
+        if not in_memory:
+            # Ensure data directory exists
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Connect to database
-        self.connection = await aiosqlite.connect(self.db_path)
+        self.connection = await aiosqlite.connect(
+            self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
         self.connection.row_factory = aiosqlite.Row
 
+        if not in_memory:
+            # WAL lets the read-only connections read while the writer commits
+            await self.connection.execute("PRAGMA journal_mode=WAL")
+            await self.connection.execute("PRAGMA synchronous=NORMAL")
+
         # Create tables
         await self._create_tables()
 
-        logger.info(f"Database initialized at {self.db_path}")
+        if not in_memory:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            for _ in range(self.pool_size - 1):
+                reader = await aiosqlite.connect(
+                    uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE
+                )
+                reader.row_factory = aiosqlite.Row
+                self._readers.append(reader)
+
+        logger.info(
+            f"Database initialized at {self.db_path} "
+            f"({len(self._readers)} read connections)"
+        )
 
     async def _create_tables(self):
         """Create database tables if they don't exist."""
@@ -99,10 +135,10 @@ class DatabaseService:
                 CREATE TABLE IF NOT EXISTS model_parameters (
                     id TEXT PRIMARY KEY,
                     subject_id TEXT NOT NULL UNIQUE,
-                    shape_params TEXT NOT NULL,
-                    pose_params TEXT NOT NULL,
-                    global_rotation TEXT NOT NULL,
-                    global_translation TEXT NOT NULL,
+                    shape_params BLOB NOT NULL,
+                    pose_params BLOB NOT NULL,
+                    global_rotation BLOB NOT NULL,
+                    global_translation BLOB NOT NULL,
                     num_vertices INTEGER NOT NULL,
                     num_faces INTEGER NOT NULL,
                     final_loss REAL,
@@ -139,16 +175,31 @@ class DatabaseService:
             await cursor.execute("CREATE INDEX IF NOT EXISTS idx_subjects_user ON subjects(user_id)")
             await cursor.execute("CREATE INDEX IF NOT EXISTS idx_photos_subject ON photos(subject_id)")
             await cursor.execute("CREATE INDEX IF NOT EXISTS idx_fitting_subject ON fitting_tasks(subject_id)")
-            await cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_subject ON metrics(subject_id)")
+            # Serves the paginated newest-first metrics query without a sort
+            await cursor.execute("DROP INDEX IF EXISTS idx_metrics_subject")
+            await cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metrics_subject_created "
+                "ON metrics(subject_id, created_at DESC)"
+            )
 
             await self.connection.commit()
 
     async def close(self):
-        """Close database connection."""
+        """Close database connections."""
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
         if self.connection:
             await self.connection.close()
             logger.info("Database connection closed")
 
+    def _reader(self) -> aiosqlite.Connection:
+        """Next read connection, round-robin; the writer if there are none."""
+        if not self._readers:
+            return self.connection
+        self._next_reader = (self._next_reader + 1) % len(self._readers)
+        return self._readers[self._next_reader]
+
     async def execute(self, query: str, params: tuple = ()):
         """Execute a query."""
         async with self.connection.cursor() as cursor:
@@ -158,12 +209,12 @@ class DatabaseService:
 
     async def fetch_one(self, query: str, params: tuple = ()):
         """Fetch one row."""
-        async with self.connection.cursor() as cursor:
+        async with self._reader().cursor() as cursor:
             await cursor.execute(query, params)
             return await cursor.fetchone()
 
     async def fetch_all(self, query: str, params: tuple = ()):
         """Fetch all rows."""
-        async with self.connection.cursor() as cursor:
+        async with self._reader().cursor() as cursor:
             await cursor.execute(query, params)
             return await cursor.fetchall()
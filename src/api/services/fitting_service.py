@@ -1,9 +1,18 @@
 """Model fitting service."""
 
+import array
+import asyncio
+import gzip
+import hashlib
+import os
+import sys
+import time
 import uuid
 import json
 import logging
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 from datetime import datetime
 from fastapi import BackgroundTasks
 
@@ -16,9 +25,221 @@ from src.api.schemas import (
     FittingMetrics
 )
 from src.api.services.database import DatabaseService
+from src.api.services.subject_service import invalidate_subject
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Rows written before parameters were stored as binary hold JSON text;
+# orjson parses them several times faster than the stdlib when installed.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+# Worker processes for the CPU-bound optimization, so fits run in parallel
+# and never on the API event loop or its thread pool
+FITTING_WORKERS = int(os.getenv("FITTING_WORKERS", "2"))
+_fitting_executor: Optional[ProcessPoolExecutor] = None
+
+# Latest status of fits started by this process, so status polls skip the
+# database: subject_id -> (expiry on the monotonic clock, status). Short
+# TTL so a fit run by another worker process is picked up from the
+# database soon after.
+LIVE_STATUS_TTL = 120.0
+_live_status: Dict[str, Tuple[float, FittingStatus]] = {}
+
+# Serialized model parameters by subject (LRU), built once when a fit
+# completes or on first read, so model GETs skip the query and
+# re-serialization: subject_id -> (expiry on the monotonic clock, payload).
+# The TTL bounds staleness after a re-fit run by another worker process.
+MODEL_CACHE_TTL = 60.0
+MODEL_CACHE_SIZE = 1024
+
+
+class ModelPayload(NamedTuple):
+    """Serialized ModelParameters ready to send as a response body."""
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+
+_model_payloads: "OrderedDict[str, Tuple[float, ModelPayload]]" = OrderedDict()
+
+# Status polls allowed per (user, subject) in each one-second window, so a
+# runaway client cannot flood the endpoint: key -> [window start, count]
+STATUS_POLL_LIMIT = 5
+STATUS_POLL_KEYS = 10_000
+_status_polls: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+
+# Database reads of a fitting status in flight, by subject, so concurrent
+# polls that miss _live_status share a single query
+_status_fetches: Dict[str, "asyncio.Task[Optional[FittingStatus]]"] = {}
+
+# Open status streams by subject; _set_live_status pushes every change to
+# them. Streams also re-read the status every STATUS_STREAM_POLL_INTERVAL
+# seconds to pick up fits run by other worker processes.
+STATUS_STREAM_POLL_INTERVAL = 5.0
+_status_streams: Dict[str, Set["asyncio.Queue[FittingStatus]"]] = {}
+
+# Progress reported for each status (placeholder until fitting reports it)
+_STATUS_PROGRESS = {
+    FittingStatusEnum.PENDING: 0.0,
+    FittingStatusEnum.PROCESSING: 50.0,
+    FittingStatusEnum.COMPLETED: 100.0,
+    FittingStatusEnum.FAILED: 0.0,
+}
+
+# Statuses after which a fit's status no longer changes
+_TERMINAL_STATUSES = frozenset({FittingStatusEnum.COMPLETED, FittingStatusEnum.FAILED})
+
+
+def get_fitting_executor() -> ProcessPoolExecutor:
+    """Return the shared fitting worker pool, starting it on first use."""
+    global _fitting_executor
+    if _fitting_executor is None:
+        _fitting_executor = ProcessPoolExecutor(max_workers=FITTING_WORKERS)
+    return _fitting_executor
+
+
+def shutdown_fitting_executor():
+    """Stop the fitting worker pool, if it was started."""
+    global _fitting_executor
+    if _fitting_executor is not None:
+        _fitting_executor.shutdown(wait=False, cancel_futures=True)
+        _fitting_executor = None
+
+
+def _pack_floats(values: List[float]) -> bytes:
+    """Encode a parameter array as little-endian float64 bytes."""
+    packed = array.array("d", values)
+    if _BIG_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_floats(value: Union[bytes, str]) -> List[float]:
+    """Decode a parameter array stored by _pack_floats (or as legacy JSON text)."""
+    if isinstance(value, str):
+        return _json_loads(value)
+    unpacked = array.array("d")
+    unpacked.frombytes(value)
+    if _BIG_ENDIAN:
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def allow_status_poll(user_id: str, subject_id: str) -> bool:
+    """
+    Count a status poll against its (user, subject) per-second limit.
+
+    Args:
+        user_id: Polling user
+        subject_id: Subject being polled
+
+    Returns:
+        True if the poll is within STATUS_POLL_LIMIT for the current window
+    """
+    now = time.monotonic()
+    key = (user_id, subject_id)
+    window = _status_polls.get(key)
+    if window is None or now - window[0] >= 1.0:
+        _status_polls[key] = [now, 1]
+        _status_polls.move_to_end(key)
+        if len(_status_polls) > STATUS_POLL_KEYS:
+            _status_polls.popitem(last=False)
+        return True
+    window[1] += 1
+    return window[1] <= STATUS_POLL_LIMIT
+
+
+def _cache_model_payload(subject_id: str, params: ModelParameters) -> ModelPayload:
+    """Serialize and gzip model parameters once and cache the result."""
+    body = params.model_dump_json().encode()
+    payload = ModelPayload(
+        body=body,
+        gzipped=gzip.compress(body, compresslevel=1),
+        # Weak, since the one tag covers both the identity and gzip encodings
+        etag=f'W/"{hashlib.sha1(body).hexdigest()}"'
+    )
+    _model_payloads.pop(subject_id, None)
+    _model_payloads[subject_id] = (time.monotonic() + MODEL_CACHE_TTL, payload)
+    if len(_model_payloads) > MODEL_CACHE_SIZE:
+        _model_payloads.popitem(last=False)
+    return payload
+
+
+def _fit_subject(subject_id: str, settings: dict) -> Tuple[dict, dict]:
+    """
+    Fit the body model for one subject, in a fitting worker process.
+
+    Only the subject ID and plain settings cross the process boundary;
+    photos are loaded here, inside the worker.
+
+    This is a placeholder implementation - integrate with actual Anny model.
+
+    Args:
+        subject_id: Subject to fit
+        settings: FittingRequest fields as a dict
+
+    Returns:
+        Tuple of (ModelParameters fields, FittingMetrics fields) as dicts
+    """
+    start = time.perf_counter()
+
+    # TODO: Integrate with actual Anny model fitting
+    # This is where you would:
+    # 1. Load photos from storage
+    # 2. Initialize Anny model
+    # 3. Run optimization with provided parameters
+    # 4. Extract fitted parameters
+
+    # Simulated fitting process
+    time.sleep(5)  # Simulate processing time
+
+    # Generate mock parameters (replace with actual fitted parameters)
+    model_params = {
+        "shape_params": [0.0] * 10,
+        "pose_params": [0.0] * 72,
+        "global_rotation": [0.0, 0.0, 0.0],
+        "global_translation": [0.0, 0.0, 0.0],
+        "num_vertices": 13776,
+        "num_faces": 27386
+    }
+
+    metrics = {
+        "final_loss": 0.0123,
+        "iterations_completed": settings["optimization_iterations"],
+        "convergence_achieved": True,
+        "processing_time_seconds": time.perf_counter() - start,
+        "photo_reprojection_error": 2.3
+    }
+
+    return model_params, metrics
+
+
+def _set_live_status(
+    subject_id: str,
+    status: FittingStatusEnum,
+    message: Optional[str] = None
+):
+    """Record a fit's latest status for get_fitting_status, dropping expired entries."""
+    now = time.monotonic()
+    for key in [key for key, (expires_at, _) in _live_status.items() if expires_at <= now]:
+        del _live_status[key]
+    fitting_status = FittingStatus(
+        status=status,
+        progress=_STATUS_PROGRESS[status],
+        message=message
+    )
+    _live_status[subject_id] = (now + LIVE_STATUS_TTL, fitting_status)
+    for queue in _status_streams.get(subject_id, ()):
+        queue.put_nowait(fitting_status)
+
 
 class FittingService:
     """Service for managing model fitting operations."""
@@ -60,6 +281,7 @@ class FittingService:
         )
 
         await self.db.execute(query, params)
+        _set_live_status(subject_id, FittingStatusEnum.PENDING)
 
         # Queue background task
         background_tasks.add_task(
@@ -83,47 +305,31 @@ class FittingService:
         fitting_request: FittingRequest
     ):
         """
-        Run the actual fitting process in background.
+        Run the fitting process in background.
 
-        This is a placeholder implementation - integrate with actual Anny model.
+        Only bookkeeping happens here; the optimization itself runs in the
+        fitting worker pool (see _fit_subject).
         """
         try:
             # Update status to processing
             await self._update_fitting_status(fitting_id, FittingStatusEnum.PROCESSING)
+            _set_live_status(subject_id, FittingStatusEnum.PROCESSING)
 
             logger.info(f"Starting fitting task {fitting_id} for subject {subject_id}")
 
-            # TODO: Integrate with actual Anny model fitting
-            # This is where you would:
-            # 1. Load photos from storage
-            # 2. Initialize Anny model
-            # 3. Run optimization with provided parameters
-            # 4. Extract fitted parameters
-
-            # Simulated fitting process
-            import asyncio
-            await asyncio.sleep(5)  # Simulate processing time
-
-            # Generate mock parameters (replace with actual fitted parameters)
-            model_params = ModelParameters(
-                shape_params=[0.0] * 10,
-                pose_params=[0.0] * 72,
-                global_rotation=[0.0, 0.0, 0.0],
-                global_translation=[0.0, 0.0, 0.0],
-                num_vertices=13776,
-                num_faces=27386
-            )
-
-            metrics = FittingMetrics(
-                final_loss=0.0123,
-                iterations_completed=fitting_request.optimization_iterations,
-                convergence_achieved=True,
-                processing_time_seconds=5.0,
-                photo_reprojection_error=2.3
+            loop = asyncio.get_running_loop()
+            params_data, metrics_data = await loop.run_in_executor(
+                get_fitting_executor(),
+                _fit_subject,
+                subject_id,
+                fitting_request.model_dump()
             )
+            model_params = ModelParameters(**params_data)
+            metrics = FittingMetrics(**metrics_data)
 
             # Save model parameters
             await self._save_model_parameters(subject_id, model_params, metrics)
+            _cache_model_payload(subject_id, model_params)
 
             # Update fitting status to completed
             await self._update_fitting_status(
@@ -137,6 +343,8 @@ class FittingService:
                 "UPDATE subjects SET has_fitted_model = 1 WHERE id = ?",
                 (subject_id,)
             )
+            invalidate_subject(subject_id)
+            _set_live_status(subject_id, FittingStatusEnum.COMPLETED)
 
             logger.info(f"Fitting task {fitting_id} completed successfully")
 
@@ -147,6 +355,7 @@ class FittingService:
                 FittingStatusEnum.FAILED,
                 error_message=str(e)
             )
+            _set_live_status(subject_id, FittingStatusEnum.FAILED, message=str(e))
 
     async def _update_fitting_status(
         self,
@@ -199,10 +408,10 @@ class FittingService:
         query_params = (
             param_id,
             subject_id,
-            json.dumps(params.shape_params),
-            json.dumps(params.pose_params),
-            json.dumps(params.global_rotation),
-            json.dumps(params.global_translation),
+            _pack_floats(params.shape_params),
+            _pack_floats(params.pose_params),
+            _pack_floats(params.global_rotation),
+            _pack_floats(params.global_translation),
             params.num_vertices,
             params.num_faces,
             metrics.final_loss,
@@ -220,6 +429,67 @@ class FittingService:
         user_id: str
     ) -> Optional[FittingStatus]:
         """Get current fitting status."""
+        cached = _live_status.get(subject_id)
+        if cached is not None:
+            expires_at, fitting_status = cached
+            if expires_at > time.monotonic():
+                return fitting_status
+            _live_status.pop(subject_id, None)
+
+        fetch = _status_fetches.get(subject_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._load_fitting_status(subject_id))
+            _status_fetches[subject_id] = fetch
+            fetch.add_done_callback(
+                lambda done: _status_fetches.pop(subject_id)
+                if _status_fetches.get(subject_id) is done else None
+            )
+        # Shielded so one cancelled poll does not cancel the shared query
+        return await asyncio.shield(fetch)
+
+    async def watch_fitting_status(
+        self,
+        subject_id: str,
+        user_id: str,
+        initial: FittingStatus
+    ) -> AsyncIterator[Optional[FittingStatus]]:
+        """
+        Follow a fit's status until it completes or fails.
+
+        Args:
+            subject_id: Subject whose fit to follow
+            user_id: Requesting user
+            initial: Status the caller has already sent to the client
+
+        Yields:
+            Each new status, or None when nothing changed for
+            STATUS_STREAM_POLL_INTERVAL seconds (a keep-alive point)
+        """
+        queue: "asyncio.Queue[FittingStatus]" = asyncio.Queue()
+        _status_streams.setdefault(subject_id, set()).add(queue)
+        try:
+            last = initial
+            # Catch a change made between reading initial and subscribing
+            current = await self.get_fitting_status(subject_id, user_id)
+            while last.status not in _TERMINAL_STATUSES:
+                if current is not None and current != last:
+                    last = current
+                    yield current
+                    continue
+                try:
+                    current = await asyncio.wait_for(queue.get(), STATUS_STREAM_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    current = await self.get_fitting_status(subject_id, user_id)
+                    if current == last:
+                        yield None
+        finally:
+            streams = _status_streams[subject_id]
+            streams.discard(queue)
+            if not streams:
+                del _status_streams[subject_id]
+
+    async def _load_fitting_status(self, subject_id: str) -> Optional[FittingStatus]:
+        """Read a subject's latest fitting status from the database."""
         query = """
             SELECT * FROM fitting_tasks
             WHERE subject_id = ?
@@ -231,18 +501,10 @@ class FittingService:
         if not row:
             return None
 
-        # Calculate progress
-        progress = 0.0
-        if row["status"] == FittingStatusEnum.COMPLETED.value:
-            progress = 100.0
-        elif row["status"] == FittingStatusEnum.PROCESSING.value:
-            progress = 50.0  # Placeholder
-        elif row["status"] == FittingStatusEnum.PENDING.value:
-            progress = 0.0
-
+        status = FittingStatusEnum(row["status"])
         return FittingStatus(
-            status=FittingStatusEnum(row["status"]),
-            progress=progress,
+            status=status,
+            progress=_STATUS_PROGRESS[status],
             message=row["error_message"] if row["error_message"] else None
         )
 
@@ -262,10 +524,39 @@ class FittingService:
             return None
 
         return ModelParameters(
-            shape_params=json.loads(row["shape_params"]),
-            pose_params=json.loads(row["pose_params"]),
-            global_rotation=json.loads(row["global_rotation"]),
-            global_translation=json.loads(row["global_translation"]),
+            shape_params=_unpack_floats(row["shape_params"]),
+            pose_params=_unpack_floats(row["pose_params"]),
+            global_rotation=_unpack_floats(row["global_rotation"]),
+            global_translation=_unpack_floats(row["global_translation"]),
             num_vertices=row["num_vertices"],
             num_faces=row["num_faces"]
         )
+
+    async def get_model_payload(
+        self,
+        subject_id: str,
+        user_id: str
+    ) -> Optional[ModelPayload]:
+        """
+        Get fitted model parameters as a serialized response body.
+
+        Args:
+            subject_id: Subject whose model to fetch
+            user_id: Requesting user
+
+        Returns:
+            Cached JSON body, its gzip encoding and ETag, or None if no
+            model has been fitted
+        """
+        cached = _model_payloads.get(subject_id)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at > time.monotonic():
+                _model_payloads.move_to_end(subject_id)
+                return payload
+            del _model_payloads[subject_id]
+
+        params = await self.get_model_parameters(subject_id, user_id)
+        if params is None:
+            return None
+        return _cache_model_payload(subject_id, params)
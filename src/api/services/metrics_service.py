@@ -68,16 +68,21 @@ class MetricsService:
     async def get_subject_metrics(
         self,
         subject_id: str,
-        user_id: str
+        user_id: str,
+        page: int = 1,
+        page_size: int = 50
     ) -> List[MetricsResponse]:
-        """Get all metrics for a subject."""
+        """Get one page of a subject's metrics, newest first."""
+        offset = (page - 1) * page_size
+
         query = """
             SELECT m.* FROM metrics m
             JOIN subjects s ON m.subject_id = s.id
             WHERE m.subject_id = ? AND s.user_id = ?
             ORDER BY m.created_at DESC
+            LIMIT ? OFFSET ?
         """
-        rows = await self.db.fetch_all(query, (subject_id, user_id))
+        rows = await self.db.fetch_all(query, (subject_id, user_id, page_size, offset))
 
         return [self._row_to_metrics(row) for row in rows]
 
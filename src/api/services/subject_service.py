@@ -1,8 +1,11 @@
 """Subject management service."""
 
+import os
+import time
 import uuid
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from src.api.schemas import SubjectCreate, SubjectResponse, SubjectUpdate, SubjectList
@@ -10,6 +13,19 @@ from src.api.services.database import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Recently read subjects by ID (LRU), so the existence check that opens most
+# endpoints skips the database: subject_id -> (expiry on the monotonic clock,
+# owner user_id, subject). Writes made by this process invalidate entries;
+# the short TTL bounds staleness from writes made by other worker processes.
+SUBJECT_CACHE_TTL = float(os.getenv("SUBJECT_CACHE_TTL", "10"))
+SUBJECT_CACHE_SIZE = 4096
+_subject_cache: "OrderedDict[str, Tuple[float, str, SubjectResponse]]" = OrderedDict()
+
+
+def invalidate_subject(subject_id: str) -> None:
+    """Drop a subject from the cache after it has been written."""
+    _subject_cache.pop(subject_id, None)
+
 
 class SubjectService:
     """Service for managing subjects."""
@@ -44,6 +60,14 @@ class SubjectService:
 
     async def get_subject(self, subject_id: str, user_id: str) -> Optional[SubjectResponse]:
         """Get subject by ID."""
+        cached = _subject_cache.get(subject_id)
+        if cached is not None:
+            expires_at, owner_id, subject = cached
+            if expires_at > time.monotonic():
+                _subject_cache.move_to_end(subject_id)
+                return subject.model_copy() if owner_id == user_id else None
+            del _subject_cache[subject_id]
+
         query = """
             SELECT * FROM subjects
             WHERE id = ? AND user_id = ? AND deleted_at IS NULL
@@ -53,7 +77,12 @@ class SubjectService:
         if not row:
             return None
 
-        return self._row_to_subject(row)
+        subject = self._row_to_subject(row)
+        _subject_cache[subject_id] = (time.monotonic() + SUBJECT_CACHE_TTL, user_id, subject)
+        if len(_subject_cache) > SUBJECT_CACHE_SIZE:
+            _subject_cache.popitem(last=False)
+
+        return subject.model_copy()
 
     async def list_subjects(
         self,
@@ -141,6 +170,7 @@ class SubjectService:
         params.extend([subject_id, user_id])
 
         await self.db.execute(query, tuple(params))
+        invalidate_subject(subject_id)
 
         return await self.get_subject(subject_id, user_id)
 
@@ -174,6 +204,7 @@ class SubjectService:
             """
             await self.db.execute(query, (subject_id, user_id))
 
+        invalidate_subject(subject_id)
         return True
 
     def _row_to_subject(self, row) -> SubjectResponse:
@@ -58,9 +58,11 @@ class ConfidenceWeighting:
                 values = values[mask]
                 confidences = confidences[mask]
 
-        # Weighted average
-        if confidences.sum() > 0:
-            weighted_avg = np.average(values, weights=confidences)
+        # Weighted average (a plain dot product; np.average's argument
+        # checks and weight broadcasting dominate for a handful of images)
+        weight_sum = confidences.sum()
+        if weight_sum > 0:
+            weighted_avg = np.dot(values, confidences) / weight_sum
         else:
             weighted_avg = np.mean(values)
 
@@ -14,6 +14,12 @@ from pathlib import Path
 import tempfile
 import os
 
+# API test environment. Set here, before any test module imports src.api.main,
+# so tests/test_api and tests/integration get the same app whatever runs first.
+os.environ["DISABLE_AUTH"] = "true"
+# The API suites share one app (and rate limiter) from one client IP
+os.environ["RATE_LIMIT_PER_MINUTE"] = "10000"
+
 
 @pytest.fixture(scope="session")
 def test_data_dir():
@@ -11,6 +11,13 @@ import json
 from datetime import datetime
 
 from src.api.main import app
+from src.api.schemas import (
+    FittingResponse,
+    MetricsResponse,
+    ModelParameters,
+    SubjectList,
+    SubjectResponse
+)
 from src.api.services.database import DatabaseService
 from tests.fixtures.test_images import create_front_view_image
 
@@ -29,7 +36,7 @@ def mock_db_service():
 
 
 @pytest.fixture
-def client(mock_db_service):
+def client(mock_db_service, tmp_path):
     """Create test client with mocked dependencies."""
     # Override lifespan to use mock database
     from contextlib import asynccontextmanager
@@ -37,14 +44,27 @@ def client(mock_db_service):
     @asynccontextmanager
     async def mock_lifespan(app):
         app.state.db = mock_db_service
+        app.state.photo_storage_path = str(tmp_path / "photos")
         yield
 
-    # Replace lifespan
+    # Replace lifespan (restored afterwards so other suites get the real one)
+    original_lifespan = app.router.lifespan_context
     app.router.lifespan_context = mock_lifespan
 
-    with TestClient(app) as test_client:
-        test_client.app.state.db = mock_db_service
-        yield test_client
+    try:
+        with TestClient(app) as test_client:
+            test_client.app.state.db = mock_db_service
+            yield test_client
+    finally:
+        app.router.lifespan_context = original_lifespan
+
+
+def make_subject(**fields) -> SubjectResponse:
+    """Build a subject as SubjectService returns it."""
+    now = datetime.now()
+    return SubjectResponse(
+        **{"id": "subject-123", "name": "Test", "created_at": now, "updated_at": now, **fields}
+    )
 
 
 @pytest.fixture
@@ -116,35 +136,35 @@ class TestSubjectEndpoints:
     def test_list_subjects(self, mock_list, mock_auth, client, mock_auth_user):
         """Test listing subjects with pagination."""
         mock_auth.return_value = mock_auth_user
-        mock_list.return_value = {
-            "items": [
-                {"id": "1", "name": "Subject 1"},
-                {"id": "2", "name": "Subject 2"}
+        mock_list.return_value = SubjectList(
+            subjects=[
+                make_subject(id="1", name="Subject 1"),
+                make_subject(id="2", name="Subject 2")
             ],
-            "total": 2,
-            "page": 1,
-            "page_size": 20
-        }
+            total=2,
+            page=1,
+            page_size=20
+        )
 
         response = client.get("/api/v1/subjects?page=1&page_size=20")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data["items"]) == 2
+        assert len(data["subjects"]) == 2
         assert data["total"] == 2
+        assert response.headers["ETag"].startswith('W/"')
 
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
     def test_get_subject(self, mock_get, mock_auth, client, mock_auth_user):
         """Test getting a specific subject."""
         mock_auth.return_value = mock_auth_user
-        mock_get.return_value = {
-            "id": "subject-123",
-            "name": "John Doe",
-            "age": 30,
-            "photo_count": 3,
-            "has_fitted_model": True
-        }
+        mock_get.return_value = make_subject(
+            name="John Doe",
+            age=30,
+            photo_count=3,
+            has_fitted_model=True
+        )
 
         response = client.get("/api/v1/subjects/subject-123")
 
@@ -153,6 +173,14 @@ class TestSubjectEndpoints:
         assert data["id"] == "subject-123"
         assert data["has_fitted_model"] is True
 
+        # Revalidating with the returned ETag gets an empty 304
+        response = client.get(
+            "/api/v1/subjects/subject-123",
+            headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
     def test_get_subject_not_found(self, mock_get, mock_auth, client, mock_auth_user):
@@ -234,9 +262,10 @@ class TestPhotoEndpoints:
 
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
-    @patch('src.api.services.photo_service.PhotoService.upload_photos')
-    def test_upload_photos_invalid_type(self, mock_upload, mock_get_subject, mock_auth, client, mock_auth_user):
-        """Test rejecting invalid file types."""
+    def test_upload_photos_invalid_type(
+        self, mock_get_subject, mock_auth, client, mock_auth_user, mock_db_service
+    ):
+        """Test rejecting invalid file types (checked by the real PhotoService)."""
         mock_auth.return_value = mock_auth_user
         mock_get_subject.return_value = {"id": "subject-123"}
 
@@ -254,6 +283,8 @@ class TestPhotoEndpoints:
         )
 
         assert response.status_code == 400
+        assert "invalid file type" in response.json()["detail"].lower()
+        mock_db_service.execute.assert_not_awaited()
 
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.photo_service.PhotoService.get_subject_photos')
@@ -277,18 +308,17 @@ class TestFittingEndpoints:
 
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
-    @patch('src.api.services.photo_service.PhotoService.get_subject_photos')
+    @patch('src.api.services.photo_service.PhotoService.has_photos')
     @patch('src.api.services.fitting_service.FittingService.start_fitting')
     def test_start_fitting(self, mock_start, mock_photos, mock_subject, mock_auth, client, mock_auth_user):
         """Test starting model fitting process."""
         mock_auth.return_value = mock_auth_user
-        mock_subject.return_value = {"id": "subject-123", "name": "Test"}
-        mock_photos.return_value = [{"id": "photo-1"}]  # Has photos
-        mock_start.return_value = {
-            "task_id": "task-123",
-            "status": "pending",
-            "message": "Fitting process started"
-        }
+        mock_subject.return_value = make_subject(photo_count=1)  # Has photos
+        mock_start.return_value = FittingResponse(
+            subject_id="subject-123",
+            status="pending",
+            task_id="task-123"
+        )
 
         fitting_request = {
             "optimization_iterations": 100,
@@ -305,15 +335,42 @@ class TestFittingEndpoints:
         data = response.json()
         assert data["task_id"] == "task-123"
         assert data["status"] == "pending"
+        # A non-zero photo_count is trusted without querying the photos table
+        mock_photos.assert_not_awaited()
 
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
-    @patch('src.api.services.photo_service.PhotoService.get_subject_photos')
+    @patch('src.api.services.photo_service.PhotoService.has_photos')
+    @patch('src.api.services.fitting_service.FittingService.start_fitting')
+    def test_start_fitting_stale_photo_count(
+        self, mock_start, mock_photos, mock_subject, mock_auth, client, mock_auth_user
+    ):
+        """Test that a cached zero photo_count falls back to the photos table."""
+        mock_auth.return_value = mock_auth_user
+        mock_subject.return_value = make_subject(photo_count=0)
+        mock_photos.return_value = True  # Uploaded after the subject was cached
+        mock_start.return_value = FittingResponse(
+            subject_id="subject-123",
+            status="pending",
+            task_id="task-123"
+        )
+
+        response = client.post(
+            "/api/v1/subjects/subject-123/fit",
+            json={"optimization_iterations": 100}
+        )
+
+        assert response.status_code == 202
+        mock_photos.assert_awaited_once_with("subject-123")
+
+    @patch('src.api.middleware.auth.get_current_user')
+    @patch('src.api.services.subject_service.SubjectService.get_subject')
+    @patch('src.api.services.photo_service.PhotoService.has_photos')
     def test_start_fitting_no_photos(self, mock_photos, mock_subject, mock_auth, client, mock_auth_user):
         """Test fitting fails when no photos uploaded."""
         mock_auth.return_value = mock_auth_user
-        mock_subject.return_value = {"id": "subject-123"}
-        mock_photos.return_value = []  # No photos
+        mock_subject.return_value = make_subject(photo_count=0)
+        mock_photos.return_value = False  # No photos
 
         fitting_request = {"optimization_iterations": 100}
 
@@ -343,22 +400,22 @@ class TestFittingEndpoints:
         assert data["status"] == "processing"
         assert data["progress"] == 45.0
 
+    @patch.dict('src.api.services.fitting_service._model_payloads', clear=True)
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
     @patch('src.api.services.fitting_service.FittingService.get_model_parameters')
     def test_get_fitted_model(self, mock_params, mock_subject, mock_auth, client, mock_auth_user):
         """Test retrieving fitted model parameters."""
         mock_auth.return_value = mock_auth_user
-        mock_subject.return_value = {
-            "id": "subject-123",
-            "has_fitted_model": True
-        }
-        mock_params.return_value = {
-            "shape_params": [0.1, 0.2, -0.1],
-            "pose_params": [0.0] * 24,
-            "num_vertices": 6890,
-            "num_faces": 13776
-        }
+        mock_subject.return_value = make_subject(has_fitted_model=True)
+        mock_params.return_value = ModelParameters(
+            shape_params=[0.1, 0.2, -0.1],
+            pose_params=[0.0] * 24,
+            global_rotation=[0.0, 0.0, 0.0],
+            global_translation=[0.0, 0.0, 0.0],
+            num_vertices=6890,
+            num_faces=13776
+        )
 
         response = client.get("/api/v1/subjects/subject-123/model")
 
@@ -367,15 +424,17 @@ class TestFittingEndpoints:
         assert "shape_params" in data
         assert data["num_vertices"] == 6890
 
+    @patch.dict('src.api.services.fitting_service._model_payloads', clear=True)
     @patch('src.api.middleware.auth.get_current_user')
     @patch('src.api.services.subject_service.SubjectService.get_subject')
-    def test_get_fitted_model_not_available(self, mock_subject, mock_auth, client, mock_auth_user):
+    @patch('src.api.services.fitting_service.FittingService.get_model_parameters')
+    def test_get_fitted_model_not_available(
+        self, mock_params, mock_subject, mock_auth, client, mock_auth_user
+    ):
         """Test retrieving model when not fitted yet."""
         mock_auth.return_value = mock_auth_user
-        mock_subject.return_value = {
-            "id": "subject-123",
-            "has_fitted_model": False
-        }
+        mock_subject.return_value = make_subject(has_fitted_model=False)
+        mock_params.return_value = None
 
         response = client.get("/api/v1/subjects/subject-123/model")
 
@@ -425,8 +484,15 @@ class TestMetricsEndpoints:
         """Test retrieving metrics for a subject."""
         mock_auth.return_value = mock_auth_user
         mock_get.return_value = [
-            {"id": "1", "accuracy_score": 0.92},
-            {"id": "2", "accuracy_score": 0.95}
+            MetricsResponse(
+                id=metrics_id,
+                subject_id="subject-123",
+                metrics={"accuracy_score": accuracy},
+                ground_truth_available=True,
+                validation_method="manual",
+                created_at=datetime.now()
+            )
+            for metrics_id, accuracy in (("1", 0.92), ("2", 0.95))
         ]
 
         response = client.get("/api/v1/subjects/subject-123/metrics")
@@ -7,11 +7,19 @@ from pathlib import Path
 import tempfile
 import os
 
-# Set test environment
-os.environ["DISABLE_AUTH"] = "true"
+# Set test environment (DISABLE_AUTH and the rate limit are set in tests/conftest.py)
 os.environ["DATABASE_PATH"] = ":memory:"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def photo_storage(tmp_path_factory):
+    """Store uploaded photos in a temporary directory instead of data/photos."""
+    storage_path = tmp_path_factory.mktemp("photos")
+    os.environ["PHOTO_STORAGE_PATH"] = str(storage_path)
+    yield storage_path
+    os.environ.pop("PHOTO_STORAGE_PATH", None)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create event loop for async tests."""
@@ -35,10 +43,11 @@ async def test_db():
 
 @pytest.fixture
 def client():
-    """Create test client."""
+    """Create test client (entering it runs the app's startup and shutdown)."""
     from src.api.main import app
 
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -0,0 +1,55 @@
+"""Tests for the HTTP caching and content negotiation helpers."""
+
+import pytest
+from starlette.requests import Request
+
+from src.api.routes.caching import accepts_gzip
+
+
+def make_request(**headers: str) -> Request:
+    """Build a bare GET request with the given headers."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [
+            (name.replace("_", "-").lower().encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    })
+
+
+class TestAcceptsGzip:
+    """Test suite for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize("header", [
+        "gzip",
+        "gzip, deflate, br",
+        "br;q=1.0, GZIP;q=0.5",
+        "gzip ; q=0.001",
+        "*",
+        "identity;q=0.5, *;q=0.1",
+    ])
+    def test_accepts(self, header):
+        """Test headers that allow a gzip response."""
+        assert accepts_gzip(make_request(accept_encoding=header))
+
+    @pytest.mark.parametrize("header", [
+        "",
+        "identity",
+        "gzip;q=0",
+        "gzip;q=0.0, br",
+        "x-gzip",
+        "*;q=0",
+        "*, gzip;q=0",
+        "gzip;q=oops",
+    ])
+    def test_refuses(self, header):
+        """Test headers that rule out a gzip response."""
+        assert not accepts_gzip(make_request(accept_encoding=header))
+
+    def test_missing_header(self):
+        """Test that a request without Accept-Encoding gets no gzip."""
+        assert not accepts_gzip(make_request())
+
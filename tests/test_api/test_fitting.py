@@ -33,6 +33,20 @@ class TestFittingEndpoints:
         assert photos[0]["width_px"] == 100
         assert photos[0]["height_px"] == 100
 
+    def test_upload_photos_refreshes_subject(
+        self, client, sample_subject_data, sample_photo_metadata, temp_photo
+    ):
+        """Test that a cached subject reflects photos uploaded after it was read."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+        assert client.get(f"/api/v1/subjects/{subject_id}").json()["photo_count"] == 0
+
+        files = {"files": ("test.jpg", temp_photo, "image/jpeg")}
+        data = {"metadata": json.dumps(sample_photo_metadata)}
+        client.post(f"/api/v1/subjects/{subject_id}/photos", files=files, data=data)
+
+        assert client.get(f"/api/v1/subjects/{subject_id}").json()["photo_count"] == 1
+
     def test_upload_photos_invalid_file_type(self, client, sample_subject_data):
         """Test uploading invalid file type."""
         # Create subject
@@ -51,6 +65,43 @@ class TestFittingEndpoints:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_upload_photos_spoofed_content_type(self, client, sample_subject_data):
+        """Test that the file's magic bytes, not its content type header, are checked."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        files = {"files": ("test.jpg", b"not an image", "image/jpeg")}
+        data = {"metadata": json.dumps([{"photo_type": "front"}])}
+
+        response = client.post(
+            f"/api/v1/subjects/{subject_id}/photos",
+            files=files,
+            data=data
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_upload_photos_rejects_whole_batch(self, client, sample_subject_data, temp_photo):
+        """Test that one invalid file in a batch rejects every file in it."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        files = [
+            ("files", ("good.jpg", temp_photo, "image/jpeg")),
+            ("files", ("bad.txt", b"not an image", "text/plain")),
+        ]
+        data = {"metadata": json.dumps([{"photo_type": "front"}, {"photo_type": "side"}])}
+
+        response = client.post(
+            f"/api/v1/subjects/{subject_id}/photos",
+            files=files,
+            data=data
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert client.get(f"/api/v1/subjects/{subject_id}/photos").json() == []
+        assert client.get(f"/api/v1/subjects/{subject_id}").json()["photo_count"] == 0
+
     def test_upload_photos_metadata_mismatch(self, client, sample_subject_data, temp_photo):
         """Test uploading with mismatched metadata count."""
         # Create subject
@@ -69,6 +120,20 @@ class TestFittingEndpoints:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_upload_photos_invalid_metadata(self, client, sample_subject_data, temp_photo):
+        """Test that metadata entries are validated against PhotoMetadata."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        files = {"files": ("test.jpg", temp_photo, "image/jpeg")}
+        for metadata in ("not json", json.dumps([{"photo_type": "overhead"}])):
+            response = client.post(
+                f"/api/v1/subjects/{subject_id}/photos",
+                files=files,
+                data={"metadata": metadata}
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_list_subject_photos(self, client, sample_subject_data, sample_photo_metadata, temp_photo):
         """Test listing photos for a subject."""
         # Create subject and upload photo
@@ -172,6 +237,82 @@ class TestFittingEndpoints:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_get_fitting_status_poll_limit(self, client, sample_subject_data):
+        """Test that rapid status polls for one subject are limited."""
+        from src.api.services.fitting_service import STATUS_POLL_LIMIT
+
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        codes = [
+            client.get(f"/api/v1/subjects/{subject_id}/fit/status").status_code
+            for _ in range(STATUS_POLL_LIMIT + 1)
+        ]
+
+        assert codes[:-1] == [status.HTTP_404_NOT_FOUND] * STATUS_POLL_LIMIT
+        assert codes[-1] == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_concurrent_status_reads_share_query(self):
+        """Test that concurrent status reads for one subject run a single query."""
+        import asyncio
+        from src.api.services.fitting_service import FittingService
+
+        class SlowDatabase:
+            queries = 0
+
+            async def fetch_one(self, query, params):
+                SlowDatabase.queries += 1
+                await asyncio.sleep(0.01)
+                return {"status": "processing", "error_message": None}
+
+        async def poll_many():
+            service = FittingService(SlowDatabase())
+            return await asyncio.gather(
+                *(service.get_fitting_status("subj_shared", "user") for _ in range(10))
+            )
+
+        results = asyncio.run(poll_many())
+
+        assert SlowDatabase.queries == 1
+        assert all(r.status == "processing" for r in results)
+
+    def test_watch_fitting_status_follows_fit(self):
+        """Test that status changes are pushed to a watcher until the fit ends."""
+        import asyncio
+        from src.api.services import fitting_service as fs
+
+        async def follow_fit():
+            fs._set_live_status("subj_watched", fs.FittingStatusEnum.PENDING)
+            service = fs.FittingService(db=None)
+            initial = await service.get_fitting_status("subj_watched", "user")
+
+            async def run_fit():
+                await asyncio.sleep(0.01)
+                fs._set_live_status("subj_watched", fs.FittingStatusEnum.PROCESSING)
+                await asyncio.sleep(0.01)
+                fs._set_live_status("subj_watched", fs.FittingStatusEnum.COMPLETED)
+
+            fit = asyncio.ensure_future(run_fit())
+            seen = [s.status async for s in service.watch_fitting_status(
+                "subj_watched", "user", initial
+            )]
+            await fit
+            return seen
+
+        seen = asyncio.run(follow_fit())
+
+        assert seen == ["processing", "completed"]
+        assert "subj_watched" not in fs._status_streams
+
+    def test_stream_fitting_status_no_task(self, client, sample_subject_data):
+        """Test streaming status when no fitting has been started."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        response = client.get(f"/api/v1/subjects/{subject_id}/fit/stream")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_get_fitted_model_not_available(self, client, sample_subject_data):
         """Test getting model when fitting hasn't completed."""
         # Create subject without fitting
@@ -0,0 +1,213 @@
+"""Tests for the rate limiting and authentication middleware."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.api.middleware import auth, rate_limit
+from src.api.middleware.rate_limit import RateLimitMiddleware
+
+
+def make_request(path: str = "/api/v1/subjects", ip: str = "10.0.0.1") -> Request:
+    """Build a bare GET request from a client IP."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+        "client": (ip, 12345),
+    })
+
+
+async def call_next(request: Request) -> Response:
+    return Response("ok")
+
+
+@pytest.fixture
+def token_cache():
+    """Empty decoded-token cache, cleared again afterwards."""
+    auth._token_cache.clear()
+    yield auth._token_cache
+    auth._token_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the rate limiter."""
+    fake_time = SimpleNamespace(now=1000.0)
+    fake_time.monotonic = lambda: fake_time.now
+    monkeypatch.setattr(rate_limit, "time", fake_time)
+    return fake_time
+
+
+class TestRateLimitMiddleware:
+    """Test suite for the token-bucket rate limiter."""
+
+    def dispatch(self, limiter, **kwargs) -> Response:
+        return asyncio.run(limiter.dispatch(make_request(**kwargs), call_next))
+
+    def test_remaining_headers(self, clock):
+        """Test that responses report the limits and the tokens left."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=5, requests_per_hour=100)
+
+        self.dispatch(limiter)
+        response = self.dispatch(limiter)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-RateLimit-Minute-Limit"] == "5"
+        assert response.headers["X-RateLimit-Minute-Remaining"] == "3"
+        assert response.headers["X-RateLimit-Hour-Limit"] == "100"
+        assert response.headers["X-RateLimit-Hour-Remaining"] == "98"
+
+    def test_minute_bucket_empty(self, clock):
+        """Test that a burst beyond the minute limit gets 429."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=3, requests_per_hour=100)
+
+        for _ in range(3):
+            assert self.dispatch(limiter).status_code == status.HTTP_200_OK
+        response = self.dispatch(limiter)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "60"
+        assert b"per minute" in response.body
+
+    def test_hour_bucket_empty(self, clock):
+        """Test that the hour limit applies once its tokens are spent."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=100, requests_per_hour=2)
+
+        for _ in range(2):
+            assert self.dispatch(limiter).status_code == status.HTTP_200_OK
+        response = self.dispatch(limiter)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert b"per hour" in response.body
+
+    def test_rejected_requests_spend_no_tokens(self, clock):
+        """Test that a 429 does not delay the bucket's recovery."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=3, requests_per_hour=100)
+
+        for _ in range(5):
+            self.dispatch(limiter)
+
+        assert limiter.buckets["10.0.0.1"][1] == 97.0
+
+    def test_refill(self, clock):
+        """Test that tokens refill continuously at the per-minute rate."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=3, requests_per_hour=100)
+        for _ in range(3):
+            self.dispatch(limiter)
+
+        # One token every 20 seconds at 3 per minute
+        clock.now += 19.0
+        assert self.dispatch(limiter).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        clock.now += 1.0
+        assert self.dispatch(limiter).status_code == status.HTTP_200_OK
+        assert self.dispatch(limiter).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+        # Refill is capped at the limit
+        clock.now += 3600.0
+        response = self.dispatch(limiter)
+        assert response.headers["X-RateLimit-Minute-Remaining"] == "2"
+
+    def test_health_checks_not_limited(self, clock):
+        """Test that health checks neither spend nor need tokens."""
+        limiter = RateLimitMiddleware(None, requests_per_minute=1, requests_per_hour=1)
+
+        for _ in range(3):
+            assert self.dispatch(limiter, path="/health").status_code == status.HTTP_200_OK
+
+        assert not limiter.buckets
+
+    def test_evicts_least_recently_seen(self, clock):
+        """Test that the bucket count is capped, evicting the stalest client."""
+        limiter = RateLimitMiddleware(None)
+        limiter.MAX_BUCKETS = 2
+
+        self.dispatch(limiter, ip="10.0.0.1")
+        self.dispatch(limiter, ip="10.0.0.2")
+        self.dispatch(limiter, ip="10.0.0.1")
+        self.dispatch(limiter, ip="10.0.0.3")
+
+        assert list(limiter.buckets) == ["10.0.0.1", "10.0.0.3"]
+
+    def test_sweeps_idle_buckets(self, clock):
+        """Test that the periodic sweep drops buckets idle for an hour."""
+        limiter = RateLimitMiddleware(None)
+        limiter.GC_INTERVAL = 3
+
+        self.dispatch(limiter, ip="10.0.0.1")
+        clock.now += 1000.0
+        self.dispatch(limiter, ip="10.0.0.2")
+        clock.now += 2700.0
+        self.dispatch(limiter, ip="10.0.0.3")
+
+        assert list(limiter.buckets) == ["10.0.0.2", "10.0.0.3"]
+
+
+class TestTokenCache:
+    """Test suite for the decoded JWT payload cache."""
+
+    def test_caches_valid_token(self, token_cache):
+        """Test that a decoded token is cached and served from the cache."""
+        token = auth.create_access_token({"sub": "user-1"})
+
+        assert auth.decode_access_token(token)["sub"] == "user-1"
+        assert token in token_cache
+        assert auth.decode_access_token(token)["sub"] == "user-1"
+
+    def test_expired_cached_token_evicted(self, token_cache):
+        """Test that a cached token past its exp is dropped and rejected."""
+        token = auth.create_access_token({"sub": "user-1"}, timedelta(seconds=-10))
+        # As if it had been cached while still valid
+        token_cache[token] = jwt.decode(
+            token, auth.SECRET_KEY, algorithms=[auth.ALGORITHM], options={"verify_exp": False}
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth.decode_access_token(token)
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Token has expired"
+        assert token not in token_cache
+
+    def test_invalid_tokens_not_cached(self, token_cache):
+        """Test that malformed, forged and expired tokens are never cached."""
+        expired = auth.create_access_token({"sub": "user-1"}, timedelta(seconds=-10))
+        forged = jwt.encode({"sub": "user-1"}, "wrong-secret", algorithm=auth.ALGORITHM)
+
+        for token in ("not-a-token", forged, expired):
+            with pytest.raises(HTTPException):
+                auth.decode_access_token(token)
+
+        assert not token_cache
+
+    def test_returned_payload_is_a_copy(self, token_cache):
+        """Test that mutating a returned payload leaves the cached one intact."""
+        token = auth.create_access_token({"sub": "user-1"})
+
+        auth.decode_access_token(token)["sub"] = "attacker"
+        payload = auth.decode_access_token(token)
+        payload["sub"] = "attacker"
+
+        assert auth.decode_access_token(token)["sub"] == "user-1"
+
+    def test_cache_size_capped(self, token_cache, monkeypatch):
+        """Test that the cache holds TOKEN_CACHE_SIZE tokens, evicting the stalest."""
+        monkeypatch.setattr(auth, "TOKEN_CACHE_SIZE", 2)
+        first, second, third = (
+            auth.create_access_token({"sub": f"user-{i}"}) for i in range(3)
+        )
+
+        auth.decode_access_token(first)
+        auth.decode_access_token(second)
+        auth.decode_access_token(first)
+        auth.decode_access_token(third)
+
+        assert list(token_cache) == [first, third]
@@ -3,6 +3,8 @@
 import pytest
 from fastapi import status
 
+from src.api.routes.caching import make_etag
+
 
 class TestSubjectEndpoints:
     """Test suite for subject endpoints."""
@@ -182,3 +184,46 @@ class TestSubjectEndpoints:
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.json(), list)
         assert len(response.json()) == 0
+
+    def test_get_subject_metrics_page_size_limit(self, client, sample_subject_data):
+        """Test that metrics pages are capped at 200 items."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        response = client.get(f"/api/v1/subjects/{subject_id}/metrics?page=2&page_size=200")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+        response = client.get(f"/api/v1/subjects/{subject_id}/metrics?page_size=201")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_get_subject_conditional(self, client, sample_subject_data):
+        """Test ETag revalidation of subject details."""
+        create_response = client.post("/api/v1/subjects", json=sample_subject_data)
+        subject_id = create_response.json()["id"]
+
+        response = client.get(f"/api/v1/subjects/{subject_id}")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = client.get(f"/api/v1/subjects/{subject_id}", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        client.patch(f"/api/v1/subjects/{subject_id}", json={"notes": "Updated"})
+        response = client.get(f"/api/v1/subjects/{subject_id}", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_list_subjects_conditional(self, client, sample_subject_data):
+        """Test the subject list ETag is the hash of the body it was sent with."""
+        client.post("/api/v1/subjects", json=sample_subject_data)
+
+        response = client.get("/api/v1/subjects")
+        etag = response.headers["etag"]
+        assert response.headers["content-type"] == "application/json"
+        assert etag == make_etag(response.content)
+        assert response.json()["total"] >= 1
+
+        response = client.get("/api/v1/subjects", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
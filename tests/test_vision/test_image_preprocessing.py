@@ -90,6 +90,35 @@ class TestImagePreprocessor:
 
         assert resized.shape == (480, 640, 3)
 
+    def test_resize_preserve_aspect_same_size(self, preprocessor, sample_image):
+        """Test resize is a pass-through when input matches target size."""
+        resized = preprocessor.resize_preserve_aspect(sample_image)
+
+        assert np.array_equal(resized, sample_image)
+
+    def test_resize_preserve_aspect_reuses_buffer(self, preprocessor):
+        """Test copy=False reuses one buffer and clears stale padding."""
+        wide_img = np.full((200, 400, 3), 255, dtype=np.uint8)
+        tall_img = np.full((400, 200, 3), 255, dtype=np.uint8)
+
+        first = preprocessor.resize_preserve_aspect(wide_img, copy=False)
+        expected = preprocessor.resize_preserve_aspect(tall_img)
+        second = preprocessor.resize_preserve_aspect(tall_img, copy=False)
+
+        assert second is first
+        assert np.array_equal(second, expected)
+
+    def test_resize_preserve_aspect_pil_fallback(self, preprocessor, monkeypatch):
+        """Test resize falls back to PIL when OpenCV is unavailable."""
+        import anny.vision.image_preprocessing as image_preprocessing
+        monkeypatch.setattr(image_preprocessing, 'CV2_AVAILABLE', False)
+
+        large_img = np.random.randint(0, 255, (960, 1280, 3), dtype=np.uint8)
+        resized = preprocessor.resize_preserve_aspect(large_img)
+
+        assert resized.shape == (480, 640, 3)
+        assert resized.dtype == np.uint8
+
     def test_normalize_image_uint8(self, preprocessor):
         """Test normalization of uint8 image."""
         img = np.array([0, 127, 255], dtype=np.uint8)
@@ -114,6 +143,21 @@ class TestImagePreprocessor:
         assert np.min(normalized) >= 0.0
         assert np.max(normalized) <= 1.0
 
+    def test_normalize_image_out(self, preprocessor):
+        """Test normalization writes into a provided buffer without touching the input."""
+        img = np.array([-0.5, 0.5, 1.5], dtype=np.float32)
+        out = np.empty(3, dtype=np.float32)
+        normalized = preprocessor.normalize_image(img, out=out)
+
+        assert normalized is out
+        assert np.allclose(out, [0.0, 0.5, 1.0])
+        assert np.allclose(img, [-0.5, 0.5, 1.5])
+
+    def test_normalize_image_unsupported_dtype(self, preprocessor):
+        """Test normalization rejects unsupported dtypes."""
+        with pytest.raises(ValueError, match="Unsupported image dtype"):
+            preprocessor.normalize_image(np.array([1, 2, 3], dtype=np.int32))
+
     def test_convert_to_rgb_grayscale(self, preprocessor, sample_grayscale):
         """Test conversion from grayscale to RGB."""
         rgb = preprocessor.convert_to_rgb(sample_grayscale)
@@ -122,6 +166,14 @@ class TestImagePreprocessor:
         assert np.array_equal(rgb[:, :, 0], rgb[:, :, 1])
         assert np.array_equal(rgb[:, :, 1], rgb[:, :, 2])
 
+    def test_preprocess_grayscale(self, preprocessor, sample_grayscale):
+        """Test preprocessing a grayscale image through the broadcast RGB view."""
+        processed, _ = preprocessor.preprocess(sample_grayscale)
+
+        assert processed.shape == (480, 640, 3)
+        assert np.allclose(processed[:, :, 0], sample_grayscale / 255.0)
+        assert np.array_equal(processed[:, :, 0], processed[:, :, 2])
+
     def test_convert_to_rgb_rgba(self, preprocessor):
         """Test conversion from RGBA to RGB."""
         rgba = np.random.randint(0, 255, (480, 640, 4), dtype=np.uint8)
@@ -161,6 +213,27 @@ class TestImagePreprocessor:
         assert isinstance(processed, np.ndarray)
         assert processed.shape == (480, 640, 3)
 
+    def test_preprocess_target_size_fast_path(self, preprocessor, sample_image):
+        """Test frames already at target size are only normalized."""
+        processed, metadata = preprocessor.preprocess(sample_image)
+
+        assert metadata['scale_factor'] == 1.0
+        assert metadata['padding'] == {'top': 0, 'left': 0}
+        assert np.allclose(processed, sample_image / 255.0)
+
+    def test_preprocess_bytes(self, preprocessor, sample_image):
+        """Test preprocessing raw pixel bytes with an expected shape."""
+        processed, metadata = preprocessor.preprocess(
+            sample_image.tobytes(), expected_shape=sample_image.shape
+        )
+        expected, _ = preprocessor.preprocess(sample_image)
+
+        assert metadata['original_shape'] == sample_image.shape
+        assert np.array_equal(processed, expected)
+
+        with pytest.raises(ValueError, match="expected_shape"):
+            preprocessor.preprocess(sample_image.tobytes())
+
     def test_preprocess_with_validation_failure(self, preprocessor):
         """Test preprocessing with validation failure."""
         invalid_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
@@ -186,6 +259,19 @@ class TestImagePreprocessor:
         assert 'padding' in metadata
         assert metadata['preprocessed_shape'] == processed.shape
 
+    def test_preprocess_pads_and_normalizes(self, preprocessor):
+        """Test preprocess centers the normalized image in a zero-padded buffer."""
+        img = np.full((480, 320, 3), 255, dtype=np.uint8)
+        processed, metadata = preprocessor.preprocess(img)
+
+        left = metadata['padding']['left']
+        assert metadata['scale_factor'] == 1.0
+        assert left == 160
+        assert processed.dtype == np.float32
+        assert np.all(processed[:, :left] == 0.0)
+        assert np.all(processed[:, left + 320:] == 0.0)
+        assert np.allclose(processed[:, left:left + 320], 1.0)
+
     def test_preprocess_batch(self, preprocessor):
         """Test batch preprocessing."""
         images = [
@@ -215,6 +301,18 @@ class TestImagePreprocessor:
         assert processed[2] is not None
         assert 'error' in metadata_list[1]
 
+    def test_preprocess_batch_parallel(self, preprocessor):
+        """Test threaded batch preprocessing matches sequential results."""
+        images = [
+            np.random.randint(0, 255, (360, 480, 3), dtype=np.uint8)
+            for _ in range(6)
+        ]
+
+        parallel, _ = preprocessor.preprocess_batch(images, num_workers=3)
+        sequential, _ = preprocessor.preprocess_batch(images, num_workers=1)
+
+        assert all(np.array_equal(p, s) for p, s in zip(parallel, sequential))
+
     def test_to_tensor(self, preprocessor):
         """Test conversion to PyTorch tensor."""
         img = np.random.rand(480, 640, 3).astype(np.float32)
@@ -240,3 +338,40 @@ class TestImagePreprocessor:
 
         assert processed.dtype == np.uint8
         assert processed.max() > 1.0  # Not normalized
+
+    def test_output_dtype_uint8(self):
+        """Test uint8 output mode keeps pixels as uint8, including float input."""
+        preprocessor = ImagePreprocessor(output_dtype='uint8')
+        img = np.full((480, 640, 3), 0.5, dtype=np.float32)
+
+        processed, _ = preprocessor.preprocess(img)
+
+        assert processed.dtype == np.uint8
+        assert processed[240, 320, 0] == 127
+
+    def test_output_dtype_invalid(self):
+        """Test unsupported output dtype is rejected."""
+        with pytest.raises(ValueError):
+            ImagePreprocessor(output_dtype='float16')
+
+    def test_preprocess_tensor_cpu(self, preprocessor, sample_image):
+        """Test tensor preprocessing on CPU matches preprocess + to_tensor."""
+        tensor, metadata = preprocessor.preprocess_tensor(sample_image)
+
+        expected, _ = preprocessor.preprocess(sample_image)
+        assert tensor.shape == (3, 480, 640)
+        assert torch.allclose(tensor, preprocessor.to_tensor(expected))
+        assert metadata['preprocessed_shape'] == (480, 640, 3)
+
+    def test_preprocess_on_device_pads_and_normalizes(self, preprocessor):
+        """Test the torch preprocessing path pads and normalizes like the numpy path."""
+        img = np.full((240, 640, 3), 255, dtype=np.uint8)
+        rgb, metadata = preprocessor._prepare(img, validate=True)
+
+        tensor, metadata = preprocessor._preprocess_on_device(rgb, metadata)
+        expected, expected_metadata = preprocessor.preprocess(img)
+
+        assert tensor.shape == (3, 480, 640)
+        assert tensor.dtype == torch.float32
+        assert metadata['padding'] == expected_metadata['padding']
+        assert torch.allclose(tensor, preprocessor.to_tensor(expected))
@@ -60,6 +60,12 @@ class TestLandmarkDetector:
         assert 'left_shoulder' in LandmarkDetector.LANDMARK_NAMES
         assert 'right_hip' in LandmarkDetector.LANDMARK_NAMES
 
+    def test_landmark_index(self):
+        """Test name-to-index lookup table matches landmark names."""
+        assert len(LandmarkDetector.LANDMARK_INDEX) == 33
+        for i, name in enumerate(LandmarkDetector.LANDMARK_NAMES):
+            assert LandmarkDetector.LANDMARK_INDEX[name] == i
+
     def test_detect_success(self, mock_mediapipe):
         """Test successful landmark detection."""
         mock_mp, mock_pose_class = mock_mediapipe
@@ -94,6 +100,10 @@ class TestLandmarkDetector:
         assert result.visibility.shape == (33,)
         assert result.overall_confidence > 0
         assert result.image_shape == (480, 640)
+        # Arrays are views into the packed per-landmark buffer
+        assert result.packed.shape == (33,)
+        assert np.shares_memory(result.landmarks, result.packed)
+        assert result.landmarks[10] == pytest.approx([0.1, 0.2, 0.01])
 
     def test_detect_no_landmarks(self, mock_mediapipe):
         """Test detection with no landmarks found."""
@@ -133,6 +143,12 @@ class TestLandmarkDetector:
         assert result is not None
         # Verify conversion to uint8 happened
         mock_pose_instance.process.assert_called_once()
+        passed = mock_pose_instance.process.call_args[0][0]
+        assert passed.dtype == np.uint8
+
+        # Subsequent frames of the same shape reuse the conversion buffer
+        detector.detect(image)
+        assert mock_pose_instance.process.call_args[0][0] is passed
 
     def test_detect_without_world_landmarks(self, mock_mediapipe):
         """Test detection without world landmarks."""
@@ -196,13 +212,74 @@ class TestLandmarkDetector:
 
         detector = LandmarkDetector()
         images = [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(3)]
-        results = detector.detect_batch(images, skip_failed=True)
+        # Single worker so the mock's call order matches image order
+        results = detector.detect_batch(images, skip_failed=True, num_workers=1)
 
         assert len(results) == 3
         assert results[0] is not None
         assert results[1] is None  # Failed
         assert results[2] is not None
 
+    def test_detect_batch_parallel(self, mock_mediapipe):
+        """Test parallel batch detection preserves order and raises on failure."""
+        _, mock_pose_class = mock_mediapipe
+
+        def side_effect(image):
+            if image[0, 0, 0] == 0:
+                raise RuntimeError("Detection failed")
+            mock_results = MagicMock()
+            mock_results.pose_landmarks.landmark = [
+                MagicMock(x=image[0, 0, 0] / 255, y=0.5, z=0.0, visibility=0.9)
+                for _ in range(33)
+            ]
+            mock_results.pose_world_landmarks = None
+            return mock_results
+
+        mock_pose_instance = MagicMock()
+        mock_pose_instance.process.side_effect = side_effect
+        mock_pose_class.return_value = mock_pose_instance
+
+        detector = LandmarkDetector()
+        images = [np.full((48, 64, 3), value, dtype=np.uint8) for value in (51, 0, 102, 153)]
+        results = detector.detect_batch(images, num_workers=4)
+
+        assert results[1] is None
+        assert [r.landmarks[0, 0] for r in (results[0], results[2], results[3])] == \
+            pytest.approx([0.2, 0.4, 0.6])
+
+        with pytest.raises(RuntimeError, match="Landmark detection failed"):
+            detector.detect_batch(images, skip_failed=False, num_workers=4)
+
+    def test_detect_batch_parallel_workers(self, mock_mediapipe):
+        """Test process-pool worker helpers and the sequential fallback."""
+        from anny.vision import landmark_detector
+
+        _, mock_pose_class = mock_mediapipe
+
+        mock_results = MagicMock()
+        mock_results.pose_landmarks.landmark = [
+            MagicMock(x=0.1, y=0.2, z=0.0, visibility=0.9) for _ in range(33)
+        ]
+        mock_results.pose_world_landmarks = None
+        mock_pose_instance = MagicMock()
+        mock_pose_instance.process.return_value = mock_results
+        mock_pose_class.return_value = mock_pose_instance
+
+        detector = LandmarkDetector(model_complexity=2)
+        image = np.zeros((48, 64, 3), dtype=np.uint8)
+
+        # Worker builds its own Pose from the detector's settings
+        landmark_detector._worker_init(detector._pose_kwargs())
+        assert mock_pose_class.call_args[1]['model_complexity'] == 2
+        packed, world_landmarks, image_shape = landmark_detector._worker_detect(image, True)
+        assert packed.shape == (33,)
+        assert world_landmarks is None
+        assert image_shape == (48, 64)
+
+        results = detector.detect_batch_parallel([image, image], num_workers=1)
+        assert len(results) == 2
+        assert results[0].landmarks[0] == pytest.approx([0.1, 0.2, 0.0])
+
     def test_get_landmark_by_name(self, mock_mediapipe):
         """Test getting landmark by name."""
         _, mock_pose_class = mock_mediapipe
@@ -258,6 +335,25 @@ class TestLandmarkDetector:
         assert not np.isnan(filtered.landmarks[0]).any()  # High confidence
         assert not np.isnan(filtered.landmarks[2]).any()  # High confidence
 
+    def test_filter_low_confidence_mask(self, mock_mediapipe):
+        """Test confidence mask marks landmarks meeting the threshold."""
+        result = LandmarkResult(
+            landmarks=np.ones((4, 3), dtype=np.float32),
+            confidence=np.array([0.9, 0.3, 0.5, 0.2], dtype=np.float32),
+            visibility=np.ones(4, dtype=np.float32),
+            overall_confidence=0.7,
+            image_shape=(480, 640)
+        )
+
+        detector = LandmarkDetector()
+        mask = detector.filter_low_confidence_mask(result, min_confidence=0.5)
+        filtered = detector.filter_low_confidence(result, min_confidence=0.5)
+
+        assert mask.tolist() == [True, False, True, False]
+        assert filtered.landmarks.dtype == np.float32
+        assert np.isnan(filtered.landmarks[~mask]).all()
+        assert not np.isnan(result.landmarks).any()  # Input untouched
+
     def test_to_pixel_coordinates(self):
         """Test conversion to pixel coordinates."""
         result = LandmarkResult(
@@ -5,7 +5,9 @@
 import pytest
 import numpy as np
 from anny.vision.landmark_detector import LandmarkResult
-from anny.vision.measurement_extractor import MeasurementExtractor, BodyMeasurements
+from anny.vision.measurement_extractor import (
+    MeasurementExtractor, BodyMeasurements, BodyMeasurementsBatch
+)
 
 
 class TestMeasurementExtractor:
@@ -200,6 +202,177 @@ class TestMeasurementExtractor:
         assert measurements.torso_length is not None
         assert measurements.overall_confidence > 0
 
+    def test_extract_all_batch(self, extractor, mock_landmark_result):
+        """Test batch extraction matches per-result extraction."""
+        confidence = mock_landmark_result.confidence.copy()
+        confidence[[15, 29, 30]] = 0.3  # left wrist and both heels
+        partial = LandmarkResult(
+            landmarks=mock_landmark_result.landmarks,
+            confidence=confidence,
+            visibility=mock_landmark_result.visibility,
+            overall_confidence=0.8,
+            image_shape=(480, 640)
+        )
+        results = [mock_landmark_result, partial, mock_landmark_result]
+
+        measurements = extractor.extract_all_batch(results)
+
+        assert len(measurements) == 3
+        assert measurements[1].left_arm_length is None
+        for batched, result in zip(measurements, results):
+            expected = extractor.extract_all(result)
+            assert batched.height == pytest.approx(expected.height)
+            assert batched.shoulder_width == pytest.approx(expected.shoulder_width)
+            assert batched.confidence_scores == pytest.approx(expected.confidence_scores)
+            assert batched.overall_confidence == pytest.approx(expected.overall_confidence)
+        assert extractor.extract_all_batch([]) == []
+
+    def test_extract_batch_arrays(self, extractor, mock_landmark_result):
+        """Test struct-of-arrays batch output and its row/column accessors."""
+        confidence = mock_landmark_result.confidence.copy()
+        confidence[15] = 0.3  # left wrist
+        partial = LandmarkResult(
+            landmarks=mock_landmark_result.landmarks,
+            confidence=confidence,
+            visibility=mock_landmark_result.visibility,
+            overall_confidence=0.8,
+            image_shape=(480, 640),
+            world_landmarks=mock_landmark_result.world_landmarks
+        )
+
+        batch = extractor.extract_batch([mock_landmark_result, partial])
+        expected = extractor.extract_all(mock_landmark_result)
+
+        assert isinstance(batch, BodyMeasurementsBatch)
+        assert len(batch) == 2
+        assert batch.values.shape == (2, len(BodyMeasurementsBatch.FIELDS))
+        assert batch.values.dtype == np.float32
+        assert batch.column('height') == pytest.approx([expected.height] * 2)
+        assert np.isnan(batch.column('left_arm_length')[1])
+        assert batch[1].left_arm_length is None
+        assert batch[0].confidence_scores == pytest.approx(expected.confidence_scores)
+
+        exported = batch.to_dict()
+        assert exported['measurements']['shoulder_width'].shape == (2,)
+        assert exported['overall_confidence'] == pytest.approx(batch.overall_confidence)
+
+    def test_extract_all_parallel(self, extractor, mock_landmark_result):
+        """Test process-pool extraction preserves order and matches batch extraction."""
+        results = []
+        for scale in (1.0, 1.5, 2.0, 2.5, 3.0):
+            results.append(LandmarkResult(
+                landmarks=mock_landmark_result.landmarks * scale,
+                confidence=mock_landmark_result.confidence,
+                visibility=mock_landmark_result.visibility,
+                overall_confidence=0.9,
+                image_shape=(480, 640),
+                world_landmarks=mock_landmark_result.world_landmarks * scale
+            ))
+
+        measurements = extractor.extract_all_parallel(results, num_workers=2)
+        expected = extractor.extract_all_batch(results)
+
+        assert [m.height for m in measurements] == pytest.approx([m.height for m in expected])
+
+    def test_segment_stats_kernels_agree(self, mock_landmark_result):
+        """Test the scalar-loop (numba) kernel matches the numpy kernel."""
+        from anny.vision import measurement_extractor as me
+
+        confidence = mock_landmark_result.confidence.copy()
+        confidence[15] = 0.1  # invalidates the left arm
+        args = (
+            mock_landmark_result.world_landmarks, confidence, confidence >= 0.5,
+            me._IDX_A, me._IDX_B, me._GROUP_OFFSETS, me._GROUP_CONF_WEIGHTS
+        )
+
+        expected = me._segment_stats_numpy(*args)
+        for kernel in (me._segment_stats_loop, me._segment_stats):
+            lengths, valid, conf = kernel(*args)
+            assert np.allclose(lengths, expected[0], atol=1e-5)
+            assert np.array_equal(valid, expected[1])
+            assert np.allclose(conf, expected[2])
+        assert not expected[1][me._GROUP['left_arm_length']]
+
+    def test_height_stats_kernels_agree(self, mock_landmark_result):
+        """Test the scalar-loop (numba) height kernel matches the numpy kernel."""
+        from anny.vision import measurement_extractor as me
+
+        landmarks = mock_landmark_result.world_landmarks.copy()
+        confidence = mock_landmark_result.confidence.copy()
+        confidence[29] = 0.1  # left heel unusable
+        landmarks[29] = np.nan
+        tables = (me._HEIGHT_FOOT_IDX, me._HEIGHT_SCALE, me._HEIGHT_CONF_SCALE)
+
+        for valid in (confidence >= 0.5, np.zeros(33, dtype=bool)):
+            expected = me._height_stats_numpy(landmarks, confidence, valid, 2, *tables)
+            for kernel in (me._height_stats_loop, me._height_stats):
+                height, conf, height_valid = kernel(landmarks, confidence, valid, 2, *tables)
+                assert height_valid == expected[2]
+                assert height == pytest.approx(expected[0], abs=1e-5)
+                assert conf == pytest.approx(expected[1], abs=1e-5)
+
+    def test_extract_all_tensor_input(self, extractor, mock_landmark_result):
+        """Test tensor landmarks take the torch path and match the numpy path."""
+        import torch
+
+        tensor_result = LandmarkResult(
+            landmarks=torch.from_numpy(mock_landmark_result.landmarks),
+            confidence=torch.from_numpy(mock_landmark_result.confidence),
+            visibility=torch.from_numpy(mock_landmark_result.visibility),
+            overall_confidence=0.9,
+            image_shape=(480, 640),
+            world_landmarks=torch.from_numpy(mock_landmark_result.world_landmarks)
+        )
+
+        measurements = extractor.extract_all(tensor_result)
+        expected = extractor.extract_all(mock_landmark_result)
+
+        assert isinstance(measurements.height, float)
+        assert measurements.height == pytest.approx(expected.height)
+        assert measurements.torso_length == pytest.approx(expected.torso_length)
+        assert measurements.overall_confidence == pytest.approx(expected.overall_confidence)
+
+    def test_extract_height_tensor_input(self, extractor, mock_landmark_result):
+        """Test tensor landmarks give the same height as numpy landmarks."""
+        import torch
+
+        tensor_result = LandmarkResult(
+            landmarks=torch.from_numpy(mock_landmark_result.landmarks),
+            confidence=torch.from_numpy(mock_landmark_result.confidence),
+            visibility=torch.from_numpy(mock_landmark_result.visibility),
+            overall_confidence=0.9,
+            image_shape=(480, 640),
+            world_landmarks=torch.from_numpy(mock_landmark_result.world_landmarks)
+        )
+
+        height, confidence = extractor.extract_height(tensor_result)
+        expected_height, expected_confidence = extractor.extract_height(mock_landmark_result)
+
+        assert isinstance(height, float)
+        assert height == pytest.approx(expected_height)
+        assert confidence == pytest.approx(expected_confidence)
+
+    def test_height_kernel_never_sees_tensors(self, extractor, mock_landmark_result, monkeypatch):
+        """Test the compiled height kernel is only called with numpy arrays."""
+        import torch
+        from anny.vision import measurement_extractor as me
+
+        calls = []
+
+        def height_stats(coords, *args):
+            calls.append(type(coords))
+            return me._height_stats_numpy(coords, *args)
+
+        monkeypatch.setattr(me, "_height_stats", height_stats)
+        coords = torch.from_numpy(mock_landmark_result.world_landmarks)
+        confidence = torch.from_numpy(mock_landmark_result.confidence)
+
+        height, _ = extractor._extract_height(coords, confidence, confidence >= 0.5, True)
+        extractor.extract_height(mock_landmark_result)
+
+        assert isinstance(height, float)
+        assert calls == [np.ndarray]
+
     def test_extract_all_with_missing_landmarks(self, extractor):
         """Test extraction with some missing landmarks."""
         # Set some landmarks to low confidence
@@ -234,6 +407,46 @@ class TestMeasurementExtractor:
         assert 'shoulder_width' in result_dict['measurements']
         assert result_dict['overall_confidence'] > 0
 
+    def test_to_dict_cached(self, extractor, mock_landmark_result):
+        """Test that to_dict is memoized on immutable measurements."""
+        measurements = extractor.extract_all(mock_landmark_result)
+        result_dict = extractor.to_dict(measurements)
+
+        assert extractor.to_dict(measurements) is result_dict
+        assert result_dict['measurements']['height'] == measurements.height
+        assert measurements == extractor.extract_all(mock_landmark_result)
+
+        with pytest.raises(AttributeError):
+            measurements.height = 2.0
+        assert not hasattr(measurements, '__dict__')
+
+    def test_vector_round_trip(self):
+        """Test to_vector/confidence_vector and from_vector are inverses."""
+        measurements = BodyMeasurements(
+            height=1.75,
+            shoulder_width=0.4,
+            torso_length=0.5,
+            confidence_scores={'height': 0.9, 'shoulder_width': 0.8},
+            overall_confidence=0.85
+        )
+
+        values = measurements.to_vector()
+        confidences = measurements.confidence_vector()
+
+        assert values.shape == (len(BodyMeasurementsBatch.FIELDS),)
+        assert values[0] == 1.75
+        assert np.isnan(values[2])
+        assert confidences[0] == 0.9
+        assert confidences[2] == 0.0
+
+        rebuilt = BodyMeasurements.from_vector(values, confidences, 0.85)
+        assert rebuilt.height == 1.75
+        assert rebuilt.waist_circumference is None
+        assert rebuilt.torso_length == 0.5
+        assert rebuilt.confidence_scores['shoulder_width'] == 0.8
+        assert rebuilt.overall_confidence == 0.85
+        assert BodyMeasurements.from_vector(values).confidence_scores is None
+
     def test_without_world_landmarks(self):
         """Test extraction without world landmarks."""
         extractor = MeasurementExtractor(use_world_landmarks=False)
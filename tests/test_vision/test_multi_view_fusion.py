@@ -27,31 +27,31 @@ class TestMultiViewFusion:
         measurements = []
 
         for i in range(3):
-            m = BodyMeasurements()
-            m.height = 1.75 + i * 0.02  # Slight variation
-            m.shoulder_width = 0.45 + i * 0.01
-            m.waist_circumference = 0.85 + i * 0.02
-            m.hip_circumference = 0.95 + i * 0.01
-            m.chest_circumference = 1.0 + i * 0.015
-            m.left_arm_length = 0.70 + i * 0.01
-            m.right_arm_length = 0.70 + i * 0.01
-            m.left_leg_length = 0.90 + i * 0.015
-            m.right_leg_length = 0.90 + i * 0.015
-            m.torso_length = 0.60 + i * 0.01
-
-            m.confidence_scores = {
-                'height': 0.9,
-                'shoulder_width': 0.85,
-                'waist_circumference': 0.7,
-                'hip_circumference': 0.75,
-                'chest_circumference': 0.8,
-                'left_arm_length': 0.85,
-                'right_arm_length': 0.85,
-                'left_leg_length': 0.9,
-                'right_leg_length': 0.9,
-                'torso_length': 0.8
-            }
-            m.overall_confidence = 0.85
+            m = BodyMeasurements(
+                height=1.75 + i * 0.02,  # Slight variation
+                shoulder_width=0.45 + i * 0.01,
+                waist_circumference=0.85 + i * 0.02,
+                hip_circumference=0.95 + i * 0.01,
+                chest_circumference=1.0 + i * 0.015,
+                left_arm_length=0.70 + i * 0.01,
+                right_arm_length=0.70 + i * 0.01,
+                left_leg_length=0.90 + i * 0.015,
+                right_leg_length=0.90 + i * 0.015,
+                torso_length=0.60 + i * 0.01,
+                confidence_scores={
+                    'height': 0.9,
+                    'shoulder_width': 0.85,
+                    'waist_circumference': 0.7,
+                    'hip_circumference': 0.75,
+                    'chest_circumference': 0.8,
+                    'left_arm_length': 0.85,
+                    'right_arm_length': 0.85,
+                    'left_leg_length': 0.9,
+                    'right_leg_length': 0.9,
+                    'torso_length': 0.8
+                },
+                overall_confidence=0.85
+            )
 
             measurements.append(m)
 
@@ -173,6 +173,28 @@ class TestMultiViewFusion:
         assert np.array_equal(filtered_values, values)
         assert np.array_equal(filtered_conf, confidences)
 
+    def test_reject_outliers_kernels_agree(self):
+        """Test the scalar-loop (numba) outlier kernel matches the numpy kernel."""
+        from anny.vision import multi_view_fusion as mvf
+
+        values = np.array([
+            [1.0, 1.1, 1.05, 5.0, np.nan],
+            [1.0, 1.0, 1.0, 1.0, 2.0],  # zero MAD: falls back to std
+            [1.0, 1.0, 1.0, 1.0, 1.0],  # zero spread: nothing rejected
+            [1.0, np.nan, np.nan, 9.0, np.nan],  # too few values
+        ])
+        confidences = np.full(values.shape, 0.9)
+
+        expected = mvf._reject_outliers_numpy(values, confidences, 2.0)
+        for kernel in (mvf._reject_outliers_loop, mvf._reject_outliers_kernel):
+            filtered_values, filtered_conf = kernel(values, confidences, 2.0)
+            assert np.array_equal(filtered_values, expected[0], equal_nan=True)
+            assert np.array_equal(filtered_conf, expected[1])
+        assert np.isnan(expected[0][0, 3])
+        assert np.isnan(expected[0][1, 4])
+        assert np.array_equal(expected[0][1, :4], values[1, :4])
+        assert np.array_equal(expected[0][2:], values[2:], equal_nan=True)
+
     def test_fuse_single_measurement(self, fusion):
         """Test fusing a single measurement type."""
         values = [1.75, 1.77, 1.73]
@@ -185,6 +207,33 @@ class TestMultiViewFusion:
         assert fused_conf > 0
         assert variance >= 0
 
+    def test_fuse_arrays_matches_single_measurement(self):
+        """Test that fusing a (fields, views) matrix matches fusing each field alone."""
+        values = np.array([
+            [1.75, 1.77, 1.73, 2.5],
+            [0.45, np.nan, 0.46, 0.44],
+            [np.nan, np.nan, np.nan, np.nan],
+        ])
+        confidences = np.array([
+            [0.9, 0.85, 0.88, 0.9],
+            [0.8, 0.0, 0.7, 0.75],
+            [0.0, 0.0, 0.0, 0.0],
+        ])
+
+        for method in ['weighted_average', 'median', 'max_confidence', 'adaptive']:
+            fusion = MultiViewFusion(fusion_method=method)
+            fused_values, fused_confs, variances = fusion._fuse_arrays(values, confidences)
+
+            for i in range(len(values)):
+                row = [None if np.isnan(v) else v for v in values[i]]
+                expected = fusion._fuse_single_measurement(row, list(confidences[i]))
+                if expected[0] is None:
+                    assert np.isnan(fused_values[i])
+                else:
+                    assert fused_values[i] == pytest.approx(expected[0])
+                assert fused_confs[i] == pytest.approx(expected[1])
+                assert variances[i] == pytest.approx(expected[2])
+
     def test_fuse_measurements(self, fusion, sample_measurements):
         """Test fusing complete measurements from multiple views."""
         fused = fusion.fuse_measurements(sample_measurements)
@@ -210,14 +259,15 @@ class TestMultiViewFusion:
         measurements = []
 
         for i in range(3):
-            m = BodyMeasurements()
-            m.height = 1.75 if i != 1 else None  # Missing height in second view
-            m.shoulder_width = 0.45
-            m.confidence_scores = {
-                'height': 0.9 if i != 1 else 0.0,
-                'shoulder_width': 0.85
-            }
-            m.overall_confidence = 0.85
+            m = BodyMeasurements(
+                height=1.75 if i != 1 else None,  # Missing height in second view
+                shoulder_width=0.45,
+                confidence_scores={
+                    'height': 0.9 if i != 1 else 0.0,
+                    'shoulder_width': 0.85
+                },
+                overall_confidence=0.85
+            )
             measurements.append(m)
 
         fused = fusion.fuse_measurements(measurements)
@@ -239,6 +289,8 @@ class TestMultiViewFusion:
         assert 'variance' in stats['height']
         assert 'std_dev' in stats['height']
         assert 'cv' in stats['height']  # Coefficient of variation
+        assert 'overall_confidence' not in stats
+        assert stats['height']['std_dev'] == pytest.approx(np.sqrt(stats['height']['variance']))
 
     def test_different_fusion_methods(self, sample_measurements):
         """Test all fusion methods produce valid results."""
@@ -255,11 +307,12 @@ class TestMultiViewFusion:
     def test_outlier_rejection_enabled_vs_disabled(self, sample_measurements):
         """Test difference between outlier rejection enabled/disabled."""
         # Add outlier to measurements
-        outlier = BodyMeasurements()
-        outlier.height = 3.0  # Unrealistic height
-        outlier.shoulder_width = 0.45
-        outlier.confidence_scores = {'height': 0.9, 'shoulder_width': 0.9}
-        outlier.overall_confidence = 0.9
+        outlier = BodyMeasurements(
+            height=3.0,  # Unrealistic height
+            shoulder_width=0.45,
+            confidence_scores={'height': 0.9, 'shoulder_width': 0.9},
+            overall_confidence=0.9
+        )
 
         measurements_with_outlier = sample_measurements + [outlier]
 
@@ -294,14 +347,46 @@ class TestMultiViewFusion:
 
     def test_single_view_fusion(self, fusion):
         """Test fusion with single view (should work like identity function)."""
-        m = BodyMeasurements()
-        m.height = 1.75
-        m.shoulder_width = 0.45
-        m.confidence_scores = {'height': 0.9, 'shoulder_width': 0.85}
-        m.overall_confidence = 0.875
+        m = BodyMeasurements(
+            height=1.75,
+            shoulder_width=0.45,
+            confidence_scores={'height': 0.9, 'shoulder_width': 0.85},
+            overall_confidence=0.875
+        )
 
         fused = fusion.fuse_measurements([m])
 
         assert fused.measurements.height == 1.75
         assert fused.measurements.shoulder_width == 0.45
         assert fused.num_views == 1
+
+    @pytest.mark.parametrize('method', ['weighted_average', 'median', 'max_confidence', 'adaptive'])
+    def test_single_view_matches_general_path(self, method):
+        """Test the single-view fast path agrees with fusing duplicated views."""
+        fusion = MultiViewFusion(fusion_method=method)
+        m = BodyMeasurements(
+            height=1.75,
+            shoulder_width=0.45,
+            waist_circumference=0.8,  # zero confidence: dropped
+            hip_circumference=0.95,  # no confidence score: dropped
+            confidence_scores={'height': 0.9, 'shoulder_width': 0.85, 'waist_circumference': 0.0},
+            overall_confidence=0.875
+        )
+
+        single = fusion.fuse_measurements([m])
+        general = fusion.fuse_measurements([m, m])
+
+        assert single.measurements.waist_circumference is None
+        assert single.measurements.hip_circumference is None
+        for field in ('height', 'shoulder_width', 'waist_circumference', 'hip_circumference'):
+            assert getattr(single.measurements, field) == pytest.approx(
+                getattr(general.measurements, field)
+            )
+        assert single.measurements.confidence_scores == pytest.approx(
+            general.measurements.confidence_scores
+        )
+        assert single.measurements.overall_confidence == pytest.approx(
+            general.measurements.overall_confidence
+        )
+        assert single.measurement_variance == pytest.approx(general.measurement_variance)
+        assert single.view_confidences == [0.875]